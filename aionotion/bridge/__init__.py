@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
 from aionotion.bridge.models import (
@@ -9,6 +10,11 @@ from aionotion.bridge.models import (
     BridgeAllResponse,
     BridgeGetResponse,
 )
+from aionotion.util.batch import (
+    DEFAULT_BATCH_CONCURRENCY,
+    BatchErrorT,
+    async_gather_bounded,
+)
 
 if TYPE_CHECKING:
     from aionotion.client import Client
@@ -56,3 +62,26 @@ class Bridge:
             "get", f"/base_stations/{bridge_id}", BridgeGetResponse
         )
         return response.base_stations
+
+    async def async_get_many(
+        self,
+        bridge_ids: Iterable[int],
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[BridgeModel | BatchErrorT]:
+        """Get multiple bridges by ID, with bounded concurrency.
+
+        Args:
+        ----
+            bridge_ids: The IDs of the bridges to get.
+            concurrency: The maximum number of requests that may be in flight at once.
+
+        Returns:
+        -------
+            A list of bridges (in the same order as the IDs); a bridge that couldn't be
+            retrieved is represented by the error that occurred.
+
+        """
+        return await async_gather_bounded(
+            self.async_get, bridge_ids, concurrency=concurrency
+        )
@@ -6,11 +6,12 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 import ciso8601
-from mashumaro import DataClassDictMixin
 
+from aionotion.model import NotionBaseModel
 
-@dataclass(frozen=True, kw_only=True)
-class FirmwareVersion(DataClassDictMixin):
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class FirmwareVersion(NotionBaseModel):
     """Define firmware version info."""
 
     wifi: str
@@ -19,8 +20,8 @@ class FirmwareVersion(DataClassDictMixin):
     ti: str | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
-class Bridge(DataClassDictMixin):
+@dataclass(frozen=True, kw_only=True, slots=True)
+class Bridge(NotionBaseModel):
     """Define a bridge."""
 
     id: int
@@ -40,14 +41,14 @@ class Bridge(DataClassDictMixin):
 
 
 @dataclass(frozen=True, kw_only=True)
-class BridgeAllResponse(DataClassDictMixin):
+class BridgeAllResponse(NotionBaseModel):
     """Define an API response containing all bridges."""
 
     base_stations: list[Bridge]
 
 
 @dataclass(frozen=True, kw_only=True)
-class BridgeGetResponse(DataClassDictMixin):
+class BridgeGetResponse(NotionBaseModel):
     """Define an API response containing a single bridge."""
 
     base_stations: Bridge
@@ -0,0 +1,136 @@
+"""Define a response cache for rarely-changing endpoints."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Mapping
+from enum import StrEnum
+import time
+
+from mashumaro import DataClassDictMixin
+
+DEFAULT_CACHE_MAX_SIZE = 128
+
+
+class CachedEndpoint(StrEnum):
+    """Define the endpoints whose responses may be cached."""
+
+    LISTENER_DEFINITIONS = "listener_definitions"
+    SYSTEMS = "systems"
+    USER_INFO = "user_info"
+    USER_PREFERENCES = "user_preferences"
+
+
+class ResponseCache:
+    """Define a size-bounded, per-endpoint TTL cache of validated responses.
+
+    Caching is opt-in: only endpoints that are given a TTL are cached. Cached responses
+    are shared by every caller that gets a hit, so they shouldn't be mutated.
+    """
+
+    def __init__(
+        self,
+        ttls: Mapping[CachedEndpoint, float] | None = None,
+        *,
+        max_size: int = DEFAULT_CACHE_MAX_SIZE,
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            ttls: A mapping of endpoints to the number of seconds their responses
+                remain valid for.
+            max_size: The maximum number of responses to hold at once; the least
+                recently used response is evicted beyond that.
+
+        """
+        self._entries: OrderedDict[
+            tuple[CachedEndpoint, str], tuple[float, DataClassDictMixin]
+        ] = OrderedDict()
+        self._max_size = max_size
+        self._ttls = dict(ttls or {})
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached responses.
+
+        Returns
+        -------
+            The number of cached responses.
+
+        """
+        return len(self._entries)
+
+    def is_enabled(self, endpoint: CachedEndpoint) -> bool:
+        """Return whether responses from an endpoint are cached.
+
+        Args:
+        ----
+            endpoint: The endpoint to check.
+
+        Returns:
+        -------
+            Whether the endpoint's responses are cached.
+
+        """
+        return endpoint in self._ttls
+
+    def get(self, endpoint: CachedEndpoint, key: str) -> DataClassDictMixin | None:
+        """Return a cached response (if it exists and hasn't expired).
+
+        Args:
+        ----
+            endpoint: The endpoint the response came from.
+            key: The specific request (e.g., the request path) the response is for.
+
+        Returns:
+        -------
+            The cached response (or None upon a miss).
+
+        """
+        entry = self._entries.get((endpoint, key))
+        if entry is None or time.monotonic() >= entry[0]:
+            self._entries.pop((endpoint, key), None)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end((endpoint, key))
+        self.hits += 1
+        return entry[1]
+
+    def set(
+        self, endpoint: CachedEndpoint, key: str, response: DataClassDictMixin
+    ) -> None:
+        """Cache a response.
+
+        Args:
+        ----
+            endpoint: The endpoint the response came from.
+            key: The specific request (e.g., the request path) the response is for.
+            response: The response to cache.
+
+        """
+        if (ttl := self._ttls.get(endpoint)) is None:
+            return
+
+        self._entries[(endpoint, key)] = (time.monotonic() + ttl, response)
+        self._entries.move_to_end((endpoint, key))
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, endpoint: CachedEndpoint | None = None) -> None:
+        """Invalidate cached responses.
+
+        Args:
+        ----
+            endpoint: The endpoint whose responses should be invalidated; if not
+                provided, all cached responses are invalidated.
+
+        """
+        if endpoint is None:
+            self._entries.clear()
+            return
+
+        for cache_key in [key for key in self._entries if key[0] == endpoint]:
+            del self._entries[cache_key]
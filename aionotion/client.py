@@ -3,13 +3,27 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
-from datetime import datetime
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Mapping
+from contextlib import AsyncExitStack, asynccontextmanager, contextmanager, nullcontext
+import dataclasses
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import cached_property
 from http import HTTPStatus
-from typing import Any, TypeVar, cast
+import logging
+import random
+import time
+from typing import TYPE_CHECKING, Any, Self, TypeVar, cast
 from uuid import uuid4
 
-from aiohttp import ClientSession, ClientTimeout
+from aiohttp import (
+    ClientError,
+    ClientResponse,
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+    hdrs,
+)
 from aiohttp.client_exceptions import ClientResponseError
 from mashumaro import DataClassDictMixin
 from mashumaro.exceptions import (
@@ -18,29 +32,112 @@ from mashumaro.exceptions import (
     UnserializableDataError,
 )
 
-from aionotion.bridge import Bridge
+from aionotion.cache import DEFAULT_CACHE_MAX_SIZE, CachedEndpoint, ResponseCache
 from aionotion.const import LOGGER
-from aionotion.errors import InvalidCredentialsError, RequestError
-from aionotion.listener import Listener
-from aionotion.sensor import Sensor
-from aionotion.system import System
-from aionotion.user import User
-from aionotion.user.models import (
-    AuthenticateViaCredentialsLegacyResponse,
-    AuthenticateViaCredentialsResponse,
-    AuthenticateViaRefreshTokenResponse,
+from aionotion.errors import (
+    InvalidCredentialsError,
+    NotionError,
+    RateLimitError,
+    RequestError,
+    ServerError,
 )
+from aionotion.metrics import RequestMetrics, RequestTrace
+from aionotion.refresh import RefreshResult, TokenRefreshScheduler
+from aionotion.retry import RETRYABLE_ERRORS, RetryPolicy
 from aionotion.util.auth import decode_jwt
-from aionotion.util.dt import utc_from_timestamp, utcnow
+from aionotion.util.decode import (
+    DEFAULT_JSON_DECODER,
+    JSONDecoderT,
+    ModelDecoderT,
+    get_model_decoder,
+)
+from aionotion.util.dt import parse_retry_after, utc_from_timestamp, utcnow
+from aionotion.util.log import (
+    DEFAULT_PAYLOAD_LOG_MAX_LENGTH,
+    DEFAULT_PAYLOAD_LOG_SAMPLE_RATE,
+    format_payload,
+)
+from aionotion.util.stream import JSONArrayStream
+
+if TYPE_CHECKING:
+    from aionotion.bridge import Bridge
+    from aionotion.listener import Listener
+    from aionotion.sensor import Sensor
+    from aionotion.snapshot import Snapshot
+    from aionotion.system import System
+    from aionotion.user import User
+    from aionotion.user.models import (
+        AuthenticateViaCredentialsResponse,
+        AuthenticateViaRefreshTokenResponse,
+    )
 
 API_BASE = "https://api.getnotion.com/api"
 
+DEFAULT_ACCESS_TOKEN_REFRESH_MARGIN = 60
+DEFAULT_CONNECTION_LIMIT = 100
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 10
+DEFAULT_DNS_CACHE_TTL = 300
+DEFAULT_KEEPALIVE_TIMEOUT = 30
+DEFAULT_STREAM_CHUNK_SIZE = 65536
 DEFAULT_TIMEOUT = 10
 
+# Authentication requests aren't idempotent, so they're never retried:
+NON_RETRYABLE_ENDPOINT_PREFIXES = ("/auth/", "/users/sign_in")
+
 NotionBaseModelT = TypeVar("NotionBaseModelT", bound=DataClassDictMixin)
+_T = TypeVar("_T")
+RefreshResultCallbackT = Callable[[RefreshResult], None]
+RequestMetricsCallbackT = Callable[[RequestMetrics], None]
 RefreshTokenCallbackT = Callable[[str], None]
 
 
+@dataclass(frozen=True, kw_only=True)
+class _APIResponse:
+    """Define an API response."""
+
+    status: int
+    headers: Mapping[str, str]
+    data: dict[str, Any]
+    body: bytes = b""
+
+
+@dataclass(frozen=True, kw_only=True)
+class _ConditionalResponse:
+    """Define a validated response that can be revalidated with the API."""
+
+    validators: dict[str, str]
+    validated: DataClassDictMixin
+
+
+def create_pooled_session(
+    *,
+    connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+    connection_limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
+) -> ClientSession:
+    """Create an aiohttp ClientSession with a keep-alive, DNS-caching connection pool.
+
+    Args:
+    ----
+        connection_limit: The maximum number of simultaneous connections.
+        connection_limit_per_host: The maximum number of simultaneous connections to a
+            single host.
+
+    Returns:
+    -------
+        An aiohttp ClientSession.
+
+    """
+    return ClientSession(
+        connector=TCPConnector(
+            keepalive_timeout=DEFAULT_KEEPALIVE_TIMEOUT,
+            limit=connection_limit,
+            limit_per_host=connection_limit_per_host,
+            ttl_dns_cache=DEFAULT_DNS_CACHE_TTL,
+        ),
+        timeout=ClientTimeout(total=DEFAULT_TIMEOUT),
+    )
+
+
 def get_token_header_value(access_token: str, refresh_token: str | None) -> str:
     """Return the value for the Authorization header.
 
@@ -63,11 +160,28 @@ def get_token_header_value(access_token: str, refresh_token: str | None) -> str:
     return f"Token token={access_token}"
 
 
-class Client:
+class Client:  # pylint: disable=too-many-instance-attributes
     """Define the API object."""
 
     def __init__(
-        self, *, session: ClientSession | None = None, session_name: str | None = None
+        self,
+        *,
+        session: ClientSession | None = None,
+        session_name: str | None = None,
+        connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+        connection_limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
+        refresh_margin: float = DEFAULT_ACCESS_TOKEN_REFRESH_MARGIN,
+        background_refresh: bool = False,
+        refresh_scheduler: TokenRefreshScheduler | None = None,
+        cache_ttls: Mapping[CachedEndpoint, float] | None = None,
+        cache_max_size: int = DEFAULT_CACHE_MAX_SIZE,
+        request_limiter: asyncio.Semaphore | None = None,
+        json_decoder: JSONDecoderT | None = None,
+        direct_decode: bool = False,
+        payload_log_max_length: int | None = DEFAULT_PAYLOAD_LOG_MAX_LENGTH,
+        payload_log_sample_rate: float = DEFAULT_PAYLOAD_LOG_SAMPLE_RATE,
+        api_base: str = API_BASE,
+        retry_policy: RetryPolicy | None = None,
     ) -> None:
         """Initialize.
 
@@ -75,30 +189,519 @@ class Client:
         ----
             session: An optional aiohttp ClientSession.
             session_name: An optional session name to use for authentication.
+            connection_limit: The maximum number of simultaneous connections held by
+                the client-owned session (ignored if ``session`` is provided).
+            connection_limit_per_host: The maximum number of simultaneous connections
+                to a single host held by the client-owned session (ignored if
+                ``session`` is provided).
+            refresh_margin: The number of seconds before the access token expires at
+                which it is proactively refreshed.
+            background_refresh: Whether to refresh the access token in the background
+                (using a scheduler owned by this client) before it expires.
+            refresh_scheduler: An optional scheduler to refresh the access token in
+                the background with (e.g., one shared among several clients); implies
+                ``background_refresh``.
+            cache_ttls: An optional mapping of endpoints to the number of seconds their
+                (rarely-changing) responses should be cached for.
+            cache_max_size: The maximum number of responses to cache at once.
+            request_limiter: An optional semaphore that limits how many requests may
+                be in flight at once (e.g., one shared among several clients).
+            json_decoder: An optional function that decodes raw JSON response bodies;
+                if not provided, the fastest installed decoder (``orjson``,
+                ``msgspec``, or the standard library's ``json``) is used.
+            direct_decode: Whether to decode response bodies straight into models
+                (skipping the intermediate dict); requires ``msgspec``.
+            payload_log_max_length: The maximum number of bytes of each response body
+                to include in DEBUG logs (if None, entire bodies are logged).
+            payload_log_sample_rate: The fraction (between 0 and 1) of response bodies
+                to include in DEBUG logs.
+            api_base: The base URL of the API (e.g., to point the client at a fake API
+                server for testing).
+            retry_policy: An optional policy for retrying requests that fail
+                transiently (if not provided, failed requests aren't retried).
 
         """
         self._access_token: str | None = None
         self._access_token_expires_at: datetime | None = None
+        self._api_base = api_base
+        self._conditional_responses: dict[str, _ConditionalResponse] = {}
+        self._connection_limit = connection_limit
+        self._connection_limit_per_host = connection_limit_per_host
+        self._direct_decode = direct_decode
+        self._json_decoder = json_decoder or DEFAULT_JSON_DECODER
+        self._owned_session: ClientSession | None = None
+        self._payload_log_max_length = payload_log_max_length
+        self._payload_log_sample_rate = payload_log_sample_rate
         self._refresh_event = asyncio.Event()
         self._refresh_lock = asyncio.Lock()
+        self._refresh_margin = timedelta(seconds=refresh_margin)
+        self._refresh_result_callbacks: list[RefreshResultCallbackT] = []
+        self._refresh_task: asyncio.Task[None] | None = None
         self._refresh_token: str | None = None
         self._refresh_token_callbacks: list[RefreshTokenCallbackT] = []
         self._refreshing = False
+        self._request_limiter = request_limiter
+        self._retry_policy = retry_policy
+        self._request_metrics_callbacks: list[RequestMetricsCallbackT] = []
+        self._owns_refresh_scheduler = background_refresh and not refresh_scheduler
+        self._refresh_scheduler = refresh_scheduler or (
+            TokenRefreshScheduler() if background_refresh else None
+        )
         self._session = session
         self._session_name = session_name or uuid4().hex
+        self.cache = ResponseCache(cache_ttls, max_size=cache_max_size)
         self.user_uuid: str = ""
 
-        self.bridge = Bridge(self)
-        self.listener = Listener(self)
-        self.sensor = Sensor(self)
-        self.system = System(self)
-        self.user = User(self)
+    async def __aenter__(self) -> Self:
+        """Enter the client's async context.
+
+        Returns
+        -------
+            This client.
+
+        """
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Exit the client's async context.
+
+        Args:
+        ----
+            exc_info: Information about an exception raised within the context.
+
+        """
+        await self.async_close()
 
     @property
     def refresh_token(self) -> str | None:
         """Return the refresh token."""
         return self._refresh_token
 
+    # The endpoints (and their models) are only imported once they're first used:
+
+    @cached_property
+    def bridge(self) -> Bridge:
+        """Return the bridge endpoints."""
+        from aionotion.bridge import Bridge  # pylint: disable=import-outside-toplevel
+
+        return Bridge(self)
+
+    @cached_property
+    def listener(self) -> Listener:
+        """Return the listener endpoints."""
+        from aionotion.listener import (  # pylint: disable=import-outside-toplevel
+            Listener,
+        )
+
+        return Listener(self)
+
+    @cached_property
+    def sensor(self) -> Sensor:
+        """Return the sensor endpoints."""
+        from aionotion.sensor import Sensor  # pylint: disable=import-outside-toplevel
+
+        return Sensor(self)
+
+    @cached_property
+    def system(self) -> System:
+        """Return the system endpoints."""
+        from aionotion.system import System  # pylint: disable=import-outside-toplevel
+
+        return System(self)
+
+    @cached_property
+    def user(self) -> User:
+        """Return the user endpoints."""
+        from aionotion.user import User  # pylint: disable=import-outside-toplevel
+
+        return User(self)
+
+    def _decode_json(
+        self, endpoint: str, body: bytes, *, trace: RequestTrace
+    ) -> dict[str, Any]:
+        """Decode the JSON body of a response.
+
+        Args:
+        ----
+            endpoint: The relative API endpoint that the response came from.
+            body: The raw response body.
+            trace: The metrics of the request.
+
+        Returns:
+        -------
+            The decoded response payload.
+
+        Raises:
+        ------
+            RequestError: Raised upon a body that isn't valid JSON.
+
+        """
+        if not body:
+            return {}
+
+        start = time.perf_counter()
+        try:
+            return cast(dict[str, Any], self._json_decoder(body))
+        except ValueError as err:
+            msg = f"Error while decoding response from {endpoint}: {err}"
+            raise RequestError(msg) from err
+        finally:
+            trace.decode_time += time.perf_counter() - start
+
+    @staticmethod
+    def _decode_model(
+        endpoint: str, model_decoder: ModelDecoderT, body: bytes, *, trace: RequestTrace
+    ) -> DataClassDictMixin | None:
+        """Decode a raw body straight into a model.
+
+        Args:
+        ----
+            endpoint: The relative API endpoint that the body came from.
+            model_decoder: A function that decodes the body straight into a model.
+            body: The raw body.
+            trace: The metrics of the request.
+
+        Returns:
+        -------
+            The validated model (or None if the body must be validated the regular
+            way instead).
+
+        """
+        start = time.perf_counter()
+        try:
+            return model_decoder(body)
+        except ValueError as err:
+            # Payloads that msgspec is stricter about than our models (e.g., an
+            # unusual datetime format) are still validated the regular way:
+            LOGGER.debug("Falling back to validating %s: %s", endpoint, err)
+            return None
+        finally:
+            trace.validation_time += time.perf_counter() - start
+
+    @staticmethod
+    def _validate(
+        endpoint: str,
+        model: type[NotionBaseModelT],
+        data: dict[str, Any],
+        *,
+        trace: RequestTrace,
+    ) -> NotionBaseModelT:
+        """Validate a decoded payload against a model.
+
+        Args:
+        ----
+            endpoint: The relative API endpoint that the payload came from.
+            model: A model to validate the payload against.
+            data: The decoded payload.
+            trace: The metrics of the request.
+
+        Returns:
+        -------
+            A parsed, validated model representing the payload.
+
+        Raises:
+        ------
+            RequestError: Raised upon a payload that fails validation.
+
+        """
+        start = time.perf_counter()
+        try:
+            return model.from_dict(data)
+        except (
+            MissingField,
+            SuitableVariantNotFoundError,
+            UnserializableDataError,
+        ) as err:
+            msg = f"Error while parsing response from {endpoint}: {err}"
+            raise RequestError(msg) from err
+        finally:
+            trace.validation_time += time.perf_counter() - start
+
+    def _validate_item(
+        self,
+        endpoint: str,
+        model: type[NotionBaseModelT],
+        model_decoder: ModelDecoderT | None,
+        item: bytes,
+        *,
+        trace: RequestTrace,
+    ) -> NotionBaseModelT:
+        """Decode and validate a single raw item of a streamed array.
+
+        Args:
+        ----
+            endpoint: The relative API endpoint that the item came from.
+            model: A model to validate the item against.
+            model_decoder: An optional function that decodes the item straight into
+                the model.
+            item: The raw item.
+            trace: The metrics of the request.
+
+        Returns:
+        -------
+            A parsed, validated model representing the item.
+
+        """
+        if model_decoder and (
+            validated := self._decode_model(endpoint, model_decoder, item, trace=trace)
+        ):
+            return cast(NotionBaseModelT, validated)
+        data = self._decode_json(endpoint, item, trace=trace)
+        return self._validate(endpoint, model, data, trace=trace)
+
+    async def _async_retry(
+        self,
+        method: str,
+        endpoint: str,
+        request: Callable[[], Awaitable[_T]],
+        *,
+        trace: RequestTrace,
+    ) -> _T:
+        """Make a request, retrying it according to the client's retry policy.
+
+        Authentication requests are never retried: a refresh token is only good for a
+        single use, so a refresh that reached the API can't be safely repeated.
+
+        Args:
+        ----
+            method: The HTTP method of the request.
+            endpoint: The relative API endpoint of the request.
+            request: A function that makes a single attempt at the request.
+            trace: The metrics of the request.
+
+        Returns:
+        -------
+            The result of the successful attempt.
+
+        """
+        started_at = time.monotonic()
+
+        while True:
+            trace.attempts += 1
+            try:
+                return await request()
+            except RETRYABLE_ERRORS as err:
+                if (
+                    not self._retry_policy
+                    or endpoint.startswith(NON_RETRYABLE_ENDPOINT_PREFIXES)
+                    or (
+                        delay := self._retry_policy.get_delay(
+                            method,
+                            trace.attempts,
+                            time.monotonic() - started_at,
+                            err,
+                        )
+                    )
+                    is None
+                ):
+                    raise
+
+                LOGGER.debug(
+                    "Retrying %s in %.2f seconds (attempt %s failed): %s",
+                    endpoint,
+                    delay,
+                    trace.attempts,
+                    err,
+                )
+                await asyncio.sleep(delay)
+
+    @contextmanager
+    def _trace_request(self, method: str, endpoint: str) -> Iterator[RequestTrace]:
+        """Collect the metrics of an API request and report them once it's done.
+
+        Args:
+        ----
+            method: An HTTP method.
+            endpoint: A relative API endpoint.
+
+        Yields:
+        ------
+            The metrics of the request (to be filled in as it progresses).
+
+        """
+        trace = RequestTrace(method=method, endpoint=endpoint)
+        error: Exception | None = None
+
+        try:
+            yield trace
+        except Exception as err:
+            error = err
+            raise
+        finally:
+            if self._request_metrics_callbacks:
+                metrics = trace.finish(error)
+                for callback in self._request_metrics_callbacks:
+                    callback(metrics)
+
+    def _get_session(self) -> ClientSession:
+        """Return the aiohttp ClientSession to use for a request.
+
+        If no (open) session was provided to the client, a connection-pooled session is
+        lazily created and reused for all subsequent requests until the client is
+        closed.
+
+        Returns
+        -------
+            An aiohttp ClientSession.
+
+        """
+        if self._session and not self._session.closed:
+            return self._session
+
+        if not self._owned_session or self._owned_session.closed:
+            self._owned_session = create_pooled_session(
+                connection_limit=self._connection_limit,
+                connection_limit_per_host=self._connection_limit_per_host,
+            )
+
+        return self._owned_session
+
+    async def async_close(self) -> None:
+        """Close the client.
+
+        This stops any background refreshing of the access token and closes the session
+        that the client created on its own; a session provided by the caller is left
+        for the caller to close.
+        """
+        if self._refresh_scheduler:
+            self._refresh_scheduler.unschedule(self)
+            if self._owns_refresh_scheduler:
+                await self._refresh_scheduler.async_close()
+        if self._refresh_task and not self._refresh_task.done():
+            self._refresh_task.cancel()
+
+        if self._owned_session and not self._owned_session.closed:
+            await self._owned_session.close()
+        self._owned_session = None
+
+    def _access_token_expired(self) -> bool:
+        """Return whether the access token has expired.
+
+        Returns
+        -------
+            Whether the access token can no longer be used.
+
+        """
+        return bool(
+            self._access_token_expires_at and utcnow() >= self._access_token_expires_at
+        )
+
+    def _access_token_needs_refresh(self) -> bool:
+        """Return whether the access token is expired (or about to expire).
+
+        Returns
+        -------
+            Whether the access token should be refreshed before the next request.
+
+        """
+        if not self._access_token_expires_at:
+            return False
+        return utcnow() >= self._access_token_expires_at - self._refresh_margin
+
+    async def _async_refresh_access_token(self) -> None:
+        """Refresh the access token, sharing a single refresh among concurrent callers.
+
+        The first caller to get here starts the refresh; every other caller that
+        arrives while it is in flight awaits the result of that same refresh (including
+        any exception it raises).
+        """
+        if not self._refresh_task or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(
+                self._async_run_access_token_refresh()
+            )
+        # Shield the shared refresh so that one cancelled caller doesn't cancel it for
+        # everyone else:
+        await asyncio.shield(self._refresh_task)
+
+    async def _async_run_access_token_refresh(self) -> None:
+        """Run a single access token refresh."""
+        if self._access_token_expired():
+            LOGGER.debug("Access token expired, refreshing...")
+            # Don't send an expired access token along with the refresh request:
+            self._access_token = None
+        else:
+            LOGGER.debug("Access token about to expire, refreshing...")
+        await self.async_authenticate_from_refresh_token()
+
+    def _log_payload(self, endpoint: str, body: bytes) -> None:
+        """Log a (truncated and redacted) response body at the DEBUG level.
+
+        Nothing is rendered unless DEBUG logging is enabled and the response is sampled.
+
+        Args:
+        ----
+            endpoint: The relative API endpoint that the response came from.
+            body: The raw response body.
+
+        """
+        if not LOGGER.isEnabledFor(logging.DEBUG) or (
+            self._payload_log_sample_rate < 1
+            and random.random() >= self._payload_log_sample_rate  # noqa: S311
+        ):
+            return
+
+        LOGGER.debug(
+            "Received data from %s: %s",
+            endpoint,
+            format_payload(body, max_length=self._payload_log_max_length),
+        )
+
+    def _save_conditional_response(
+        self, endpoint: str, response: _APIResponse, validated: DataClassDictMixin
+    ) -> None:
+        """Save a validated response along with its validators (if it has any).
+
+        Args:
+        ----
+            endpoint: The relative API endpoint that the response came from.
+            response: The API response.
+            validated: The validated model representing the response.
+
+        """
+        validators: dict[str, str] = {}
+        if etag := response.headers.get(hdrs.ETAG):
+            validators[hdrs.IF_NONE_MATCH] = etag
+        if last_modified := response.headers.get(hdrs.LAST_MODIFIED):
+            validators[hdrs.IF_MODIFIED_SINCE] = last_modified
+
+        if validators:
+            self._conditional_responses[endpoint] = _ConditionalResponse(
+                validators=validators, validated=validated
+            )
+        else:
+            self._conditional_responses.pop(endpoint, None)
+
+    def _cache_validated(
+        self,
+        method: str,
+        endpoint: str,
+        response: _APIResponse,
+        validated: NotionBaseModelT,
+        cache: CachedEndpoint | None,
+    ) -> NotionBaseModelT:
+        """Store a validated response for later reuse (where applicable).
+
+        Args:
+        ----
+            method: The HTTP method of the request.
+            endpoint: The relative API endpoint of the request.
+            response: The API response.
+            validated: The validated model.
+            cache: The cacheable endpoint that the request was for (if any).
+
+        Returns:
+        -------
+            The validated model.
+
+        """
+        if cache:
+            self.cache.set(cache, endpoint, validated)
+
+        if method.lower() == "get":
+            self._save_conditional_response(endpoint, response, validated)
+
+        return validated
+
     def _save_tokens_from_auth_response(
         self,
         auth_response: AuthenticateViaCredentialsResponse
@@ -122,6 +725,21 @@ class Client:
         for callback in self._refresh_token_callbacks:
             callback(self._refresh_token)
 
+        if self._refresh_scheduler:
+            self._refresh_scheduler.schedule(self)
+
+    def add_refresh_result_callback(
+        self, callback: RefreshResultCallbackT
+    ) -> Callable[[], None]:
+        """Add a callback to be called with the outcome of every token refresh."""
+        self._refresh_result_callbacks.append(callback)
+
+        def remove_callback() -> None:
+            """Remove the callback from the list of callbacks."""
+            self._refresh_result_callbacks.remove(callback)
+
+        return remove_callback
+
     def add_refresh_token_callback(
         self, callback: RefreshTokenCallbackT
     ) -> Callable[[], None]:
@@ -134,6 +752,18 @@ class Client:
 
         return remove_callback
 
+    def add_request_metrics_callback(
+        self, callback: RequestMetricsCallbackT
+    ) -> Callable[[], None]:
+        """Add a callback to be called with the metrics of every API request."""
+        self._request_metrics_callbacks.append(callback)
+
+        def remove_callback() -> None:
+            """Remove the callback from the list of callbacks."""
+            self._request_metrics_callbacks.remove(callback)
+
+        return remove_callback
+
     async def async_authenticate_from_credentials(
         self, email: str, password: str
     ) -> None:
@@ -145,6 +775,10 @@ class Client:
             password: The account password.
 
         """
+        from aionotion.user.models import (  # pylint: disable=import-outside-toplevel
+            AuthenticateViaCredentialsResponse,
+        )
+
         auth_response: AuthenticateViaCredentialsResponse = (
             await self.async_request_and_validate(
                 "post",
@@ -187,9 +821,15 @@ class Client:
             msg = "No valid refresh token provided"
             raise InvalidCredentialsError(msg)
 
+        from aionotion.user.models import (  # pylint: disable=import-outside-toplevel
+            AuthenticateViaRefreshTokenResponse,
+        )
+
         async with self._refresh_lock:
             self._refreshing = True
             self._refresh_event.clear()
+            error: Exception | None = None
+            start = time.monotonic()
 
             try:
                 auth_response: AuthenticateViaRefreshTokenResponse = (
@@ -207,10 +847,66 @@ class Client:
                     )
                 )
                 self._save_tokens_from_auth_response(auth_response)
+            except Exception as err:
+                error = err
+                raise
             finally:
                 self._refreshing = False
                 self._refresh_event.set()
 
+                result = RefreshResult(latency=time.monotonic() - start, error=error)
+                for callback in self._refresh_result_callbacks:
+                    callback(result)
+
+    async def async_snapshot(self) -> Snapshot:
+        """Get a snapshot of the entire account.
+
+        All of the data that makes up the snapshot is requested concurrently.
+
+        Returns
+        -------
+            An immutable, cross-indexed snapshot of the account.
+
+        """
+        from aionotion.snapshot import (  # pylint: disable=import-outside-toplevel
+            Snapshot,
+        )
+
+        bridges = asyncio.create_task(self.bridge.async_all())
+        sensors = asyncio.create_task(self.sensor.async_all())
+        listeners = asyncio.create_task(self.listener.async_all())
+        listener_definitions = asyncio.create_task(self.listener.async_definitions())
+        systems = asyncio.create_task(self.system.async_all())
+        user = asyncio.create_task(self.user.async_info())
+        user_preferences = asyncio.create_task(self.user.async_preferences())
+        tasks = (
+            bridges,
+            sensors,
+            listeners,
+            listener_definitions,
+            systems,
+            user,
+            user_preferences,
+        )
+
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # If any request fails (or we're cancelled), don't leave the rest running:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        return Snapshot(
+            bridges=tuple(bridges.result()),
+            sensors=tuple(sensors.result()),
+            listeners=tuple(listeners.result()),
+            listener_definitions=tuple(listener_definitions.result()),
+            systems=tuple(systems.result()),
+            user=user.result(),
+            user_preferences=user_preferences.result(),
+        )
+
     async def async_legacy_authenticate_from_credentials(
         self, email: str, password: str
     ) -> None:
@@ -224,6 +920,10 @@ class Client:
             password: The account password.
 
         """
+        from aionotion.user.models import (  # pylint: disable=import-outside-toplevel
+            AuthenticateViaCredentialsLegacyResponse,
+        )
+
         LOGGER.warning(
             "Using legacy authentication endpoint; this is deprecated and will be "
             "removed in a future release"
@@ -245,63 +945,92 @@ class Client:
         self.user_uuid = auth_response.users.uuid
         self._access_token = auth_response.session.authentication_token
 
-    async def async_request(
+    async def _async_ensure_access_token(self, *, trace: RequestTrace) -> None:
+        """Refresh the access token (or wait for a pending refresh) if needed.
+
+        This happens once per request (rather than once per attempt), so that a
+        failed refresh is never re-sent by the retry policy. A refresh that fails before
+        the access token has expired is logged, and the request proceeds with the
+        current access token.
+
+        Args:
+        ----
+            trace: The metrics of the request.
+
+        """
+        refresh_wait_start = time.perf_counter()
+        if self._access_token_needs_refresh():
+            try:
+                await self._async_refresh_access_token()
+            except (ClientError, NotionError, TimeoutError) as err:
+                # If the access token hasn't actually expired yet, a failed refresh
+                # shouldn't fail the request (the next request will try again):
+                if self._access_token_expired():
+                    raise
+                LOGGER.warning(
+                    "Access token refresh failed, using the current one: %s", err
+                )
+        elif self._refreshing:
+            # If an authenticated request arrives while we're refreshing, hold
+            # until the refresh process is done:
+            await self._refresh_event.wait()
+        trace.refresh_wait += time.perf_counter() - refresh_wait_start
+
+    @asynccontextmanager
+    async def _async_open_response(
         self,
         method: str,
         endpoint: str,
         *,
-        refresh_request: bool = False,
         headers: dict[str, str] | None = None,
         json: dict[str, Any] | None = None,
-    ) -> dict[str, Any]:
-        """Make an API request.
+        trace: RequestTrace,
+    ) -> AsyncIterator[ClientResponse]:
+        """Make an API request and yield the response before its body is read.
 
         Args:
         ----
             method: An HTTP method.
             endpoint: A relative API endpoint.
-            refresh_request: Whether this is a request to refresh the access token.
             headers: Additional headers to include in the request.
             json: A JSON payload to send with the request.
+            trace: The metrics of the request.
 
-        Returns:
-        -------
-            An API response payload.
+        Yields:
+        ------
+            The successful (or not modified) response.
 
         Raises:
         ------
             InvalidCredentialsError: Raised upon invalid credentials.
+            RateLimitError: Raised when the request is rate-limited.
             RequestError: Raised upon an underlying HTTP error.
 
         """
-        if self._access_token_expires_at and utcnow() >= self._access_token_expires_at:
-            LOGGER.debug("Access token expired, refreshing...")
-            self._access_token = None
-            self._access_token_expires_at = None
-            await self.async_authenticate_from_refresh_token()
+        url: str = f"{self._api_base}{endpoint}"
 
-        # If an authenticated request arrives while we're refreshing, hold until the
-        # refresh process is done:
-        if not refresh_request and self._refreshing:
-            await self._refresh_event.wait()
-
-        url: str = f"{API_BASE}{endpoint}"
-
-        headers = {}
+        headers = dict(headers or {})
         if self._access_token:
             headers["Authorization"] = get_token_header_value(
                 self._access_token, self._refresh_token
             )
 
-        if use_running_session := self._session and not self._session.closed:
-            session = self._session
-        else:
-            session = ClientSession(timeout=ClientTimeout(total=DEFAULT_TIMEOUT))
-
-        data: dict[str, Any] = {}
-
-        async with session.request(method, url, headers=headers, json=json) as resp:
-            data = await resp.json()
+        session = self._get_session()
+        limiter = self._request_limiter or nullcontext()
+
+        async with (
+            limiter,
+            session.request(method, url, headers=headers, json=json) as resp,
+        ):
+            trace.status = resp.status
+
+            if resp.status == HTTPStatus.TOO_MANY_REQUESTS:
+                retry_after = resp.headers.get(hdrs.RETRY_AFTER)
+                msg = f"Rate limited while requesting {endpoint}"
+                raise RateLimitError(
+                    msg,
+                    retry_after=parse_retry_after(retry_after) if retry_after else None,
+                )
 
             try:
                 resp.raise_for_status()
@@ -309,14 +1038,116 @@ class Client:
                 if resp.status == HTTPStatus.UNAUTHORIZED:
                     msg = "Invalid credentials"
                     raise InvalidCredentialsError(msg) from err
+                body = await resp.read()
+                trace.bytes_received = len(body)
+                if resp.status >= HTTPStatus.INTERNAL_SERVER_ERROR:
+                    msg = f"Server error while requesting {endpoint}: {resp.status}"
+                    raise ServerError(msg) from err
+                data = self._decode_json(endpoint, body, trace=trace)
                 raise RequestError(data["errors"][0]["title"]) from err
 
-        if not use_running_session:
-            await session.close()
+            yield resp
+
+    async def _async_request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        refresh_request: bool = False,
+        headers: dict[str, str] | None = None,
+        json: dict[str, Any] | None = None,
+        decode: bool = True,
+        trace: RequestTrace,
+    ) -> _APIResponse:
+        """Make an API request and return the full response.
+
+        Args:
+        ----
+            method: An HTTP method.
+            endpoint: A relative API endpoint.
+            refresh_request: Whether this is a request to refresh the access token.
+            headers: Additional headers to include in the request.
+            json: A JSON payload to send with the request.
+            decode: Whether to decode a successful response body into a dict (if
+                not, only the raw body is returned).
+            trace: The metrics of the request.
+
+        Returns:
+        -------
+            The API response.
+
+        """
+
+        async def async_read() -> tuple[ClientResponse, bytes | None]:
+            """Make a single attempt at the request and read the response body."""
+            async with self._async_open_response(
+                method,
+                endpoint,
+                headers=headers,
+                json=json,
+                trace=trace,
+            ) as resp:
+                if resp.status == HTTPStatus.NOT_MODIFIED:
+                    return resp, None
+                # Read the body once and decode it ourselves (rather than via
+                # resp.json()) so that a faster decoder can be used:
+                body = await resp.read()
+                trace.bytes_received = len(body)
+                return resp, body
+
+        if not refresh_request:
+            await self._async_ensure_access_token(trace=trace)
+
+        resp, body = await self._async_retry(method, endpoint, async_read, trace=trace)
+
+        if body is None:
+            LOGGER.debug("Data from %s has not been modified", endpoint)
+            return _APIResponse(status=resp.status, headers=resp.headers, data={})
+
+        self._log_payload(endpoint, body)
+
+        if not decode:
+            return _APIResponse(
+                status=resp.status, headers=resp.headers, data={}, body=body
+            )
+
+        data = self._decode_json(endpoint, body, trace=trace)
+        return _APIResponse(status=resp.status, headers=resp.headers, data=data)
+
+    async def async_request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        refresh_request: bool = False,
+        headers: dict[str, str] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Make an API request.
+
+        Args:
+        ----
+            method: An HTTP method.
+            endpoint: A relative API endpoint.
+            refresh_request: Whether this is a request to refresh the access token.
+            headers: Additional headers to include in the request.
+            json: A JSON payload to send with the request.
 
-        LOGGER.debug("Received data from %s: %s", endpoint, data)
+        Returns:
+        -------
+            An API response payload.
 
-        return data
+        """
+        with self._trace_request(method, endpoint) as trace:
+            response = await self._async_request(
+                method,
+                endpoint,
+                refresh_request=refresh_request,
+                headers=headers,
+                json=json,
+                trace=trace,
+            )
+        return response.data
 
     async def async_request_and_validate(
         self,
@@ -327,6 +1158,7 @@ class Client:
         refresh_request: bool = False,
         headers: dict[str, str] | None = None,
         json: dict[str, Any] | None = None,
+        cache: CachedEndpoint | None = None,
     ) -> NotionBaseModelT:
         """Make an API request and validate the response against a Pydantic model.
 
@@ -338,29 +1170,129 @@ class Client:
             refresh_request: Whether this is a request to refresh the access token.
             headers: Additional headers to include in the request.
             json: A JSON payload to send with the request.
+            cache: The cacheable endpoint that this request is for (if any); the
+                response is only cached if the client has a TTL for that endpoint.
 
         Returns:
         -------
             A parsed, validated Pydantic model representing the response.
 
+        Raises:
+        ------
+            RequestError: Raised upon a response that fails validation.
+
         """
-        raw_data = await self.async_request(
-            method,
-            endpoint,
-            refresh_request=refresh_request,
-            headers=headers,
-            json=json,
-        )
+        if (
+            cache
+            and self.cache.is_enabled(cache)
+            and (cached := self.cache.get(cache, endpoint)) is not None
+        ):
+            return cast(NotionBaseModelT, cached)
+
+        # If we've seen this GET request (validated against the same model) before, ask
+        # the API to only send the response back if it has changed since then:
+        conditional = None
+        if (
+            method.lower() == "get"
+            and (conditional := self._conditional_responses.get(endpoint))
+            and type(conditional.validated) is model
+        ):
+            headers = {**(headers or {}), **conditional.validators}
+        else:
+            conditional = None
+
+        model_decoder = get_model_decoder(model) if self._direct_decode else None
+
+        with self._trace_request(method, endpoint) as trace:
+            response = await self._async_request(
+                method,
+                endpoint,
+                refresh_request=refresh_request,
+                headers=headers,
+                json=json,
+                decode=model_decoder is None,
+                trace=trace,
+            )
 
-        try:
-            return cast(NotionBaseModelT, model.from_dict(raw_data))
-        except (
-            MissingField,
-            SuitableVariantNotFoundError,
-            UnserializableDataError,
-        ) as err:
-            msg = f"Error while parsing response from {endpoint}: {err}"
-            raise RequestError(msg) from err
+            if conditional and response.status == HTTPStatus.NOT_MODIFIED:
+                validated = cast(NotionBaseModelT, conditional.validated)
+                if cache:
+                    self.cache.set(cache, endpoint, validated)
+                return validated
+
+            if model_decoder:
+                if decoded := self._decode_model(
+                    endpoint, model_decoder, response.body, trace=trace
+                ):
+                    validated = cast(NotionBaseModelT, decoded)
+                    return self._cache_validated(
+                        method, endpoint, response, validated, cache
+                    )
+                response = dataclasses.replace(
+                    response,
+                    data=self._decode_json(endpoint, response.body, trace=trace),
+                )
+
+            validated = cast(
+                NotionBaseModelT,
+                self._validate(endpoint, model, response.data, trace=trace),
+            )
+
+        return self._cache_validated(method, endpoint, response, validated, cache)
+
+    async def async_iter_and_validate(
+        self, endpoint: str, key: str, model: type[NotionBaseModelT]
+    ) -> AsyncIterator[NotionBaseModelT]:
+        """Make a GET request and validate the items of an array as they arrive.
+
+        The response body is parsed incrementally, so only the item currently being
+        received is held in memory (rather than the entire response).
+
+        Args:
+        ----
+            endpoint: A relative API endpoint.
+            key: The top-level key of the array in the response.
+            model: A model to validate each item of the array against.
+
+        Yields:
+        ------
+            A parsed, validated model representing each item.
+
+        Raises:
+        ------
+            RequestError: Raised upon a response that doesn't contain the entire array.
+
+        """
+        model_decoder = get_model_decoder(model) if self._direct_decode else None
+        stream = JSONArrayStream(key)
+
+        with self._trace_request("get", endpoint) as trace:
+            await self._async_ensure_access_token(trace=trace)
+            async with AsyncExitStack() as stack:
+                # Only opening the response can be retried (once items have been
+                # yielded, the request can't be started over):
+                resp = await self._async_retry(
+                    "get",
+                    endpoint,
+                    lambda: stack.enter_async_context(
+                        self._async_open_response("get", endpoint, trace=trace)
+                    ),
+                    trace=trace,
+                )
+                async for chunk in resp.content.iter_chunked(DEFAULT_STREAM_CHUNK_SIZE):
+                    trace.bytes_received += len(chunk)
+                    for item in stream.feed(chunk):
+                        yield self._validate_item(
+                            endpoint, model, model_decoder, item, trace=trace
+                        )
+                    if stream.done:
+                        break
+
+            try:
+                stream.close()
+            except ValueError as err:
+                msg = f"Error while parsing response from {endpoint}: {err}"
+                raise RequestError(msg) from err
 
 
 async def async_get_client_with_credentials(
@@ -11,3 +11,24 @@ class RequestError(NotionError):
 
 class InvalidCredentialsError(NotionError):
     """Define an error for unauthenticated accounts."""
+
+
+class RateLimitError(RequestError):
+    """Define an error for requests that have been rate-limited."""
+
+    def __init__(self, message: str, *, retry_after: float | None = None) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            message: The error message.
+            retry_after: The number of seconds to wait before retrying (if the API
+                provided one).
+
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class ServerError(RequestError):
+    """Define an error for requests that the API failed to handle."""
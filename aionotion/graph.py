@@ -0,0 +1,162 @@
+"""Define a graph of the relationships among an account's entities."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from aionotion.bridge.models import Bridge
+    from aionotion.listener.models import Listener
+    from aionotion.sensor.models import Sensor
+    from aionotion.system.models import System
+
+
+@dataclass(eq=False, kw_only=True)
+class SystemNode:
+    """Define a system and the devices within it."""
+
+    system: System
+    bridges: list[BridgeNode] = field(default_factory=list, repr=False)
+    sensors: list[SensorNode] = field(default_factory=list, repr=False)
+
+    @property
+    def listeners(self) -> list[Listener]:
+        """Return the listeners on every sensor in the system."""
+        return [listener for sensor in self.sensors for listener in sensor.listeners]
+
+
+@dataclass(eq=False, kw_only=True)
+class BridgeNode:
+    """Define a bridge, the system it belongs to, and the sensors behind it."""
+
+    bridge: Bridge
+    system: SystemNode | None = field(default=None, repr=False)
+    sensors: list[SensorNode] = field(default_factory=list, repr=False)
+
+    @property
+    def listeners(self) -> list[Listener]:
+        """Return the listeners on every sensor behind the bridge."""
+        return [listener for sensor in self.sensors for listener in sensor.listeners]
+
+
+@dataclass(eq=False, kw_only=True)
+class SensorNode:
+    """Define a sensor, its bridge and system, and its listeners."""
+
+    sensor: Sensor
+    bridge: BridgeNode | None = field(default=None, repr=False)
+    system: SystemNode | None = field(default=None, repr=False)
+    listeners: list[Listener] = field(default_factory=list, repr=False)
+
+
+class EntityGraph:
+    """Define a graph that links systems, bridges, sensors, and listeners.
+
+    The API only relates entities by ID; the graph resolves those IDs once so that
+    traversals (e.g., every listener behind a bridge) are a matter of following
+    references. Entities whose related entities are missing are kept, but left unlinked.
+    """
+
+    def __init__(
+        self,
+        *,
+        systems: Iterable[System] = (),
+        bridges: Iterable[Bridge] = (),
+        sensors: Iterable[Sensor] = (),
+        listeners: Iterable[Listener] = (),
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            systems: The systems to link.
+            bridges: The bridges to link.
+            sensors: The sensors to link.
+            listeners: The listeners to link.
+
+        """
+        system_nodes = {system.id: SystemNode(system=system) for system in systems}
+
+        bridge_nodes: dict[int, BridgeNode] = {}
+        for bridge in bridges:
+            bridge_node = BridgeNode(
+                bridge=bridge, system=system_nodes.get(bridge.system_id)
+            )
+            if bridge_node.system:
+                bridge_node.system.bridges.append(bridge_node)
+            bridge_nodes[bridge.id] = bridge_node
+
+        sensor_nodes: dict[int, SensorNode] = {}
+        sensor_nodes_by_uuid: dict[str, SensorNode] = {}
+        for sensor in sensors:
+            sensor_node = SensorNode(
+                sensor=sensor,
+                bridge=bridge_nodes.get(sensor.bridge.id),
+                system=system_nodes.get(sensor.system_id),
+            )
+            if sensor_node.bridge:
+                sensor_node.bridge.sensors.append(sensor_node)
+            if sensor_node.system:
+                sensor_node.system.sensors.append(sensor_node)
+            sensor_nodes[sensor.id] = sensor_node
+            sensor_nodes_by_uuid[sensor.uuid] = sensor_node
+
+        for listener in listeners:
+            if listener_sensor_node := sensor_nodes_by_uuid.get(listener.sensor_id):
+                listener_sensor_node.listeners.append(listener)
+
+        self.bridges: Mapping[int, BridgeNode] = MappingProxyType(bridge_nodes)
+        self.sensors: Mapping[int, SensorNode] = MappingProxyType(sensor_nodes)
+        self.sensors_by_uuid: Mapping[str, SensorNode] = MappingProxyType(
+            sensor_nodes_by_uuid
+        )
+        self.systems: Mapping[int, SystemNode] = MappingProxyType(system_nodes)
+
+    def get_listeners_for_bridge(self, bridge_id: int) -> list[Listener]:
+        """Return the listeners on every sensor behind a bridge.
+
+        Args:
+        ----
+            bridge_id: The ID of the bridge.
+
+        Returns:
+        -------
+            The listeners (if the bridge is part of the graph).
+
+        """
+        if (bridge_node := self.bridges.get(bridge_id)) is None:
+            return []
+        return bridge_node.listeners
+
+    def get_listeners_for_system(self, system_id: int) -> list[Listener]:
+        """Return the listeners on every sensor in a system.
+
+        Args:
+        ----
+            system_id: The ID of the system.
+
+        Returns:
+        -------
+            The listeners (if the system is part of the graph).
+
+        """
+        if (system_node := self.systems.get(system_id)) is None:
+            return []
+        return system_node.listeners
+
+    def get_sensor_for_listener(self, listener: Listener) -> SensorNode | None:
+        """Return the sensor that a listener is monitoring.
+
+        Args:
+        ----
+            listener: A listener.
+
+        Returns:
+        -------
+            The listener's sensor (if it's part of the graph).
+
+        """
+        return self.sensors_by_uuid.get(listener.sensor_id)
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING
 
+from aionotion.cache import CachedEndpoint
 from aionotion.listener.models import (
+    LazyListener,
+    LazyListenerAllResponse,
     Listener as ListenerModel,
     ListenerAllResponse,
     ListenerDefinition,
     ListenerDefinitionResponse,
+    register_listener_definitions,
 )
+from aionotion.listener.poller import DEFAULT_POLL_INTERVAL, ListenerPoller
 
 if TYPE_CHECKING:
     from aionotion.client import Client
@@ -41,9 +47,39 @@ class Listener:
         )
         return response.listeners
 
+    async def async_all_lazy(self) -> list[LazyListener]:
+        """Get all listeners, deferring the parsing of rarely used fields.
+
+        Returns
+        -------
+            A validated API response payload.
+
+        """
+        response: LazyListenerAllResponse = (
+            await self._client.async_request_and_validate(
+                "get", "/sensor/listeners", LazyListenerAllResponse
+            )
+        )
+        return response.listeners
+
+    def async_iter_all(self) -> AsyncIterator[ListenerModel]:
+        """Get all listeners, yielding each one as soon as it has been received.
+
+        Returns
+        -------
+            An async iterator of validated listeners.
+
+        """
+        return self._client.async_iter_and_validate(
+            "/sensor/listeners", "listeners", ListenerModel
+        )
+
     async def async_definitions(self) -> list[ListenerDefinition]:
         """Get all listener definitions.
 
+        Listeners decoded afterward are given the kinds of any definitions that
+        weren't previously known (if they resemble a known kind).
+
         Returns
         -------
             A validated API response payload.
@@ -51,7 +87,25 @@ class Listener:
         """
         response: ListenerDefinitionResponse = (
             await self._client.async_request_and_validate(
-                "get", "/listener_definitions", ListenerDefinitionResponse
+                "get",
+                "/listener_definitions",
+                ListenerDefinitionResponse,
+                cache=CachedEndpoint.LISTENER_DEFINITIONS,
             )
         )
+        register_listener_definitions(response.listener_definitions)
         return response.listener_definitions
+
+    def poller(self, *, interval: float = DEFAULT_POLL_INTERVAL) -> ListenerPoller:
+        """Return a poller that reports only the listeners that change.
+
+        Args:
+        ----
+            interval: The number of seconds to wait between polls when iterating.
+
+        Returns:
+        -------
+            A listener poller.
+
+        """
+        return ListenerPoller(self._client, interval=interval)
@@ -0,0 +1,220 @@
+"""Define an in-memory index of listeners."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from aionotion.listener.models import Listener, ListenerKind
+
+if TYPE_CHECKING:
+    from aionotion.listener.poller import ListenerChanges
+    from aionotion.sensor.models import Sensor
+
+
+class ListenerIndex:
+    """Define an index of listeners by ID, sensor, kind, and system.
+
+    Listeners are only associated with a system once the index knows about the sensor
+    they monitor (see ``update_sensors()``). The index can be updated incrementally as
+    new data arrives; updating a listener that's already indexed replaces it.
+    """
+
+    def __init__(
+        self, listeners: Iterable[Listener] = (), *, sensors: Iterable[Sensor] = ()
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            listeners: The listeners to index.
+            sensors: The sensors that the listeners monitor.
+
+        """
+        self._by_id: dict[str, Listener] = {}
+        self._by_kind: defaultdict[ListenerKind, dict[str, Listener]] = defaultdict(
+            dict
+        )
+        self._by_sensor: defaultdict[str, dict[str, Listener]] = defaultdict(dict)
+        self._sensor_uuids_by_system: defaultdict[int, set[str]] = defaultdict(set)
+        self._system_ids_by_sensor: dict[str, int] = {}
+
+        self.update_sensors(sensors)
+        self.update(listeners)
+
+    def __contains__(self, listener_id: object) -> bool:
+        """Return whether a listener is indexed.
+
+        Args:
+        ----
+            listener_id: The ID of the listener.
+
+        Returns:
+        -------
+            Whether the listener is indexed.
+
+        """
+        return listener_id in self._by_id
+
+    def __iter__(self) -> Iterator[Listener]:
+        """Iterate over all indexed listeners.
+
+        Returns
+        -------
+            An iterator of listeners.
+
+        """
+        return iter(self._by_id.values())
+
+    def __len__(self) -> int:
+        """Return the number of indexed listeners.
+
+        Returns
+        -------
+            The number of indexed listeners.
+
+        """
+        return len(self._by_id)
+
+    def _add(self, listener: Listener) -> None:
+        """Add a listener to the index (replacing an existing one with its ID).
+
+        Args:
+        ----
+            listener: The listener to add.
+
+        """
+        if listener.id in self._by_id:
+            self._remove(listener.id)
+        self._by_id[listener.id] = listener
+        self._by_kind[listener.kind][listener.id] = listener
+        self._by_sensor[listener.sensor_id][listener.id] = listener
+
+    def _remove(self, listener_id: str) -> None:
+        """Remove a listener from the index (if it's indexed).
+
+        Args:
+        ----
+            listener_id: The ID of the listener to remove.
+
+        """
+        if (listener := self._by_id.pop(listener_id, None)) is None:
+            return
+
+        del self._by_kind[listener.kind][listener_id]
+        if not self._by_kind[listener.kind]:
+            del self._by_kind[listener.kind]
+
+        del self._by_sensor[listener.sensor_id][listener_id]
+        if not self._by_sensor[listener.sensor_id]:
+            del self._by_sensor[listener.sensor_id]
+
+    def get(self, listener_id: str) -> Listener | None:
+        """Return a listener by ID.
+
+        Args:
+        ----
+            listener_id: The ID of the listener.
+
+        Returns:
+        -------
+            The listener (if it's indexed).
+
+        """
+        return self._by_id.get(listener_id)
+
+    def get_by_kind(self, kind: ListenerKind) -> list[Listener]:
+        """Return all listeners of a kind.
+
+        Args:
+        ----
+            kind: The kind of listener.
+
+        Returns:
+        -------
+            The listeners of that kind.
+
+        """
+        return list(self._by_kind.get(kind, {}).values())
+
+    def get_for_sensor(self, sensor_uuid: str) -> list[Listener]:
+        """Return all listeners that monitor a sensor.
+
+        Args:
+        ----
+            sensor_uuid: The UUID of the sensor (i.e., a listener's ``sensor_id``).
+
+        Returns:
+        -------
+            The sensor's listeners.
+
+        """
+        return list(self._by_sensor.get(sensor_uuid, {}).values())
+
+    def get_for_system(self, system_id: int) -> list[Listener]:
+        """Return all listeners that monitor sensors in a system.
+
+        Args:
+        ----
+            system_id: The ID of the system.
+
+        Returns:
+        -------
+            The system's listeners.
+
+        """
+        return [
+            listener
+            for sensor_uuid in self._sensor_uuids_by_system.get(system_id, ())
+            for listener in self._by_sensor.get(sensor_uuid, {}).values()
+        ]
+
+    def apply(self, changes: ListenerChanges) -> None:
+        """Apply the changes reported by a listener poller.
+
+        Args:
+        ----
+            changes: The listeners that were added, changed, or removed.
+
+        """
+        self.update([*changes.added, *changes.changed])
+        self.remove(listener.id for listener in changes.removed)
+
+    def remove(self, listener_ids: Iterable[str]) -> None:
+        """Remove listeners from the index.
+
+        Args:
+        ----
+            listener_ids: The IDs of the listeners to remove.
+
+        """
+        for listener_id in listener_ids:
+            self._remove(listener_id)
+
+    def update(self, listeners: Iterable[Listener]) -> None:
+        """Add listeners to the index (replacing any that are already indexed).
+
+        Args:
+        ----
+            listeners: The listeners to add.
+
+        """
+        for listener in listeners:
+            self._add(listener)
+
+    def update_sensors(self, sensors: Iterable[Sensor]) -> None:
+        """Associate sensors (and therefore, their listeners) with their systems.
+
+        Args:
+        ----
+            sensors: The sensors to associate.
+
+        """
+        for sensor in sensors:
+            if (
+                previous_system_id := self._system_ids_by_sensor.get(sensor.uuid)
+            ) is not None:
+                self._sensor_uuids_by_system[previous_system_id].discard(sensor.uuid)
+            self._system_ids_by_sensor[sensor.uuid] = sensor.system_id
+            self._sensor_uuids_by_system[sensor.system_id].add(sensor.uuid)
@@ -2,35 +2,48 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Literal
+import sys
+from typing import Any, Literal, cast
 
 import ciso8601
-from mashumaro import DataClassDictMixin, field_options
+from mashumaro import field_options
 
 from aionotion.const import LOGGER
+from aionotion.model import NotionBaseModel
+from aionotion.util.intern import FlyweightCache
 
 
-@dataclass(frozen=True, kw_only=True)
-class ListenerLocalizedStatus(DataClassDictMixin):
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ListenerLocalizedStatus(NotionBaseModel):
     """Define a localized listener status."""
 
     state: str
     description: str
 
 
-@dataclass(frozen=True, kw_only=True)
-class InsightOrigin(DataClassDictMixin):
+_LOCALIZED_STATUSES = FlyweightCache(ListenerLocalizedStatus)
+
+_LAZY_SERIALIZED_KEYS = {
+    "raw_configuration": "configuration",
+    "raw_created_at": "created_at",
+    "raw_status_localized": "status_localized",
+}
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class InsightOrigin(NotionBaseModel):
     """Define an insight origin."""
 
     id: str | None = None
     type: str | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
-class PrimaryListenerInsight(DataClassDictMixin):
+@dataclass(frozen=True, kw_only=True, slots=True)
+class PrimaryListenerInsight(NotionBaseModel):
     """Define a primary listener insight."""
 
     origin: InsightOrigin | None
@@ -40,8 +53,8 @@ class PrimaryListenerInsight(DataClassDictMixin):
     )
 
 
-@dataclass(frozen=True, kw_only=True)
-class ListenerInsights(DataClassDictMixin):
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ListenerInsights(NotionBaseModel):
     """Define listener insights."""
 
     primary: PrimaryListenerInsight
@@ -73,40 +86,188 @@ class ListenerKind(Enum):
     UNKNOWN = 99
 
 
-@dataclass(frozen=True, kw_only=True)
-class Listener(DataClassDictMixin):
+# Every listener is decoded with a kind, so kinds are looked up in a plain dict (rather
+# than through the Enum machinery); the lookup can be enriched with new definition IDs
+# via register_listener_definitions():
+_LISTENER_KINDS: dict[int, ListenerKind] = {kind.value: kind for kind in ListenerKind}
+_UNKNOWN_DEFINITION_IDS: set[int] = set()
+
+
+def get_listener_kind(definition_id: int) -> ListenerKind:
+    """Return the kind of listener that a listener definition describes.
+
+    Each unknown definition ID is only logged the first time it's seen.
+
+    Args:
+    ----
+        definition_id: The ID of a listener definition.
+
+    Returns:
+    -------
+        The kind of listener.
+
+    """
+    if (kind := _LISTENER_KINDS.get(definition_id)) is not None:
+        return kind
+
+    if definition_id not in _UNKNOWN_DEFINITION_IDS:
+        _UNKNOWN_DEFINITION_IDS.add(definition_id)
+        LOGGER.info("Unknown listener kind: %s", definition_id)
+    return ListenerKind.UNKNOWN
+
+
+def register_listener_definitions(definitions: Iterable[ListenerDefinition]) -> None:
+    """Teach the kind lookup about definition IDs that it doesn't know yet.
+
+    Definitions whose IDs map to a known kind reveal what that kind looks like (its
+    type and name); any other definition that looks the same is given that kind.
+
+    Args:
+    ----
+        definitions: Listener definitions from the API.
+
+    """
+    definitions = list(definitions)
+    kinds_by_signature = {
+        (definition.type, definition.name): kind
+        for definition in definitions
+        if (kind := _LISTENER_KINDS.get(definition.id))
+        not in (None, ListenerKind.UNKNOWN)
+    }
+
+    for definition in definitions:
+        if definition.id in _LISTENER_KINDS:
+            continue
+        if kind := kinds_by_signature.get((definition.type, definition.name)):
+            LOGGER.debug("Mapping listener definition %s to %s", definition.id, kind)
+            _LISTENER_KINDS[definition.id] = kind
+            _UNKNOWN_DEFINITION_IDS.discard(definition.id)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class Listener(NotionBaseModel):
     """Define a listener."""
 
     id: str
     definition_id: int
     created_at: datetime = field(metadata={"deserialize": ciso8601.parse_datetime})
-    model_version: str
+    model_version: str = field(metadata={"deserialize": sys.intern})
     sensor_id: str
-    status_localized: ListenerLocalizedStatus
+    status_localized: ListenerLocalizedStatus = field(
+        metadata={"deserialize": _LOCALIZED_STATUSES.get}
+    )
     insights: ListenerInsights
     configuration: dict[str, Any]
     pro_monitoring_status: Literal["eligible", "ineligible"]
-    device_type: str = field(metadata=field_options(alias="type"))
+    device_type: str = field(
+        metadata=field_options(alias="type", deserialize=sys.intern)
+    )
     kind: ListenerKind = field(init=False)
 
     def __post_init__(self) -> None:
         """Perform post-init initialization."""
-        try:
-            object.__setattr__(self, "kind", ListenerKind(self.definition_id))
-        except ValueError:
-            LOGGER.info("Unknown listener kind: %s", self.definition_id)
-            object.__setattr__(self, "kind", ListenerKind.UNKNOWN)
+        object.__setattr__(self, "kind", get_listener_kind(self.definition_id))
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class LazyListener(NotionBaseModel):
+    """Define a listener whose rarely used fields are only parsed when first used.
+
+    The raw values of the ``configuration``, ``created_at``, and ``status_localized``
+    fields are kept as-is (and serialized as-is, under the same keys as ``Listener``, by
+    ``to_dict()``); the properties of the same names parse them upon first access.
+    """
+
+    id: str
+    definition_id: int
+    model_version: str = field(metadata={"deserialize": sys.intern})
+    sensor_id: str
+    insights: ListenerInsights
+    pro_monitoring_status: Literal["eligible", "ineligible"]
+    device_type: str = field(
+        metadata=field_options(alias="type", deserialize=sys.intern)
+    )
+    kind: ListenerKind = field(init=False)
+
+    raw_configuration: Any = field(metadata=field_options(alias="configuration"))
+    raw_created_at: str = field(metadata=field_options(alias="created_at"))
+    raw_status_localized: Any = field(metadata=field_options(alias="status_localized"))
+
+    _created_at: datetime | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+        metadata=field_options(serialize="omit"),
+    )
+    _status_localized: ListenerLocalizedStatus | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+        metadata=field_options(serialize="omit"),
+    )
+
+    def __post_init__(self) -> None:
+        """Perform post-init initialization."""
+        object.__setattr__(self, "kind", get_listener_kind(self.definition_id))
+
+    def __post_serialize__(self, d: dict[str, Any]) -> dict[str, Any]:
+        """Serialize the raw fields under the keys that ``Listener`` uses.
+
+        Args:
+        ----
+            d: The serialized listener.
+
+        Returns:
+        -------
+            The serialized listener with the raw fields renamed.
+
+        """
+        return {_LAZY_SERIALIZED_KEYS.get(key, key): value for key, value in d.items()}
+
+    @property
+    def configuration(self) -> dict[str, Any]:
+        """Return the listener's configuration."""
+        return cast(dict[str, Any], self.raw_configuration)
+
+    @property
+    def created_at(self) -> datetime:
+        """Return when the listener was created."""
+        if self._created_at is None:
+            object.__setattr__(
+                self, "_created_at", ciso8601.parse_datetime(self.raw_created_at)
+            )
+        return cast(datetime, self._created_at)
+
+    @property
+    def status_localized(self) -> ListenerLocalizedStatus:
+        """Return the listener's localized status."""
+        if self._status_localized is None:
+            object.__setattr__(
+                self,
+                "_status_localized",
+                _LOCALIZED_STATUSES.get(self.raw_status_localized),
+            )
+        return cast(ListenerLocalizedStatus, self._status_localized)
 
 
 @dataclass(frozen=True, kw_only=True)
-class ListenerAllResponse(DataClassDictMixin):
+class ListenerAllResponse(NotionBaseModel):
     """Define an API response containing all listeners."""
 
     listeners: list[Listener]
 
 
 @dataclass(frozen=True, kw_only=True)
-class ListenerDefinition(DataClassDictMixin):
+class LazyListenerAllResponse(NotionBaseModel):
+    """Define an API response containing all (lazily parsed) listeners."""
+
+    listeners: list[LazyListener]
+
+
+@dataclass(frozen=True, kw_only=True)
+class ListenerDefinition(NotionBaseModel):
     """Define an API response containing all listener definitions."""
 
     id: int
@@ -121,7 +282,7 @@ class ListenerDefinition(DataClassDictMixin):
 
 
 @dataclass(frozen=True, kw_only=True)
-class ListenerDefinitionResponse(DataClassDictMixin):
+class ListenerDefinitionResponse(NotionBaseModel):
     """Define an API response containing all listener definitions."""
 
     listener_definitions: list[ListenerDefinition]
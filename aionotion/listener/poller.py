@@ -0,0 +1,155 @@
+"""Define an incremental poller for listeners."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from aionotion.listener.index import ListenerIndex
+from aionotion.listener.models import Listener
+
+if TYPE_CHECKING:
+    from aionotion.client import Client
+
+DEFAULT_POLL_INTERVAL = 60
+
+
+@dataclass(frozen=True, kw_only=True)
+class ListenerChanges:
+    """Define the listeners that changed between two polls."""
+
+    added: list[Listener] = field(default_factory=list)
+    changed: list[Listener] = field(default_factory=list)
+    removed: list[Listener] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        """Return whether anything changed.
+
+        Returns
+        -------
+            Whether any listener was added, changed, or removed.
+
+        """
+        return bool(self.added or self.changed or self.removed)
+
+
+def listener_has_changed(old: Listener, new: Listener) -> bool:
+    """Return whether a listener's primary insight has changed.
+
+    Args:
+    ----
+        old: The previous version of the listener.
+        new: The current version of the listener.
+
+    Returns:
+    -------
+        Whether the listener has changed.
+
+    """
+    old_primary = old.insights.primary
+    new_primary = new.insights.primary
+    return (
+        old_primary.value != new_primary.value
+        or old_primary.data_received_at != new_primary.data_received_at
+    )
+
+
+class ListenerPoller:
+    """Define an object that polls listeners and reports only what changed.
+
+    The first poll reports every listener as added; every subsequent poll reports the
+    listeners that were added, removed, or whose primary insight (value or time of
+    receipt) changed since the previous poll.
+    """
+
+    def __init__(
+        self, client: Client, *, interval: float = DEFAULT_POLL_INTERVAL
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            client: The aionotion client
+            interval: The number of seconds to wait between polls when iterating.
+
+        """
+        self._client = client
+        self._index = ListenerIndex()
+        self._interval = interval
+        self._last_response: list[Listener] | None = None
+        self._listeners: dict[str, Listener] = {}
+
+    def __aiter__(self) -> AsyncIterator[ListenerChanges]:
+        """Poll forever, yielding only the polls in which something changed.
+
+        Returns
+        -------
+            An async iterator of listener changes.
+
+        """
+        return self._async_iter_changes()
+
+    @property
+    def index(self) -> ListenerIndex:
+        """Return an index of the listeners seen in the most recent poll.
+
+        The index is updated incrementally with every poll; sensors can be added to it
+        (via ``update_sensors()``) to look listeners up by system.
+        """
+        return self._index
+
+    @property
+    def listeners(self) -> Mapping[str, Listener]:
+        """Return the listeners seen in the most recent poll (keyed by ID)."""
+        return MappingProxyType(self._listeners)
+
+    async def _async_iter_changes(self) -> AsyncIterator[ListenerChanges]:
+        """Poll forever, yielding only the polls in which something changed.
+
+        Yields
+        ------
+            Listener changes.
+
+        """
+        while True:
+            if changes := await self.async_poll():
+                yield changes
+            await asyncio.sleep(self._interval)
+
+    async def async_poll(self) -> ListenerChanges:
+        """Poll listeners once and return what changed since the previous poll.
+
+        Returns
+        -------
+            The listeners that were added, changed, or removed.
+
+        """
+        response = await self._client.listener.async_all()
+
+        # An unmodified (revalidated) response is the very same list as last time:
+        if response is self._last_response:
+            return ListenerChanges()
+        self._last_response = response
+
+        previous = self._listeners
+        current = {listener.id: listener for listener in response}
+        changes = ListenerChanges()
+
+        for listener_id, listener in current.items():
+            if (old := previous.get(listener_id)) is None:
+                changes.added.append(listener)
+            elif listener_has_changed(old, listener):
+                changes.changed.append(listener)
+
+        changes.removed.extend(
+            listener
+            for listener_id, listener in previous.items()
+            if listener_id not in current
+        )
+
+        self._listeners = current
+        self._index.apply(changes)
+        return changes
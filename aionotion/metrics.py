@@ -0,0 +1,75 @@
+"""Define per-request metrics."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import time
+
+
+@dataclass(frozen=True, kw_only=True)
+class RequestMetrics:
+    """Define how long each stage of an API request took.
+
+    All durations are in seconds. ``latency`` covers the entire request (from waiting
+    on an access token refresh through validating the response); whatever remains of
+    it once the other stages are subtracted was spent on the network (including any
+    waits between the request's ``attempts``). When responses
+    are decoded straight into models, decoding and validation happen in a single pass
+    that is reported as ``validation_time``.
+    """
+
+    method: str
+    endpoint: str
+    status: int | None
+    latency: float
+    bytes_received: int
+    refresh_wait: float
+    decode_time: float
+    validation_time: float
+    attempts: int = 1
+    error: Exception | None = None
+
+    @property
+    def success(self) -> bool:
+        """Return whether the request succeeded."""
+        return self.error is None
+
+
+@dataclass(kw_only=True, slots=True)
+class RequestTrace:
+    """Define the metrics of an API request as they're collected."""
+
+    method: str
+    endpoint: str
+    started_at: float = field(default_factory=time.perf_counter)
+    status: int | None = None
+    bytes_received: int = 0
+    refresh_wait: float = 0.0
+    decode_time: float = 0.0
+    validation_time: float = 0.0
+    attempts: int = 0
+
+    def finish(self, error: Exception | None = None) -> RequestMetrics:
+        """Return the final metrics of the request.
+
+        Args:
+        ----
+            error: The error that the request raised (if any).
+
+        Returns:
+        -------
+            The request's metrics.
+
+        """
+        return RequestMetrics(
+            method=self.method,
+            endpoint=self.endpoint,
+            status=self.status,
+            latency=time.perf_counter() - self.started_at,
+            bytes_received=self.bytes_received,
+            refresh_wait=self.refresh_wait,
+            decode_time=self.decode_time,
+            validation_time=self.validation_time,
+            attempts=self.attempts,
+            error=error,
+        )
@@ -0,0 +1,26 @@
+"""Define the base model for API responses."""
+
+from __future__ import annotations
+
+from mashumaro import DataClassDictMixin
+from mashumaro.config import BaseConfig
+
+
+class NotionBaseModel(DataClassDictMixin):
+    """Define a base model for API responses.
+
+    mashumaro normally compiles each model's ``from_dict()``/``to_dict()`` when the
+    model class is created (i.e., at import time); models built on this base compile
+    them the first time they're called instead, so models that are never used (and
+    every model, until it's first used) cost nothing at startup.
+
+    The base (like mashumaro's mixin) declares no instance attributes, so models may be
+    slotted.
+    """
+
+    __slots__ = ()
+
+    class Config(BaseConfig):  # pylint: disable=too-few-public-methods
+        """Define the mashumaro configuration."""
+
+        lazy_compilation = True
@@ -0,0 +1,261 @@
+"""Define a pool of clients for many accounts."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from typing import Any, Self
+
+from aiohttp import ClientSession
+
+from aionotion.client import (
+    DEFAULT_CONNECTION_LIMIT,
+    DEFAULT_CONNECTION_LIMIT_PER_HOST,
+    Client,
+    create_pooled_session,
+)
+from aionotion.refresh import TokenRefreshScheduler
+
+DEFAULT_MAX_CONCURRENT_REQUESTS = 50
+
+# Client arguments that the pool sets itself (so that its clients share resources):
+POOL_MANAGED_CLIENT_KWARGS = frozenset(
+    {"refresh_scheduler", "request_limiter", "session_name"}
+)
+
+
+class ClientPool:
+    """Define an object that manages authenticated clients for many accounts.
+
+    Every client in the pool keeps its own tokens, user UUID, and callbacks, but all of
+    them share a single connection pool, a single limit on the number of requests in
+    flight, and a single background token refresh scheduler.
+    """
+
+    def __init__(
+        self,
+        *,
+        session: ClientSession | None = None,
+        connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+        connection_limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        background_refresh: bool = True,
+        **client_kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            session: An optional aiohttp ClientSession to share among all clients.
+            connection_limit: The maximum number of simultaneous connections held by
+                the pool-owned session (ignored if ``session`` is provided).
+            connection_limit_per_host: The maximum number of simultaneous connections
+                to a single host held by the pool-owned session (ignored if
+                ``session`` is provided).
+            max_concurrent_requests: The maximum number of requests that may be in
+                flight at once across all clients.
+            background_refresh: Whether to refresh each client's access token in the
+                background before it expires.
+            **client_kwargs: Additional keyword arguments to create every client with
+                (e.g., ``api_base``, ``retry_policy``, or ``cache_ttls``).
+
+        Raises:
+        ------
+            TypeError: Raised upon a client argument that the pool sets itself.
+
+        """
+        if managed := sorted(POOL_MANAGED_CLIENT_KWARGS.intersection(client_kwargs)):
+            msg = f"Client arguments are set by the pool: {', '.join(managed)}"
+            raise TypeError(msg)
+
+        self._client_kwargs = client_kwargs
+        self._clients: dict[str, Client] = {}
+        self._connection_limit = connection_limit
+        self._connection_limit_per_host = connection_limit_per_host
+        self._owned_session: ClientSession | None = None
+        self._refresh_scheduler = (
+            TokenRefreshScheduler() if background_refresh else None
+        )
+        self._request_limiter = asyncio.Semaphore(max_concurrent_requests)
+        self._session = session
+
+    async def __aenter__(self) -> Self:
+        """Enter the pool's async context.
+
+        Returns
+        -------
+            This pool.
+
+        """
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Exit the pool's async context.
+
+        Args:
+        ----
+            exc_info: Information about an exception raised within the context.
+
+        """
+        await self.async_close()
+
+    def __contains__(self, user_uuid: object) -> bool:
+        """Return whether the pool has a client for a user.
+
+        Args:
+        ----
+            user_uuid: The UUID of the user.
+
+        Returns:
+        -------
+            Whether the pool has a client for the user.
+
+        """
+        return user_uuid in self._clients
+
+    def __getitem__(self, user_uuid: str) -> Client:
+        """Return the client for a user.
+
+        Args:
+        ----
+            user_uuid: The UUID of the user.
+
+        Returns:
+        -------
+            The user's client.
+
+        """
+        return self._clients[user_uuid]
+
+    def __iter__(self) -> Iterator[Client]:
+        """Iterate over all clients in the pool.
+
+        Returns
+        -------
+            An iterator of clients.
+
+        """
+        return iter(self._clients.values())
+
+    def __len__(self) -> int:
+        """Return the number of clients in the pool.
+
+        Returns
+        -------
+            The number of clients in the pool.
+
+        """
+        return len(self._clients)
+
+    def _create_client(self, session_name: str | None) -> Client:
+        """Create a client that shares the pool's resources.
+
+        Args:
+        ----
+            session_name: An optional session name to use for authentication.
+
+        Returns:
+        -------
+            An (unauthenticated) client.
+
+        """
+        if self._session and not self._session.closed:
+            session = self._session
+        else:
+            if not self._owned_session or self._owned_session.closed:
+                self._owned_session = create_pooled_session(
+                    connection_limit=self._connection_limit,
+                    connection_limit_per_host=self._connection_limit_per_host,
+                )
+            session = self._owned_session
+
+        return Client(
+            session=session,
+            refresh_scheduler=self._refresh_scheduler,
+            request_limiter=self._request_limiter,
+            session_name=session_name,
+            **self._client_kwargs,
+        )
+
+    async def async_add_client_with_credentials(
+        self, email: str, password: str, *, session_name: str | None = None
+    ) -> Client:
+        """Add an authenticated client to the pool (using username/password).
+
+        Args:
+        ----
+            email: The email address of a Notion account.
+            password: The account password.
+            session_name: An optional session name to use for authentication.
+
+        Returns:
+        -------
+            An authenticated Client object.
+
+        """
+        client = self._create_client(session_name)
+        await client.async_authenticate_from_credentials(email, password)
+        await self._async_add_client(client)
+        return client
+
+    async def async_add_client_with_refresh_token(
+        self,
+        user_uuid: str,
+        refresh_token: str,
+        *,
+        session_name: str | None = None,
+    ) -> Client:
+        """Add an authenticated client to the pool (using a refresh token).
+
+        Args:
+        ----
+            user_uuid: The UUID of the user.
+            refresh_token: A refresh token.
+            session_name: An optional session name to use for authentication.
+
+        Returns:
+        -------
+            An authenticated Client object.
+
+        """
+        client = self._create_client(session_name)
+        client.user_uuid = user_uuid
+        await client.async_authenticate_from_refresh_token(refresh_token=refresh_token)
+        await self._async_add_client(client)
+        return client
+
+    async def _async_add_client(self, client: Client) -> None:
+        """Add an authenticated client to the pool, replacing any existing one.
+
+        Args:
+        ----
+            client: The client to add.
+
+        """
+        if existing := self._clients.get(client.user_uuid):
+            await existing.async_close()
+        self._clients[client.user_uuid] = client
+
+    async def async_remove_client(self, user_uuid: str) -> None:
+        """Remove (and close) the client for a user.
+
+        Args:
+        ----
+            user_uuid: The UUID of the user.
+
+        """
+        if client := self._clients.pop(user_uuid, None):
+            await client.async_close()
+
+    async def async_close(self) -> None:
+        """Close every client in the pool, along with the resources they share."""
+        for client in self._clients.values():
+            await client.async_close()
+        self._clients.clear()
+
+        if self._refresh_scheduler:
+            await self._refresh_scheduler.async_close()
+
+        if self._owned_session and not self._owned_session.closed:
+            await self._owned_session.close()
+        self._owned_session = None
@@ -0,0 +1,150 @@
+"""Define background access token refreshing."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import random
+from typing import TYPE_CHECKING
+
+from aionotion.const import LOGGER
+from aionotion.errors import InvalidCredentialsError
+from aionotion.util.dt import utcnow
+
+if TYPE_CHECKING:
+    from aionotion.client import Client
+
+DEFAULT_REFRESH_JITTER = 30
+DEFAULT_REFRESH_RETRY_INTERVAL = 30
+
+
+@dataclass(frozen=True, kw_only=True)
+class RefreshResult:
+    """Define the outcome of an access token refresh."""
+
+    latency: float
+    error: Exception | None = None
+
+    @property
+    def success(self) -> bool:
+        """Return whether the refresh succeeded."""
+        return self.error is None
+
+
+class TokenRefreshScheduler:
+    """Define an object that refreshes access tokens in the background.
+
+    Each scheduled client has its access token refreshed shortly before it expires
+    (minus a random jitter, so that many clients don't all refresh at once); as a
+    result, user-facing requests don't have to pay for the refresh inline.
+    """
+
+    def __init__(
+        self,
+        *,
+        jitter: float = DEFAULT_REFRESH_JITTER,
+        retry_interval: float = DEFAULT_REFRESH_RETRY_INTERVAL,
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            jitter: The maximum number of seconds by which a refresh is randomly
+                brought forward.
+            retry_interval: The number of seconds to wait before retrying a failed
+                refresh.
+
+        """
+        self._handles: dict[Client, asyncio.TimerHandle] = {}
+        self._jitter = jitter
+        self._retry_interval = retry_interval
+        self._tasks: dict[Client, asyncio.Task[None]] = {}
+
+    def _start_refresh(self, client: Client) -> None:
+        """Start a background refresh for a client.
+
+        Args:
+        ----
+            client: The client to refresh.
+
+        """
+        self._handles.pop(client, None)
+        task = asyncio.create_task(self._async_refresh(client))
+        self._tasks[client] = task
+
+        def _remove_task(_: asyncio.Task[None]) -> None:
+            """Forget the task once it's done."""
+            if self._tasks.get(client) is task:
+                self._tasks.pop(client)
+
+        task.add_done_callback(_remove_task)
+
+    async def _async_refresh(self, client: Client) -> None:
+        """Refresh a client's access token.
+
+        On success, the client reschedules itself (once it saves the new tokens). If the
+        refresh token is rejected, the client is no longer refreshed (the failure is
+        reported via the client's refresh result callbacks); upon any other failure,
+        the refresh is retried after the retry interval.
+
+        Args:
+        ----
+            client: The client to refresh.
+
+        """
+        try:
+            await client._async_refresh_access_token()  # noqa: SLF001
+        except InvalidCredentialsError:
+            return
+        except Exception as err:  # noqa: BLE001  # pylint: disable=broad-exception-caught
+            LOGGER.warning("Background access token refresh failed: %s", err)
+            self._handles[client] = asyncio.get_running_loop().call_later(
+                self._retry_interval, self._start_refresh, client
+            )
+
+    def schedule(self, client: Client) -> None:
+        """Schedule (or reschedule) a background refresh for a client.
+
+        Args:
+        ----
+            client: The client to refresh.
+
+        """
+        if handle := self._handles.pop(client, None):
+            handle.cancel()
+
+        if not (expires_at := client._access_token_expires_at):  # noqa: SLF001
+            return
+
+        delay = (
+            (expires_at - client._refresh_margin - utcnow()).total_seconds()  # noqa: SLF001
+            - random.uniform(0, self._jitter)  # noqa: S311
+        )
+        self._handles[client] = asyncio.get_running_loop().call_later(
+            max(delay, 0), self._start_refresh, client
+        )
+
+    def unschedule(self, client: Client) -> None:
+        """Stop refreshing a client in the background.
+
+        Args:
+        ----
+            client: The client to stop refreshing.
+
+        """
+        if handle := self._handles.pop(client, None):
+            handle.cancel()
+        if task := self._tasks.pop(client, None):
+            task.cancel()
+
+    async def async_close(self) -> None:
+        """Stop all background refreshes."""
+        for handle in self._handles.values():
+            handle.cancel()
+        self._handles.clear()
+
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,78 @@
+"""Define retrying of failed requests."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import random
+
+from aiohttp import ClientConnectionError, ClientPayloadError
+
+from aionotion.errors import RateLimitError, ServerError
+
+DEFAULT_RETRY_BACKOFF = 0.5
+DEFAULT_RETRY_DEADLINE = 30.0
+DEFAULT_RETRY_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_MAX_BACKOFF = 10.0
+
+# The errors that a retry might resolve:
+RETRYABLE_ERRORS = (
+    ClientConnectionError,
+    ClientPayloadError,
+    RateLimitError,
+    ServerError,
+    TimeoutError,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class RetryPolicy:
+    """Define how requests that fail transiently are retried.
+
+    Only requests made with one of ``methods`` are retried (by default, only GETs, since
+    they're idempotent), and only upon a connection error, a timeout, a rate limit, or a
+    server error. Each retry waits for a random ("full jitter") fraction of an
+    exponentially growing backoff (or for as long as a rate-limited response asks, if
+    that's longer); a request is never retried once the next attempt would start after
+    the deadline.
+    """
+
+    max_attempts: int = DEFAULT_RETRY_MAX_ATTEMPTS
+    backoff: float = DEFAULT_RETRY_BACKOFF
+    max_backoff: float = DEFAULT_RETRY_MAX_BACKOFF
+    deadline: float | None = DEFAULT_RETRY_DEADLINE
+    methods: frozenset[str] = frozenset({"get"})
+
+    def get_delay(
+        self, method: str, attempt: int, elapsed: float, error: Exception
+    ) -> float | None:
+        """Return how long to wait before retrying a failed request.
+
+        Args:
+        ----
+            method: The HTTP method of the request.
+            attempt: The number of attempts made so far.
+            elapsed: The number of seconds since the first attempt began.
+            error: The error that the last attempt raised.
+
+        Returns:
+        -------
+            The number of seconds to wait (or None if the request shouldn't be
+            retried).
+
+        """
+        if (
+            method.lower() not in self.methods
+            or attempt >= self.max_attempts
+            or not isinstance(error, RETRYABLE_ERRORS)
+        ):
+            return None
+
+        delay = random.uniform(  # noqa: S311
+            0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        )
+        if isinstance(error, RateLimitError) and error.retry_after is not None:
+            delay = max(delay, error.retry_after)
+
+        if self.deadline is not None and elapsed + delay > self.deadline:
+            return None
+        return delay
@@ -0,0 +1,245 @@
+"""Define an adaptive scheduler for polling the API."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from enum import StrEnum
+import random
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import ClientError
+
+from aionotion.const import LOGGER
+from aionotion.errors import NotionError, RateLimitError
+
+if TYPE_CHECKING:
+    from aionotion.client import Client
+
+DEFAULT_BACKOFF_FACTOR = 2
+DEFAULT_INTERVAL_DECREASE_FACTOR = 0.5
+DEFAULT_INTERVAL_INCREASE_FACTOR = 1.5
+DEFAULT_MAX_BACKOFF = 900
+DEFAULT_MAX_POLL_INTERVAL = 600
+DEFAULT_MIN_POLL_INTERVAL = 30
+DEFAULT_POLL_INTERVAL = 60
+DEFAULT_POLL_JITTER = 0.1
+
+PollCallbackT = Callable[[Sequence[Any]], None]
+
+
+class PollTarget(StrEnum):
+    """Define the endpoints that can be polled."""
+
+    BRIDGES = "bridge"
+    LISTENERS = "listener"
+    SENSORS = "sensor"
+
+
+@dataclass(kw_only=True)
+class PollJob:
+    """Define the state of a single, periodically polled endpoint."""
+
+    client: Client
+    target: PollTarget
+    callback: PollCallbackT
+    interval: float
+    failures: int = 0
+    last_result: Sequence[Any] | None = None
+    task: asyncio.Task[None] | None = None
+
+
+class PollScheduler:
+    """Define an object that periodically polls endpoints for many clients.
+
+    Each job's interval adapts to how often its data changes: it shrinks (down to the
+    minimum interval) whenever a poll returns new data and grows (up to the maximum
+    interval) whenever it doesn't. Failed polls are retried with exponential backoff
+    (honoring the API's Retry-After when rate-limited), and every job starts at a
+    random offset so that polls for many accounts are spread out over time.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+        max_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        jitter: float = DEFAULT_POLL_JITTER,
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            min_interval: The minimum number of seconds between polls of a job.
+            max_interval: The maximum number of seconds between polls of a job.
+            max_backoff: The maximum number of seconds to back off after failures.
+            jitter: The fraction by which each delay is randomly varied.
+
+        """
+        self._jitter = jitter
+        self._jobs: list[PollJob] = []
+        self._max_backoff = max_backoff
+        self._max_interval = max_interval
+        self._min_interval = min_interval
+        self._running = False
+
+    def _get_backoff(self, job: PollJob) -> float:
+        """Return how long to wait after a job's most recent failure.
+
+        Args:
+        ----
+            job: The failing job.
+
+        Returns:
+        -------
+            The number of seconds to wait.
+
+        """
+        return min(
+            job.interval * float(DEFAULT_BACKOFF_FACTOR ** (job.failures - 1)),
+            self._max_backoff,
+        )
+
+    def _get_jittered(self, delay: float) -> float:
+        """Return a delay that has been randomly varied.
+
+        Args:
+        ----
+            delay: The number of seconds to vary.
+
+        Returns:
+        -------
+            The varied number of seconds.
+
+        """
+        return delay * random.uniform(1 - self._jitter, 1 + self._jitter)  # noqa: S311
+
+    def _start_job(self, job: PollJob) -> None:
+        """Start polling a job.
+
+        Args:
+        ----
+            job: The job to start.
+
+        """
+        job.task = asyncio.create_task(self._async_run_job(job))
+
+    async def _async_poll_job(self, job: PollJob) -> float:
+        """Poll a job once.
+
+        Args:
+        ----
+            job: The job to poll.
+
+        Returns:
+        -------
+            The number of seconds to wait before polling the job again.
+
+        """
+        try:
+            result = await getattr(job.client, job.target).async_all()
+        except RateLimitError as err:
+            job.failures += 1
+            LOGGER.warning("Rate limited while polling %s: %s", job.target, err)
+            if err.retry_after is not None:
+                return err.retry_after
+            return self._get_jittered(self._get_backoff(job))
+        except (ClientError, NotionError, TimeoutError) as err:
+            job.failures += 1
+            LOGGER.warning("Error while polling %s: %s", job.target, err)
+            return self._get_jittered(self._get_backoff(job))
+
+        job.failures = 0
+
+        if result == job.last_result:
+            job.interval = min(
+                job.interval * DEFAULT_INTERVAL_INCREASE_FACTOR, self._max_interval
+            )
+        else:
+            job.interval = max(
+                job.interval * DEFAULT_INTERVAL_DECREASE_FACTOR, self._min_interval
+            )
+            job.last_result = result
+            try:
+                job.callback(result)
+            except Exception:  # noqa: BLE001  # pylint: disable=broad-exception-caught
+                # A misbehaving callback shouldn't stop the job from being polled:
+                LOGGER.exception("Error in callback for %s", job.target)
+
+        return self._get_jittered(job.interval)
+
+    async def _async_run_job(self, job: PollJob) -> None:
+        """Poll a job until it is stopped.
+
+        Args:
+        ----
+            job: The job to poll.
+
+        """
+        # Start at a random point within the first interval so that jobs added at the
+        # same time don't all poll at the same time:
+        await asyncio.sleep(random.uniform(0, job.interval))  # noqa: S311
+
+        while True:
+            delay = await self._async_poll_job(job)
+            await asyncio.sleep(delay)
+
+    def add(
+        self,
+        client: Client,
+        target: PollTarget,
+        callback: PollCallbackT,
+        *,
+        interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> Callable[[], None]:
+        """Add an endpoint to poll.
+
+        Args:
+        ----
+            client: The client to poll with.
+            target: The endpoint to poll.
+            callback: A callback to call with the endpoint's data whenever it changes.
+            interval: The initial number of seconds between polls.
+
+        Returns:
+        -------
+            A callable that removes the endpoint from the scheduler.
+
+        """
+        job = PollJob(
+            client=client,
+            target=target,
+            callback=callback,
+            interval=min(max(interval, self._min_interval), self._max_interval),
+        )
+        self._jobs.append(job)
+        if self._running:
+            self._start_job(job)
+
+        def remove() -> None:
+            """Stop polling the endpoint."""
+            if job.task:
+                job.task.cancel()
+            self._jobs.remove(job)
+
+        return remove
+
+    def start(self) -> None:
+        """Start polling all endpoints."""
+        if self._running:
+            return
+        self._running = True
+        for job in self._jobs:
+            self._start_job(job)
+
+    async def async_stop(self) -> None:
+        """Stop polling all endpoints."""
+        self._running = False
+        tasks = [job.task for job in self._jobs if job.task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for job in self._jobs:
+            job.task = None
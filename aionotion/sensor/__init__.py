@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterable
 from typing import TYPE_CHECKING
 
 from aionotion.sensor.models import (
@@ -9,6 +10,11 @@ from aionotion.sensor.models import (
     SensorAllResponse,
     SensorGetResponse,
 )
+from aionotion.util.batch import (
+    DEFAULT_BATCH_CONCURRENCY,
+    BatchErrorT,
+    async_gather_bounded,
+)
 
 if TYPE_CHECKING:
     from aionotion.client import Client
@@ -40,6 +46,16 @@ class Sensor:
         )
         return response.sensors
 
+    def async_iter_all(self) -> AsyncIterator[SensorModel]:
+        """Get all sensors, yielding each one as soon as it has been received.
+
+        Returns
+        -------
+            An async iterator of validated sensors.
+
+        """
+        return self._client.async_iter_and_validate("/sensors", "sensors", SensorModel)
+
     async def async_get(self, sensor_id: int) -> SensorModel:
         """Get a sensor by ID.
 
@@ -56,3 +72,26 @@ class Sensor:
             "get", f"/sensors/{sensor_id}", SensorGetResponse
         )
         return response.sensors
+
+    async def async_get_many(
+        self,
+        sensor_ids: Iterable[int],
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[SensorModel | BatchErrorT]:
+        """Get multiple sensors by ID, with bounded concurrency.
+
+        Args:
+        ----
+            sensor_ids: The IDs of the sensors to get.
+            concurrency: The maximum number of requests that may be in flight at once.
+
+        Returns:
+        -------
+            A list of sensors (in the same order as the IDs); a sensor that couldn't be
+            retrieved is represented by the error that occurred.
+
+        """
+        return await async_gather_bounded(
+            self.async_get, sensor_ids, concurrency=concurrency
+        )
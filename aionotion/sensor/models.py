@@ -4,28 +4,31 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
+import sys
 
 import ciso8601
-from mashumaro import DataClassDictMixin
 
+from aionotion.model import NotionBaseModel
+from aionotion.util.intern import FlyweightCache
 
-@dataclass(frozen=True, kw_only=True)
-class Bridge(DataClassDictMixin):
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class Bridge(NotionBaseModel):
     """Define a bridge representation."""
 
     id: int
     hardware_id: str
 
 
-@dataclass(frozen=True, kw_only=True)
-class Firmware(DataClassDictMixin):
+@dataclass(frozen=True, kw_only=True, slots=True)
+class Firmware(NotionBaseModel):
     """Define firmware information."""
 
     status: str
 
 
-@dataclass(frozen=True, kw_only=True)
-class SurfaceType(DataClassDictMixin):
+@dataclass(frozen=True, kw_only=True, slots=True)
+class SurfaceType(NotionBaseModel):
     """Define a surface type."""
 
     id: str
@@ -33,16 +36,20 @@ class SurfaceType(DataClassDictMixin):
     slug: str
 
 
-@dataclass(frozen=True, kw_only=True)
-class User(DataClassDictMixin):
+_FIRMWARES = FlyweightCache(Firmware)
+_SURFACE_TYPES = FlyweightCache(SurfaceType)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class User(NotionBaseModel):
     """Define a user representation."""
 
     id: int
     email: str
 
 
-@dataclass(frozen=True, kw_only=True)
-class Sensor(DataClassDictMixin):  # pylint: disable=too-many-instance-attributes
+@dataclass(frozen=True, kw_only=True, slots=True)
+class Sensor(NotionBaseModel):  # pylint: disable=too-many-instance-attributes
     """Define a sensor."""
 
     id: int
@@ -55,7 +62,7 @@ class Sensor(DataClassDictMixin):  # pylint: disable=too-many-instance-attribute
     system_id: int
     hardware_id: str
     hardware_revision: int
-    firmware_version: str
+    firmware_version: str = field(metadata={"deserialize": sys.intern})
     device_key: str
     encryption_key: bool
     installed_at: datetime | None = field(
@@ -73,19 +80,21 @@ class Sensor(DataClassDictMixin):  # pylint: disable=too-many-instance-attribute
     updated_at: datetime = field(metadata={"deserialize": ciso8601.parse_datetime})
     created_at: datetime = field(metadata={"deserialize": ciso8601.parse_datetime})
     signal_strength: int
-    firmware: Firmware
-    surface_type: SurfaceType | None
+    firmware: Firmware = field(metadata={"deserialize": _FIRMWARES.get})
+    surface_type: SurfaceType | None = field(
+        metadata={"deserialize": _SURFACE_TYPES.get}
+    )
 
 
 @dataclass(frozen=True, kw_only=True)
-class SensorAllResponse(DataClassDictMixin):
+class SensorAllResponse(NotionBaseModel):
     """Define an API response containing all sensors."""
 
     sensors: list[Sensor]
 
 
 @dataclass(frozen=True, kw_only=True)
-class SensorGetResponse(DataClassDictMixin):
+class SensorGetResponse(NotionBaseModel):
     """Define an API response containing a single sensor."""
 
     sensors: Sensor
@@ -0,0 +1,120 @@
+"""Define a point-in-time snapshot of an entire account."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import cached_property
+from types import MappingProxyType
+
+from aionotion.bridge.models import Bridge
+from aionotion.graph import EntityGraph
+from aionotion.listener.models import Listener, ListenerDefinition
+from aionotion.sensor.models import Sensor
+from aionotion.system.models import System
+from aionotion.user.models import User, UserPreferences
+
+
+@dataclass(frozen=True, kw_only=True)
+class Snapshot:
+    """Define an immutable, cross-indexed snapshot of an account."""
+
+    bridges: tuple[Bridge, ...]
+    sensors: tuple[Sensor, ...]
+    listeners: tuple[Listener, ...]
+    listener_definitions: tuple[ListenerDefinition, ...]
+    systems: tuple[System, ...]
+    user: User
+    user_preferences: UserPreferences
+
+    bridges_by_id: Mapping[int, Bridge] = field(init=False, repr=False)
+    listener_definitions_by_id: Mapping[int, ListenerDefinition] = field(
+        init=False, repr=False
+    )
+    listeners_by_id: Mapping[str, Listener] = field(init=False, repr=False)
+    sensors_by_id: Mapping[int, Sensor] = field(init=False, repr=False)
+    sensors_by_uuid: Mapping[str, Sensor] = field(init=False, repr=False)
+    systems_by_id: Mapping[int, System] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Perform post-init initialization."""
+        for name, index in (
+            ("bridges_by_id", {bridge.id: bridge for bridge in self.bridges}),
+            (
+                "listener_definitions_by_id",
+                {definition.id: definition for definition in self.listener_definitions},
+            ),
+            ("listeners_by_id", {listener.id: listener for listener in self.listeners}),
+            ("sensors_by_id", {sensor.id: sensor for sensor in self.sensors}),
+            ("sensors_by_uuid", {sensor.uuid: sensor for sensor in self.sensors}),
+            ("systems_by_id", {system.id: system for system in self.systems}),
+        ):
+            object.__setattr__(self, name, MappingProxyType(index))
+
+    @cached_property
+    def graph(self) -> EntityGraph:
+        """Return a graph that links the snapshot's entities (built upon first use)."""
+        return EntityGraph(
+            systems=self.systems,
+            bridges=self.bridges,
+            sensors=self.sensors,
+            listeners=self.listeners,
+        )
+
+    def get_bridge_for_sensor(self, sensor: Sensor) -> Bridge | None:
+        """Return the bridge that a sensor is connected to.
+
+        Args:
+        ----
+            sensor: A sensor from this snapshot.
+
+        Returns:
+        -------
+            The sensor's bridge (if it's part of this snapshot).
+
+        """
+        return self.bridges_by_id.get(sensor.bridge.id)
+
+    def get_definition_for_listener(
+        self, listener: Listener
+    ) -> ListenerDefinition | None:
+        """Return the definition of a listener.
+
+        Args:
+        ----
+            listener: A listener from this snapshot.
+
+        Returns:
+        -------
+            The listener's definition (if it's part of this snapshot).
+
+        """
+        return self.listener_definitions_by_id.get(listener.definition_id)
+
+    def get_sensor_for_listener(self, listener: Listener) -> Sensor | None:
+        """Return the sensor that a listener is monitoring.
+
+        Args:
+        ----
+            listener: A listener from this snapshot.
+
+        Returns:
+        -------
+            The listener's sensor (if it's part of this snapshot).
+
+        """
+        return self.sensors_by_uuid.get(listener.sensor_id)
+
+    def get_system_for_sensor(self, sensor: Sensor) -> System | None:
+        """Return the system that a sensor belongs to.
+
+        Args:
+        ----
+            sensor: A sensor from this snapshot.
+
+        Returns:
+        -------
+            The sensor's system (if it's part of this snapshot).
+
+        """
+        return self.systems_by_id.get(sensor.system_id)
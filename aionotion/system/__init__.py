@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
+from aionotion.cache import CachedEndpoint
 from aionotion.system.models import (
     System as SystemModel,
     SystemAllResponse,
     SystemGetResponse,
 )
+from aionotion.util.batch import (
+    DEFAULT_BATCH_CONCURRENCY,
+    BatchErrorT,
+    async_gather_bounded,
+)
 
 if TYPE_CHECKING:
     from aionotion.client import Client
@@ -36,7 +43,7 @@ class System:
 
         """
         response: SystemAllResponse = await self._client.async_request_and_validate(
-            "get", "/systems", SystemAllResponse
+            "get", "/systems", SystemAllResponse, cache=CachedEndpoint.SYSTEMS
         )
         return response.systems
 
@@ -56,3 +63,26 @@ class System:
             "get", f"/systems/{system_id}", SystemGetResponse
         )
         return response.systems
+
+    async def async_get_many(
+        self,
+        system_ids: Iterable[int],
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[SystemModel | BatchErrorT]:
+        """Get multiple systems by ID, with bounded concurrency.
+
+        Args:
+        ----
+            system_ids: The IDs of the systems to get.
+            concurrency: The maximum number of requests that may be in flight at once.
+
+        Returns:
+        -------
+            A list of systems (in the same order as the IDs); a system that couldn't be
+            retrieved is represented by the error that occurred.
+
+        """
+        return await async_gather_bounded(
+            self.async_get, system_ids, concurrency=concurrency
+        )
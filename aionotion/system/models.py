@@ -6,11 +6,12 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 import ciso8601
-from mashumaro import DataClassDictMixin
+
+from aionotion.model import NotionBaseModel
 
 
 @dataclass(frozen=True, kw_only=True)
-class System(DataClassDictMixin):
+class System(NotionBaseModel):
     """Define a system."""
 
     uuid: str
@@ -38,14 +39,14 @@ class System(DataClassDictMixin):
 
 
 @dataclass(frozen=True, kw_only=True)
-class SystemAllResponse(DataClassDictMixin):
+class SystemAllResponse(NotionBaseModel):
     """Define an API response containing all systems."""
 
     systems: list[System]
 
 
 @dataclass(frozen=True, kw_only=True)
-class SystemGetResponse(DataClassDictMixin):
+class SystemGetResponse(NotionBaseModel):
     """Define an API response containing a single system."""
 
     systems: System
@@ -0,0 +1,9 @@
+"""Define utilities for testing against a fake Notion API."""
+
+from .data import (
+    DEFAULT_FAKE_EMAIL,  # noqa: F401
+    DEFAULT_FAKE_PASSWORD,  # noqa: F401
+    FakeAccount,  # noqa: F401
+    generate_account,  # noqa: F401
+)
+from .server import FakeNotionServer  # noqa: F401
@@ -0,0 +1,263 @@
+"""Define synthetic Notion account data."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from aionotion.util.dt import utc_from_timestamp
+
+DEFAULT_FAKE_EMAIL = "user@example.com"
+DEFAULT_FAKE_PASSWORD = "password"  # noqa: S105
+
+# The definitions of the kinds of listener that are placed on synthetic sensors (in
+# order), as (ID, name, conflict type, type):
+_LISTENER_DEFINITIONS = (
+    (3, "temperature", "temperature", "sensor"),
+    (4, "leak", "probe", "sensor"),
+    (0, "battery", "battery", "sensor"),
+    (10, "connection", "connection", "sensor"),
+    (6, "door", "motion", "sensor"),
+    (7, "alarm", "sound", "sensor"),
+    (2, "mold", "mold", "sensor"),
+    (24, "firmware", "firmware", "sensor"),
+)
+
+# Every synthetic timestamp is based on the same moment, so that accounts are
+# reproducible:
+_EPOCH = utc_from_timestamp(1704067200)
+
+
+def _timestamp(offset: float = 0) -> str:
+    """Return an API-formatted timestamp a number of seconds after the epoch.
+
+    Args:
+    ----
+        offset: The number of seconds after the epoch.
+
+    Returns:
+    -------
+        The timestamp.
+
+    """
+    moment: datetime = _EPOCH + timedelta(seconds=offset)
+    return moment.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _uuid(kind: int, number: int) -> str:
+    """Return a deterministic UUID for an entity.
+
+    Args:
+    ----
+        kind: A number identifying the kind of entity.
+        number: The number of the entity among those of its kind.
+
+    Returns:
+    -------
+        The UUID.
+
+    """
+    return str(UUID(int=(kind << 64) + number))
+
+
+@dataclass(frozen=True, kw_only=True)
+class FakeAccount:
+    """Define the raw API payloads that make up a synthetic account."""
+
+    email: str
+    password: str
+    user: dict[str, Any]
+    user_preferences: dict[str, Any]
+    systems: list[dict[str, Any]]
+    bridges: list[dict[str, Any]]
+    sensors: list[dict[str, Any]]
+    listeners: list[dict[str, Any]]
+    listener_definitions: list[dict[str, Any]]
+
+
+def generate_account(
+    *,
+    systems: int = 1,
+    bridges_per_system: int = 1,
+    sensors_per_system: int = 5,
+    listeners_per_sensor: int = 3,
+    email: str = DEFAULT_FAKE_EMAIL,
+    password: str = DEFAULT_FAKE_PASSWORD,
+) -> FakeAccount:
+    """Generate a synthetic account of a given size.
+
+    Each system's sensors are spread evenly across its bridges; IDs, UUIDs, and
+    timestamps are deterministic.
+
+    Args:
+    ----
+        systems: The number of systems.
+        bridges_per_system: The number of bridges in each system.
+        sensors_per_system: The number of sensors in each system.
+        listeners_per_sensor: The number of listeners on each sensor (at most
+            one of each kind).
+        email: The email address of the account.
+        password: The password of the account.
+
+    Returns:
+    -------
+        The account.
+
+    """
+    user_id = 1
+    user = {
+        "id": user_id,
+        "uuid": _uuid(0, user_id),
+        "first_name": "Load",
+        "last_name": "Tester",
+        "email": email,
+        "phone_number": None,
+        "role": "user",
+        "organization": "Notion User",
+        "created_at": _timestamp(),
+        "updated_at": _timestamp(),
+    }
+    user_preferences = {
+        "user_id": user_id,
+        "military_time_enabled": False,
+        "celsius_enabled": False,
+        "disconnect_alerts_enabled": True,
+        "home_away_alerts_enabled": False,
+        "battery_alerts_enabled": True,
+    }
+    listener_definitions = [
+        {
+            "id": definition_id,
+            "name": name,
+            "conflict_type": conflict_type,
+            "priority": 50,
+            "hidden": False,
+            "conflicting_types": [],
+            "resources": None,
+            "compatible_hardware_revisions": [4, 5, 6],
+            "type": definition_type,
+        }
+        for definition_id, name, conflict_type, definition_type in _LISTENER_DEFINITIONS
+    ]
+
+    system_payloads: list[dict[str, Any]] = []
+    bridge_payloads: list[dict[str, Any]] = []
+    sensor_payloads: list[dict[str, Any]] = []
+    listener_payloads: list[dict[str, Any]] = []
+
+    for system_id in range(1, systems + 1):
+        system_payloads.append(
+            {
+                "uuid": _uuid(1, system_id),
+                "name": f"System {system_id}",
+                "mode": "home",
+                "partners": [],
+                "latitude": 40.0,
+                "longitude": -105.0,
+                "timezone_id": "America/Denver",
+                "created_at": _timestamp(system_id),
+                "updated_at": _timestamp(system_id),
+                "night_time_start": _timestamp(4 * 3600),
+                "night_time_end": _timestamp(13 * 3600),
+                "id": system_id,
+                "locality": "Anytown",
+                "postal_code": "00000",
+                "administrative_area": "CO",
+                "fire_number": "(555) 555-0100",
+                "police_number": "(555) 555-0100",
+                "emergency_number": "(555) 555-0100",
+                "address": None,
+                "notion_pro_permit": None,
+            }
+        )
+
+        system_bridges = []
+        for number in range(bridges_per_system):
+            bridge_id = (system_id - 1) * bridges_per_system + number + 1
+            firmware = {"wifi": "0.121.0", "wifi_app": "3.3.0", "silabs": "1.1.2"}
+            bridge = {
+                "id": bridge_id,
+                "name": f"Bridge {bridge_id}",
+                "mode": "home",
+                "hardware_id": f"0x{bridge_id:016x}",
+                "hardware_revision": 4,
+                "firmware_version": firmware,
+                "missing_at": None,
+                "created_at": _timestamp(bridge_id),
+                "updated_at": _timestamp(bridge_id),
+                "system_id": system_id,
+                "firmware": firmware,
+                "links": {"system": system_id},
+            }
+            system_bridges.append(bridge)
+            bridge_payloads.append(bridge)
+
+        for number in range(sensors_per_system):
+            sensor_id = (system_id - 1) * sensors_per_system + number + 1
+            sensor_uuid = _uuid(3, sensor_id)
+            bridge = system_bridges[number % len(system_bridges)]
+            sensor_payloads.append(
+                {
+                    "id": sensor_id,
+                    "uuid": sensor_uuid,
+                    "user": {"id": user_id, "email": email},
+                    "bridge": {
+                        "id": bridge["id"],
+                        "hardware_id": bridge["hardware_id"],
+                    },
+                    "last_bridge_hardware_id": bridge["hardware_id"],
+                    "name": f"Sensor {sensor_id}",
+                    "location_id": sensor_id,
+                    "system_id": system_id,
+                    "hardware_id": f"0x{sensor_id:016x}",
+                    "hardware_revision": 5,
+                    "firmware_version": "1.1.2",
+                    "device_key": f"0x{sensor_id:016x}",
+                    "encryption_key": True,
+                    "installed_at": _timestamp(sensor_id),
+                    "calibrated_at": _timestamp(sensor_id),
+                    "last_reported_at": _timestamp(sensor_id),
+                    "missing_at": None,
+                    "updated_at": _timestamp(sensor_id),
+                    "created_at": _timestamp(sensor_id),
+                    "signal_strength": 4,
+                    "firmware": {"status": "valid"},
+                    "surface_type": None,
+                }
+            )
+
+            for definition_id, *_ in _LISTENER_DEFINITIONS[:listeners_per_sensor]:
+                listener_payloads.append(
+                    {
+                        "id": _uuid(4, len(listener_payloads) + 1),
+                        "definition_id": definition_id,
+                        "created_at": _timestamp(sensor_id),
+                        "type": "sensor",
+                        "model_version": "1.0",
+                        "sensor_id": sensor_uuid,
+                        "status_localized": {"state": "Idle", "description": "Idle"},
+                        "insights": {
+                            "primary": {
+                                "origin": {"id": sensor_uuid, "type": "Sensor"},
+                                "value": "idle",
+                                "data_received_at": _timestamp(sensor_id),
+                            }
+                        },
+                        "configuration": {},
+                        "pro_monitoring_status": "ineligible",
+                    }
+                )
+
+    return FakeAccount(
+        email=email,
+        password=password,
+        user=user,
+        user_preferences=user_preferences,
+        systems=system_payloads,
+        bridges=bridge_payloads,
+        sensors=sensor_payloads,
+        listeners=listener_payloads,
+        listener_definitions=listener_definitions,
+    )
@@ -0,0 +1,405 @@
+"""Define an in-process fake Notion API server."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from http import HTTPStatus
+import json
+import random
+import secrets
+import time
+from typing import Any, Self
+
+from aiohttp import hdrs, web
+import jwt
+
+from aionotion.testing.data import FakeAccount, generate_account
+
+DEFAULT_TOKEN_LIFETIME = 60 * 15
+
+_HandlerT = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+def _error_response(status: HTTPStatus, title: str) -> web.Response:
+    """Return an API error response.
+
+    Args:
+    ----
+        status: The HTTP status of the response.
+        title: The title of the error.
+
+    Returns:
+    -------
+        The response.
+
+    """
+    return web.json_response(
+        {"errors": [{"title": title, "message": title}]}, status=status
+    )
+
+
+class FakeNotionServer:
+    """Define a local server that imitates the Notion API.
+
+    The server serves a synthetic account (see ``generate_account()``) over the same
+    endpoints that the client uses, issuing access tokens that expire and refresh
+    tokens that rotate like the real API's do. Every response can be delayed by a fixed
+    latency, and a fraction of authenticated requests can be made to fail, which makes
+    the server suitable for load testing a deployment of the client offline:
+
+        async with FakeNotionServer(generate_account(systems=100)) as server:
+            client = Client(api_base=server.api_base)
+    """
+
+    def __init__(
+        self,
+        account: FakeAccount | None = None,
+        *,
+        latency: float = 0,
+        error_rate: float = 0,
+        error_status: HTTPStatus = HTTPStatus.INTERNAL_SERVER_ERROR,
+        token_lifetime: float = DEFAULT_TOKEN_LIFETIME,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            account: The account to serve (if not provided, a small one is generated).
+            latency: The number of seconds by which every response is delayed.
+            error_rate: The fraction (between 0 and 1) of authenticated requests that
+                fail.
+            error_status: The HTTP status with which failing requests fail.
+            token_lifetime: The number of seconds for which access tokens are valid.
+            host: The host to listen on.
+            port: The port to listen on (if 0, a free port is picked).
+            seed: An optional seed that makes the failures reproducible.
+
+        """
+        self._account = account or generate_account()
+        self._error_rate = error_rate
+        self._error_status = error_status
+        self._host = host
+        self._latency = latency
+        self._port = port
+        self._random = random.Random(seed)  # noqa: S311
+        self._refresh_tokens: set[str] = set()
+        self._runner: web.AppRunner | None = None
+        self._secret = secrets.token_hex()
+        self._token_lifetime = token_lifetime
+        self.request_count = 0
+
+        # The (potentially huge) collections are only serialized once:
+        self._bodies = {
+            "base_stations": self._serialize({"base_stations": self._account.bridges}),
+            "listener_definitions": self._serialize(
+                {"listener_definitions": self._account.listener_definitions}
+            ),
+            "listeners": self._serialize({"listeners": self._account.listeners}),
+            "sensors": self._serialize({"sensors": self._account.sensors}),
+            "systems": self._serialize({"systems": self._account.systems}),
+        }
+
+    async def __aenter__(self) -> Self:
+        """Start the server upon entering its async context.
+
+        Returns
+        -------
+            This server.
+
+        """
+        await self.async_start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop the server upon exiting its async context.
+
+        Args:
+        ----
+            exc_info: Information about an exception raised within the context.
+
+        """
+        await self.async_stop()
+
+    @property
+    def account(self) -> FakeAccount:
+        """Return the account that the server serves."""
+        return self._account
+
+    @property
+    def api_base(self) -> str:
+        """Return the base URL of the server's API (to provide to a client)."""
+        return f"http://{self._host}:{self._port}/api"
+
+    @staticmethod
+    def _serialize(payload: dict[str, Any]) -> bytes:
+        """Serialize a response payload.
+
+        Args:
+        ----
+            payload: The payload.
+
+        Returns:
+        -------
+            The serialized payload.
+
+        """
+        return json.dumps(payload).encode()
+
+    def _auth_tokens(self) -> dict[str, str]:
+        """Issue a new access token and refresh token.
+
+        Returns
+        -------
+            The tokens (as the API formats them).
+
+        """
+        refresh_token = secrets.token_hex()
+        self._refresh_tokens.add(refresh_token)
+        access_token = jwt.encode(
+            {
+                "sub": self._account.user["uuid"],
+                "exp": int(time.time() + self._token_lifetime),
+            },
+            self._secret,
+            algorithm="HS256",
+        )
+        return {"jwt": access_token, "refresh_token": refresh_token}
+
+    def _collection(self, name: str) -> web.Response:
+        """Return a response containing a pre-serialized collection.
+
+        Args:
+        ----
+            name: The name of the collection.
+
+        Returns:
+        -------
+            The response.
+
+        """
+        return web.Response(body=self._bodies[name], content_type="application/json")
+
+    def _create_app(self) -> web.Application:
+        """Create the aiohttp application.
+
+        Returns
+        -------
+            The application.
+
+        """
+        app = web.Application(middlewares=[self._middleware])
+        app.add_routes(
+            [
+                web.post("/api/auth/login", self._handle_login),
+                web.post("/api/auth/{user_uuid}/refresh", self._handle_refresh),
+                web.get("/api/base_stations", self._handle_collection),
+                web.get("/api/base_stations/{id}", self._handle_item),
+                web.get("/api/listener_definitions", self._handle_collection),
+                web.get("/api/sensor/listeners", self._handle_collection),
+                web.get("/api/sensors", self._handle_collection),
+                web.get("/api/sensors/{id}", self._handle_item),
+                web.get("/api/systems", self._handle_collection),
+                web.get("/api/systems/{id}", self._handle_item),
+                web.get("/api/users/{user_uuid}", self._handle_user),
+                web.get(
+                    "/api/users/{user_uuid}/user_preferences",
+                    self._handle_user_preferences,
+                ),
+            ]
+        )
+        return app
+
+    def _is_authorized(self, request: web.Request) -> bool:
+        """Return whether a request carries a valid, unexpired access token.
+
+        Args:
+        ----
+            request: The request.
+
+        Returns:
+        -------
+            Whether the request is authorized.
+
+        """
+        scheme, _, access_token = request.headers.get(hdrs.AUTHORIZATION, "").partition(
+            " "
+        )
+        if scheme != "Bearer":
+            return False
+        try:
+            jwt.decode(access_token, self._secret, algorithms=["HS256"])
+        except jwt.InvalidTokenError:
+            return False
+        return True
+
+    @web.middleware
+    async def _middleware(
+        self, request: web.Request, handler: _HandlerT
+    ) -> web.StreamResponse:
+        """Apply latency, authorization, and failures to every request.
+
+        Args:
+        ----
+            request: The request.
+            handler: The handler of the request's route.
+
+        Returns:
+        -------
+            The response.
+
+        """
+        self.request_count += 1
+        if self._latency:
+            await asyncio.sleep(self._latency)
+
+        if request.method == hdrs.METH_POST:
+            # Authentication requests are authorized by their payloads:
+            return await handler(request)
+
+        if not self._is_authorized(request):
+            return _error_response(HTTPStatus.UNAUTHORIZED, "Unauthorized")
+
+        if self._error_rate and self._random.random() < self._error_rate:
+            response = _error_response(self._error_status, "Simulated failure")
+            if self._error_status == HTTPStatus.TOO_MANY_REQUESTS:
+                response.headers[hdrs.RETRY_AFTER] = "1"
+            return response
+
+        return await handler(request)
+
+    async def _handle_collection(self, request: web.Request) -> web.Response:
+        """Handle a request for all entities of a kind.
+
+        Args:
+        ----
+            request: The request.
+
+        Returns:
+        -------
+            The response.
+
+        """
+        return self._collection(request.path.rsplit("/", 1)[-1])
+
+    async def _handle_item(self, request: web.Request) -> web.Response:
+        """Handle a request for a single entity by ID.
+
+        Args:
+        ----
+            request: The request.
+
+        Returns:
+        -------
+            The response.
+
+        """
+        key = request.path.split("/")[2]
+        entities = {
+            "base_stations": self._account.bridges,
+            "sensors": self._account.sensors,
+            "systems": self._account.systems,
+        }[key]
+
+        for entity in entities:
+            if str(entity["id"]) == request.match_info["id"]:
+                return web.json_response({key: entity})
+
+        return _error_response(HTTPStatus.NOT_FOUND, "Not found")
+
+    async def _handle_login(self, request: web.Request) -> web.Response:
+        """Handle a request to authenticate via credentials.
+
+        Args:
+        ----
+            request: The request.
+
+        Returns:
+        -------
+            The response.
+
+        """
+        auth = (await request.json()).get("auth", {})
+        if (auth.get("email"), auth.get("password")) != (
+            self._account.email,
+            self._account.password,
+        ):
+            return _error_response(HTTPStatus.UNAUTHORIZED, "Invalid credentials")
+
+        return web.json_response(
+            {"user": self._account.user, "auth": self._auth_tokens()}
+        )
+
+    async def _handle_refresh(self, request: web.Request) -> web.Response:
+        """Handle a request to authenticate via a refresh token.
+
+        Refresh tokens are single-use: each refresh issues a new one.
+
+        Args:
+        ----
+            request: The request.
+
+        Returns:
+        -------
+            The response.
+
+        """
+        refresh_token = (await request.json()).get("auth", {}).get("refresh_token")
+        if (
+            request.match_info["user_uuid"] != self._account.user["uuid"]
+            or refresh_token not in self._refresh_tokens
+        ):
+            return _error_response(HTTPStatus.UNAUTHORIZED, "Invalid refresh token")
+
+        self._refresh_tokens.discard(refresh_token)
+        return web.json_response({"auth": self._auth_tokens()})
+
+    async def _handle_user(self, request: web.Request) -> web.Response:
+        """Handle a request for the user's information.
+
+        Args:
+        ----
+            request: The request.
+
+        Returns:
+        -------
+            The response.
+
+        """
+        if request.match_info["user_uuid"] != self._account.user["uuid"]:
+            return _error_response(HTTPStatus.NOT_FOUND, "Not found")
+        return web.json_response({"users": self._account.user})
+
+    async def _handle_user_preferences(self, request: web.Request) -> web.Response:
+        """Handle a request for the user's preferences.
+
+        Args:
+        ----
+            request: The request.
+
+        Returns:
+        -------
+            The response.
+
+        """
+        if request.match_info["user_uuid"] != self._account.user["uuid"]:
+            return _error_response(HTTPStatus.NOT_FOUND, "Not found")
+        return web.json_response({"user_preferences": self._account.user_preferences})
+
+    async def async_start(self) -> None:
+        """Start the server."""
+        self._runner = web.AppRunner(self._create_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self._host, self._port)
+        await site.start()
+        # If the port was picked by the OS, find out which one it is:
+        self._port = self._runner.addresses[0][1]
+
+    async def async_stop(self) -> None:
+        """Stop the server."""
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
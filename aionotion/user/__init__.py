@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from aionotion.cache import CachedEndpoint
 from aionotion.user.models import (
     User as UserModel,
     UserInformationResponse,
@@ -41,6 +42,7 @@ class User:
                 "get",
                 f"/users/{self._client.user_uuid}",
                 UserInformationResponse,
+                cache=CachedEndpoint.USER_INFO,
             )
         )
         return response.users
@@ -58,6 +60,7 @@ class User:
                 "get",
                 f"/users/{self._client.user_uuid}/user_preferences",
                 UserPreferencesResponse,
+                cache=CachedEndpoint.USER_PREFERENCES,
             )
         )
         return response.user_preferences
@@ -6,11 +6,12 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 import ciso8601
-from mashumaro import DataClassDictMixin
+
+from aionotion.model import NotionBaseModel
 
 
 @dataclass(frozen=True, kw_only=True)
-class AuthTokens(DataClassDictMixin):
+class AuthTokens(NotionBaseModel):
     """Define auth tokens."""
 
     jwt: str
@@ -18,7 +19,7 @@ class AuthTokens(DataClassDictMixin):
 
 
 @dataclass(frozen=True, kw_only=True)
-class LegacySession(DataClassDictMixin):
+class LegacySession(NotionBaseModel):
     """Define a legacy Notion session."""
 
     user_id: str
@@ -26,7 +27,7 @@ class LegacySession(DataClassDictMixin):
 
 
 @dataclass(frozen=True, kw_only=True)
-class LegacyUser(DataClassDictMixin):
+class LegacyUser(NotionBaseModel):
     """Define a legacy Notion user."""
 
     id: int
@@ -43,7 +44,7 @@ class LegacyUser(DataClassDictMixin):
 
 
 @dataclass(frozen=True, kw_only=True)
-class User(DataClassDictMixin):
+class User(NotionBaseModel):
     """Define a Notion user."""
 
     id: int
@@ -59,14 +60,14 @@ class User(DataClassDictMixin):
 
 
 @dataclass(frozen=True, kw_only=True)
-class UserInformationResponse(DataClassDictMixin):
+class UserInformationResponse(NotionBaseModel):
     """Define an API response containing user information."""
 
     users: User
 
 
 @dataclass(frozen=True, kw_only=True)
-class AuthenticateViaCredentialsResponse(DataClassDictMixin):
+class AuthenticateViaCredentialsResponse(NotionBaseModel):
     """Define an API response for authentication via credentials."""
 
     user: User
@@ -74,7 +75,7 @@ class AuthenticateViaCredentialsResponse(DataClassDictMixin):
 
 
 @dataclass(frozen=True, kw_only=True)
-class AuthenticateViaCredentialsLegacyResponse(DataClassDictMixin):
+class AuthenticateViaCredentialsLegacyResponse(NotionBaseModel):
     """Define an API response for authentication via credentials (legacy)."""
 
     users: LegacyUser
@@ -82,14 +83,14 @@ class AuthenticateViaCredentialsLegacyResponse(DataClassDictMixin):
 
 
 @dataclass(frozen=True, kw_only=True)
-class AuthenticateViaRefreshTokenResponse(DataClassDictMixin):
+class AuthenticateViaRefreshTokenResponse(NotionBaseModel):
     """Define an API response for authentication via refresh token."""
 
     auth: AuthTokens
 
 
 @dataclass(frozen=True, kw_only=True)
-class UserPreferences(DataClassDictMixin):
+class UserPreferences(NotionBaseModel):
     """Define user preferences."""
 
     user_id: int
@@ -101,7 +102,7 @@ class UserPreferences(DataClassDictMixin):
 
 
 @dataclass(frozen=True, kw_only=True)
-class UserPreferencesResponse(DataClassDictMixin):
+class UserPreferencesResponse(NotionBaseModel):
     """Define an API response containing all devices."""
 
     user_preferences: UserPreferences
@@ -0,0 +1,76 @@
+"""Define batch request utilities."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TypeVar
+
+from aiohttp import ClientError
+
+from aionotion.errors import NotionError
+
+DEFAULT_BATCH_CONCURRENCY = 10
+
+BatchErrorT = ClientError | NotionError | TimeoutError
+
+_ArgT = TypeVar("_ArgT")
+_ResultT = TypeVar("_ResultT")
+
+
+async def async_gather_bounded(
+    func: Callable[[_ArgT], Awaitable[_ResultT]],
+    args: Iterable[_ArgT],
+    *,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> list[_ResultT | BatchErrorT]:
+    """Call a coroutine function for each argument, with bounded concurrency.
+
+    Args:
+    ----
+        func: The coroutine function to call.
+        args: The arguments to call the coroutine function with (one per call).
+        concurrency: The maximum number of calls that may be in flight at once.
+
+    Returns:
+    -------
+        The results of the calls (in the same order as the arguments); a call that
+        failed with an API, connection, or timeout error is represented by that error.
+
+    Raises:
+    ------
+        ValueError: Raised upon a non-positive concurrency.
+        Exception: Raised upon any other error in a call (once the remaining calls
+            have been cancelled).
+
+    """
+    if concurrency < 1:
+        msg = f"Concurrency must be at least 1 (got {concurrency})"
+        raise ValueError(msg)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call(arg: _ArgT) -> _ResultT | BatchErrorT:
+        """Call the coroutine function once the semaphore allows it.
+
+        Args:
+        ----
+            arg: The argument to call the coroutine function with.
+
+        Returns:
+        -------
+            The result of the call (or the error it raised).
+
+        """
+        async with semaphore:
+            try:
+                return await func(arg)
+            except (ClientError, NotionError, TimeoutError) as err:
+                return err
+
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [task_group.create_task(call(arg)) for arg in args]
+    except ExceptionGroup as err:
+        raise err.exceptions[0] from None
+    return [task.result() for task in tasks]
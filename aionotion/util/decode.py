@@ -0,0 +1,292 @@
+"""Define JSON decoding utilities."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import dataclasses
+from datetime import datetime
+import json
+import types
+from typing import Any, Union, cast, get_args, get_origin, get_type_hints
+
+from mashumaro import DataClassDictMixin
+
+# A JSON decoder accepts the raw bytes of a response body and raises ValueError if they
+# aren't valid JSON:
+JSONDecoderT = Callable[[bytes], Any]
+
+# A model decoder accepts the raw bytes of a response body and returns a model instance
+# (raising ValueError if they don't describe one):
+ModelDecoderT = Callable[[bytes], DataClassDictMixin]
+
+# A converter turns an object decoded by msgspec into the object the model expects:
+_ConverterT = Callable[[Any], Any]
+
+_MODEL_DECODERS: dict[type[DataClassDictMixin], ModelDecoderT | None] = {}
+
+
+def get_default_json_decoder() -> JSONDecoderT:
+    """Return the fastest JSON decoder that is installed.
+
+    ``orjson`` and ``msgspec`` are preferred (in that order); if neither is installed,
+    the standard library's ``json`` module is used.
+
+    Returns
+    -------
+        A function that decodes JSON bytes.
+
+    """
+    try:
+        import orjson  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        pass
+    else:
+        # orjson.JSONDecodeError is already a ValueError:
+        return orjson.loads
+
+    try:
+        import msgspec  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        pass
+    else:
+        decoder = msgspec.json.Decoder()
+
+        def msgspec_loads(data: bytes) -> Any:  # noqa: ANN401
+            """Decode JSON bytes with msgspec.
+
+            Args:
+            ----
+                data: The JSON bytes to decode.
+
+            Returns:
+            -------
+                The decoded data.
+
+            Raises:
+            ------
+                ValueError: Raised upon invalid JSON.
+
+            """
+            try:
+                return decoder.decode(data)
+            except msgspec.DecodeError as err:
+                raise ValueError(str(err)) from err
+
+        return msgspec_loads
+
+    return json.loads
+
+
+DEFAULT_JSON_DECODER = get_default_json_decoder()
+
+
+def _get_field_decode_type(
+    msgspec: types.ModuleType,
+    field: dataclasses.Field[Any],
+    annotation: Any,  # noqa: ANN401
+) -> tuple[Any, _ConverterT | None]:
+    """Return the type that msgspec should decode a dataclass field into.
+
+    Fields with their own deserialization hook are decoded into their raw JSON value
+    and then passed through the hook (just as mashumaro does); datetimes are the
+    exception, since msgspec parses them itself.
+
+    Args:
+    ----
+        msgspec: The msgspec module.
+        field: A dataclass field.
+        annotation: The field's (resolved) type annotation.
+
+    Returns:
+    -------
+        The type to decode into and an optional converter for decoded objects.
+
+    """
+    args = get_args(annotation)
+    deserialize = field.metadata.get("deserialize")
+    if not callable(deserialize) or datetime in (annotation, *args):
+        return _get_decode_type(msgspec, annotation)
+
+    if optional := type(None) in args:
+        (annotation,) = (arg for arg in args if arg is not type(None))
+    raw_type = dict[str, Any] if dataclasses.is_dataclass(annotation) else annotation
+    return (
+        raw_type | None if optional else raw_type,
+        lambda value: None if value is None else deserialize(value),
+    )
+
+
+def _get_dataclass_decode_type(
+    msgspec: types.ModuleType, model: type
+) -> tuple[Any, _ConverterT | None]:
+    """Return the type that msgspec should decode a dataclass into.
+
+    msgspec can decode straight into most of our dataclasses; the exceptions are those
+    with aliased fields (which msgspec doesn't know about), those with non-init fields
+    (which msgspec considers required), and those that contain either. For those, a
+    msgspec Struct that mirrors the dataclass is generated, along with a converter that
+    turns a decoded Struct into the dataclass itself.
+
+    Args:
+    ----
+        msgspec: The msgspec module.
+        model: A dataclass.
+
+    Returns:
+    -------
+        The type to decode into and an optional converter for decoded objects.
+
+    """
+    type_hints = get_type_hints(model)
+    fields = [field for field in dataclasses.fields(model) if field.init]
+    converters: dict[str, _ConverterT] = {}
+    rename: dict[str, str] = {}
+    struct_fields: list[tuple[str, Any, Any]] = []
+
+    for field in fields:
+        decode_type, converter = _get_field_decode_type(
+            msgspec, field, type_hints[field.name]
+        )
+        if converter:
+            converters[field.name] = converter
+        if alias := field.metadata.get("alias"):
+            rename[field.name] = alias
+
+        if field.default is not dataclasses.MISSING:
+            default = field.default
+        elif field.default_factory is not dataclasses.MISSING:
+            default = msgspec.field(default_factory=field.default_factory)
+        else:
+            default = msgspec.NODEFAULT
+        struct_fields.append((field.name, decode_type, default))
+
+    if len(fields) == len(dataclasses.fields(model)) and not (converters or rename):
+        return model, None
+
+    field_names = [field.name for field in fields]
+
+    def convert(value: Any) -> Any:  # noqa: ANN401
+        """Convert a decoded Struct into the dataclass it mirrors.
+
+        Args:
+        ----
+            value: The decoded Struct.
+
+        Returns:
+        -------
+            The dataclass.
+
+        """
+        kwargs = {name: getattr(value, name) for name in field_names}
+        for name, converter in converters.items():
+            kwargs[name] = converter(kwargs[name])
+        return model(**kwargs)
+
+    struct_type = msgspec.defstruct(
+        model.__name__, struct_fields, kw_only=True, rename=rename or None
+    )
+    return struct_type, convert
+
+
+def _get_decode_type(
+    msgspec: types.ModuleType,
+    annotation: Any,  # noqa: ANN401
+) -> tuple[Any, _ConverterT | None]:
+    """Return the type that msgspec should decode a model annotation into.
+
+    Args:
+    ----
+        msgspec: The msgspec module.
+        annotation: A type annotation from a model.
+
+    Returns:
+    -------
+        The type to decode into and an optional converter for decoded objects.
+
+    """
+    if isinstance(annotation, type) and dataclasses.is_dataclass(annotation):
+        return _get_dataclass_decode_type(msgspec, annotation)
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if origin is list:
+        item_type, item_converter = _get_decode_type(msgspec, args[0])
+        if item_converter is None:
+            return annotation, None
+        return (
+            list[item_type],  # type: ignore[valid-type]
+            lambda value: [item_converter(item) for item in value],
+        )
+
+    if origin in (Union, types.UnionType) and len(args) == 2 and type(None) in args:  # noqa: PLR2004
+        (inner,) = (arg for arg in args if arg is not type(None))
+        inner_type, inner_converter = _get_decode_type(msgspec, inner)
+        if inner_converter is None:
+            return annotation, None
+        return (
+            inner_type | None,
+            lambda value: None if value is None else inner_converter(value),
+        )
+
+    return annotation, None
+
+
+def get_model_decoder(model: type[DataClassDictMixin]) -> ModelDecoderT | None:
+    """Return a function that decodes JSON bytes straight into a model.
+
+    Unlike decoding JSON into a dict and then passing it to ``model.from_dict()``, the
+    returned function never builds an intermediate tree of dicts and lists, which
+    roughly halves the number of allocations per response.
+
+    Args:
+    ----
+        model: The model to decode into.
+
+    Returns:
+    -------
+        A function that decodes JSON bytes into the model (or None if ``msgspec`` isn't
+        installed or can't describe the model).
+
+    """
+    if model in _MODEL_DECODERS:
+        return _MODEL_DECODERS[model]
+
+    try:
+        import msgspec  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+
+    try:
+        decode_type, converter = _get_decode_type(msgspec, model)
+        decoder = msgspec.json.Decoder(decode_type)
+    except (NameError, TypeError):
+        _MODEL_DECODERS[model] = None
+        return None
+
+    def decode_model(data: bytes) -> DataClassDictMixin:
+        """Decode JSON bytes into the model.
+
+        Args:
+        ----
+            data: The JSON bytes to decode.
+
+        Returns:
+        -------
+            The decoded model.
+
+        Raises:
+        ------
+            ValueError: Raised upon JSON that doesn't describe the model.
+
+        """
+        try:
+            decoded = decoder.decode(data)
+        except msgspec.DecodeError as err:
+            raise ValueError(str(err)) from err
+        if converter:
+            return cast(DataClassDictMixin, converter(decoded))
+        return cast(DataClassDictMixin, decoded)
+
+    _MODEL_DECODERS[model] = decode_model
+    return decode_model
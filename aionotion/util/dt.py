@@ -1,6 +1,7 @@
 """Define datetime utilities."""
 
 from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 
 
 def utcnow() -> datetime:
@@ -27,3 +28,29 @@ def utc_from_timestamp(timestamp: float) -> datetime:
 
     """
     return datetime.fromtimestamp(timestamp, tz=UTC)
+
+
+def parse_retry_after(value: str) -> float | None:
+    """Parse the value of a Retry-After header into a number of seconds.
+
+    Args:
+    ----
+        value: A Retry-After value (either a number of seconds or an HTTP date).
+
+    Returns:
+    -------
+        The number of seconds to wait (or None if the value can't be parsed).
+
+    """
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max((retry_at - utcnow()).total_seconds(), 0)
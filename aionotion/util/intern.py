@@ -0,0 +1,81 @@
+"""Define utilities for sharing repeated values among models."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from aionotion.model import NotionBaseModel
+
+DEFAULT_FLYWEIGHT_MAX_SIZE = 256
+
+_ModelT = TypeVar("_ModelT", bound="NotionBaseModel")
+
+
+class FlyweightCache(Generic[_ModelT]):
+    """Define a size-bounded cache of shared model instances.
+
+    Many devices report identical values for small nested objects (e.g., a localized
+    status or a firmware status); rather than creating a new model for every one of
+    them, each distinct value is validated once and the same (immutable) instance is
+    shared by every model that contains it.
+    """
+
+    def __init__(
+        self, model: type[_ModelT], *, max_size: int = DEFAULT_FLYWEIGHT_MAX_SIZE
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            model: The (frozen) model to share instances of.
+            max_size: The maximum number of instances to hold at once; the least
+                recently used instance is evicted beyond that.
+
+        """
+        self._instances: OrderedDict[tuple[tuple[str, Any], ...], _ModelT] = (
+            OrderedDict()
+        )
+        self._max_size = max_size
+        self._model = model
+
+    def __len__(self) -> int:
+        """Return the number of cached instances.
+
+        Returns
+        -------
+            The number of cached instances.
+
+        """
+        return len(self._instances)
+
+    def get(self, value: dict[str, Any]) -> _ModelT:
+        """Return the shared model instance for a raw value.
+
+        Args:
+        ----
+            value: The raw value to validate.
+
+        Returns:
+        -------
+            The validated model.
+
+        """
+        key = tuple(value.items())
+
+        try:
+            instance = self._instances.get(key)
+        except TypeError:
+            # The value contains something unhashable, so it can't be shared:
+            return self._model.from_dict(value)
+
+        if instance is None:
+            instance = self._model.from_dict(value)
+            self._instances[key] = instance
+            if len(self._instances) > self._max_size:
+                self._instances.popitem(last=False)
+        else:
+            self._instances.move_to_end(key)
+
+        return instance
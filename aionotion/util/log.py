@@ -0,0 +1,44 @@
+"""Define logging utilities."""
+
+from __future__ import annotations
+
+import re
+
+DEFAULT_PAYLOAD_LOG_MAX_LENGTH = 2048
+DEFAULT_PAYLOAD_LOG_SAMPLE_RATE = 1.0
+
+REDACTED = "***"
+
+# The values of these keys are credentials (a value cut off by truncation is still
+# redacted up to where it was cut off):
+_SENSITIVE_VALUE_PATTERN = re.compile(
+    r'("(?:access_token|authentication_token|jwt|password|refresh_token|token)"'
+    r'\s*:\s*)"[^"]*"?'
+)
+# A JWT (e.g., an access token) that appears anywhere else:
+_JWT_PATTERN = re.compile(r"eyJ[\w-]+\.[\w-]+(?:\.[\w-]*)?")
+
+
+def format_payload(payload: bytes, *, max_length: int | None) -> str:
+    """Render a raw payload for logging, truncated and redacted of credentials.
+
+    Args:
+    ----
+        payload: The raw payload.
+        max_length: The maximum number of bytes of the payload to render (if None,
+            the entire payload is rendered).
+
+    Returns:
+    -------
+        The rendered payload.
+
+    """
+    if max_length is None or len(payload) <= max_length:
+        text = payload.decode(errors="replace")
+        suffix = ""
+    else:
+        text = payload[:max_length].decode(errors="replace")
+        suffix = f"... ({len(payload) - max_length} more bytes)"
+
+    text = _SENSITIVE_VALUE_PATTERN.sub(rf'\1"{REDACTED}"', text)
+    return _JWT_PATTERN.sub(REDACTED, text) + suffix
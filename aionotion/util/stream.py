@@ -0,0 +1,172 @@
+"""Define utilities for incrementally parsing streamed JSON."""
+
+from __future__ import annotations
+
+import json
+import re
+
+# The characters that can change the structure of a JSON document outside of a string:
+_STRUCTURAL_PATTERN = re.compile(rb'[\[\]{}",:]')
+# The characters that can end (or escape part of) a string:
+_STRING_PATTERN = re.compile(rb'["\\]')
+
+
+class JSONArrayStream:
+    """Define an incremental parser for an array within a streamed JSON object.
+
+    The parser is fed the raw bytes of a JSON object (e.g., ``{"sensors": [...]}``) as
+    they arrive and returns the raw bytes of each element of the array under a
+    top-level key as soon as that element is complete. Only the bytes of the element
+    currently being received are buffered; the elements themselves are left for the
+    caller to decode.
+    """
+
+    def __init__(self, key: str) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            key: The top-level key of the array.
+
+        """
+        self._array_depth: int | None = None
+        self._buffer = bytearray()
+        self._depth = 0
+        self._element_start = 0
+        self._expect_array = False
+        self._in_string = False
+        self._key = json.dumps(key).encode()
+        self._last_string = b""
+        self._pos = 0
+        self._string_start = 0
+        self.done = False
+
+    def _compact(self) -> None:
+        """Drop the bytes that no longer need to be buffered."""
+        if self._array_depth is not None and not self.done:
+            keep_from = self._element_start
+        elif self._in_string:
+            keep_from = self._string_start
+        else:
+            keep_from = self._pos
+
+        del self._buffer[:keep_from]
+        self._element_start -= keep_from
+        self._pos -= keep_from
+        self._string_start -= keep_from
+
+    def _handle_structural_char(self, char: bytes, start: int) -> bytes | None:
+        """Handle a structural character found outside of a string.
+
+        Args:
+        ----
+            char: The character.
+            start: The position of the character within the buffer.
+
+        Returns:
+        -------
+            The raw bytes of an array element (if the character completed one).
+
+        """
+        expect_array, self._expect_array = self._expect_array, False
+        element: bytes | None = None
+
+        if char == b'"':
+            self._in_string = True
+            self._string_start = start
+        elif char == b":":
+            self._expect_array = (
+                self._array_depth is None
+                and self._depth == 1
+                and self._last_string == self._key
+            )
+        elif char in (b"[", b"{"):
+            self._depth += 1
+            if expect_array and char == b"[":
+                self._array_depth = self._depth
+                self._element_start = self._pos
+        elif char in (b"]", b"}"):
+            if self._depth == self._array_depth:
+                # The end of the array (which might be empty):
+                element = bytes(self._buffer[self._element_start : start]).strip()
+                self.done = True
+            self._depth -= 1
+        elif self._depth == self._array_depth:
+            # A comma between two elements of the array:
+            element = bytes(self._buffer[self._element_start : start]).strip()
+            self._element_start = self._pos
+
+        return element or None
+
+    def _scan_string(self) -> bool:
+        """Scan to the end of the current string.
+
+        Returns
+        -------
+            Whether the end of the string was reached.
+
+        """
+        while match := _STRING_PATTERN.search(self._buffer, self._pos):
+            if match.group() == b"\\":
+                if match.end() == len(self._buffer):
+                    # Wait for the escaped character before continuing:
+                    self._pos = match.start()
+                    return False
+                self._pos = match.end() + 1
+                continue
+
+            self._in_string = False
+            self._pos = match.end()
+            if self._array_depth is None and self._depth == 1:
+                self._last_string = bytes(self._buffer[self._string_start : self._pos])
+            return True
+
+        self._pos = len(self._buffer)
+        return False
+
+    def close(self) -> None:
+        """Signal that the stream has ended.
+
+        Raises
+        ------
+            ValueError: Raised if the stream ended before the array did.
+
+        """
+        if not self.done:
+            msg = f"Stream ended before the end of the {self._key.decode()} array"
+            raise ValueError(msg)
+
+    def feed(self, data: bytes) -> list[bytes]:
+        """Feed the next chunk of the stream to the parser.
+
+        Args:
+        ----
+            data: The next chunk of raw bytes.
+
+        Returns:
+        -------
+            The raw bytes of each array element completed by the chunk.
+
+        """
+        if self.done:
+            return []
+
+        self._buffer += data
+        elements: list[bytes] = []
+
+        while not self.done:
+            if self._in_string:
+                if not self._scan_string():
+                    break
+                continue
+
+            if (match := _STRUCTURAL_PATTERN.search(self._buffer, self._pos)) is None:
+                self._pos = len(self._buffer)
+                break
+
+            self._pos = match.end()
+            if element := self._handle_structural_char(match.group(), match.start()):
+                elements.append(element)
+
+        self._compact()
+        return elements
@@ -0,0 +1 @@
+"""Define benchmarks for the aionotion package."""
@@ -0,0 +1,94 @@
+"""Define benchmark fixtures."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Generator
+
+import pytest
+
+from aionotion.client import Client
+from aionotion.testing import FakeAccount, FakeNotionServer, generate_account
+
+# The number of sensors in the account served by the fake server:
+FAKE_SERVER_SENSOR_COUNT = 1000
+
+
+@pytest.fixture(name="runner", scope="module")
+def runner_fixture() -> Generator[asyncio.Runner]:
+    """Return a fixture for an event loop that benchmarks can run coroutines in.
+
+    Benchmarks time synchronous callables, so coroutines are run to completion in a
+    single, long-lived event loop (rather than one per benchmark round).
+
+    Yields
+    ------
+        An asyncio runner.
+
+    """
+    with asyncio.Runner() as runner:
+        yield runner
+
+
+@pytest.fixture(name="fake_account", scope="module")
+def fake_account_fixture() -> FakeAccount:
+    """Return a fixture for the account served by the fake server.
+
+    Returns
+    -------
+        A synthetic account.
+
+    """
+    return generate_account(
+        systems=10,
+        sensors_per_system=FAKE_SERVER_SENSOR_COUNT // 10,
+        listeners_per_sensor=3,
+    )
+
+
+@pytest.fixture(name="fake_server", scope="module")
+def fake_server_fixture(
+    fake_account: FakeAccount, runner: asyncio.Runner
+) -> Generator[FakeNotionServer]:
+    """Return a fixture for a running fake Notion API server.
+
+    Args:
+    ----
+        fake_account: The account to serve.
+        runner: An asyncio runner.
+
+    Yields:
+    ------
+        A fake Notion API server.
+
+    """
+    server = FakeNotionServer(fake_account)
+    runner.run(server.async_start())
+    yield server
+    runner.run(server.async_stop())
+
+
+@pytest.fixture(name="client")
+def client_fixture(
+    fake_server: FakeNotionServer, runner: asyncio.Runner
+) -> Generator[Client]:
+    """Return a fixture for a client authenticated against the fake server.
+
+    Args:
+    ----
+        fake_server: A fake Notion API server.
+        runner: An asyncio runner.
+
+    Yields:
+    ------
+        An authenticated client.
+
+    """
+    client = Client(api_base=fake_server.api_base)
+    runner.run(
+        client.async_authenticate_from_credentials(
+            fake_server.account.email, fake_server.account.password
+        )
+    )
+    yield client
+    runner.run(client.async_close())
@@ -0,0 +1,40 @@
+"""Define benchmarks for importing the package."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "pass",
+        "import aionotion",
+        "from aionotion.client import Client; Client().sensor",
+    ],
+)
+def test_import(benchmark: BenchmarkFixture, statement: str) -> None:
+    """Benchmark importing the package in a fresh interpreter.
+
+    The ``pass`` statement measures the interpreter's own startup, which the other
+    statements should be compared against.
+
+    Args:
+    ----
+        benchmark: The pytest-benchmark fixture.
+        statement: The statement to run.
+
+    """
+    benchmark.pedantic(  # type: ignore[no-untyped-call]
+        subprocess.run,
+        args=([sys.executable, "-c", statement],),
+        kwargs={"check": True},
+        rounds=10,
+    )
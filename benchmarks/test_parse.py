@@ -0,0 +1,114 @@
+"""Define benchmarks for validating API responses."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import cache
+import json
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from aionotion.listener.models import ListenerAllResponse
+from aionotion.model import NotionBaseModel
+from aionotion.sensor.models import SensorAllResponse
+from aionotion.testing import FakeAccount, generate_account
+from aionotion.util.decode import get_model_decoder
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+LARGE_SIZE = 100_000
+SIZES = [10, 1_000, LARGE_SIZE]
+
+
+@cache
+def _generate_account(size: int) -> FakeAccount:
+    """Generate (and reuse) an account with a number of sensors and listeners.
+
+    Args:
+    ----
+        size: The number of sensors (and listeners).
+
+    Returns:
+    -------
+        A synthetic account.
+
+    """
+    return generate_account(sensors_per_system=size, listeners_per_sensor=1)
+
+
+def _payload(model: type[NotionBaseModel], size: int) -> dict[str, Any]:
+    """Return the payload of a response with a number of items.
+
+    Args:
+    ----
+        model: The model of the response.
+        size: The number of items.
+
+    Returns:
+    -------
+        The payload.
+
+    """
+    account = _generate_account(size)
+    if model is ListenerAllResponse:
+        return {"listeners": account.listeners}
+    return {"sensors": account.sensors}
+
+
+def _run(benchmark: BenchmarkFixture, func: Callable[[], Any], size: int) -> None:
+    """Benchmark a function (with fewer rounds for large inputs).
+
+    Args:
+    ----
+        benchmark: The pytest-benchmark fixture.
+        func: The function to benchmark.
+        size: The number of items the function processes.
+
+    """
+    if size >= LARGE_SIZE:
+        benchmark.pedantic(func, rounds=3, iterations=1)  # type: ignore[no-untyped-call]
+    else:
+        benchmark(func)
+
+
+@pytest.mark.parametrize("model", [ListenerAllResponse, SensorAllResponse])
+@pytest.mark.parametrize("size", SIZES)
+def test_from_dict(
+    benchmark: BenchmarkFixture, model: type[NotionBaseModel], size: int
+) -> None:
+    """Benchmark validating a decoded response.
+
+    Args:
+    ----
+        benchmark: The pytest-benchmark fixture.
+        model: The model of the response.
+        size: The number of items in the response.
+
+    """
+    payload = _payload(model, size)
+    benchmark.extra_info["items"] = size
+    _run(benchmark, lambda: model.from_dict(payload), size)
+
+
+@pytest.mark.parametrize("model", [ListenerAllResponse, SensorAllResponse])
+@pytest.mark.parametrize("size", SIZES)
+def test_direct_decode(
+    benchmark: BenchmarkFixture, model: type[NotionBaseModel], size: int
+) -> None:
+    """Benchmark decoding a raw response straight into a model.
+
+    Args:
+    ----
+        benchmark: The pytest-benchmark fixture.
+        model: The model of the response.
+        size: The number of items in the response.
+
+    """
+    if (model_decoder := get_model_decoder(model)) is None:
+        pytest.skip("msgspec isn't installed")
+
+    body = json.dumps(_payload(model, size)).encode()
+    benchmark.extra_info["items"] = size
+    _run(benchmark, lambda: model_decoder(body), size)
@@ -0,0 +1,100 @@
+"""Define benchmarks for requests made against a fake Notion API server."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from aionotion.client import Client
+from aionotion.listener.models import ListenerAllResponse
+from aionotion.sensor.models import SensorAllResponse
+from aionotion.util.dt import utcnow
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+CONCURRENT_REQUESTS = 50
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "model"),
+    [
+        ("/sensor/listeners", ListenerAllResponse),
+        ("/sensors", SensorAllResponse),
+    ],
+)
+def test_request_and_validate(
+    benchmark: BenchmarkFixture,
+    client: Client,
+    endpoint: str,
+    model: type[ListenerAllResponse | SensorAllResponse],
+    runner: asyncio.Runner,
+) -> None:
+    """Benchmark requesting and validating a response end to end.
+
+    Args:
+    ----
+        benchmark: The pytest-benchmark fixture.
+        client: A client authenticated against the fake server.
+        endpoint: The endpoint to request.
+        model: The model of the response.
+        runner: An asyncio runner.
+
+    """
+    benchmark(
+        lambda: runner.run(client.async_request_and_validate("get", endpoint, model))
+    )
+
+
+def test_iter_all(
+    benchmark: BenchmarkFixture, client: Client, runner: asyncio.Runner
+) -> None:
+    """Benchmark streaming and validating sensors end to end.
+
+    Args:
+    ----
+        benchmark: The pytest-benchmark fixture.
+        client: A client authenticated against the fake server.
+        runner: An asyncio runner.
+
+    """
+
+    async def iter_all() -> None:
+        """Iterate over all sensors."""
+        async for _ in client.sensor.async_iter_all():
+            pass
+
+    benchmark(lambda: runner.run(iter_all()))
+
+
+def test_concurrent_refresh(
+    benchmark: BenchmarkFixture, client: Client, runner: asyncio.Runner
+) -> None:
+    """Benchmark many concurrent requests that all find an expired access token.
+
+    Args:
+    ----
+        benchmark: The pytest-benchmark fixture.
+        client: A client authenticated against the fake server.
+        runner: An asyncio runner.
+
+    """
+
+    def expire_access_token() -> None:
+        """Expire the client's access token before each round."""
+        client._access_token_expires_at = utcnow()  # noqa: SLF001
+
+    async def request_concurrently() -> None:
+        """Make concurrent requests (which share a single refresh)."""
+        await asyncio.gather(
+            *(client.user.async_preferences() for _ in range(CONCURRENT_REQUESTS))
+        )
+
+    benchmark.extra_info["concurrent_requests"] = CONCURRENT_REQUESTS
+    benchmark.pedantic(  # type: ignore[no-untyped-call]
+        lambda: runner.run(request_concurrently()),
+        setup=expire_access_token,
+        rounds=20,
+    )
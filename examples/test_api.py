@@ -32,32 +32,28 @@ async def main() -> None:
                 EMAIL, PASSWORD, session=session
             )
 
-            bridges = await client.bridge.async_all()
-            _LOGGER.info("BRIDGES: %s", bridges)
+            # Fetch everything concurrently:
+            snapshot = await client.async_snapshot()
+
+            _LOGGER.info("BRIDGES: %s", snapshot.bridges)
             _LOGGER.info("============================================================")
 
-            sensors = await client.sensor.async_all()
-            _LOGGER.info("SENSORS: %s", sensors)
+            _LOGGER.info("SENSORS: %s", snapshot.sensors)
             _LOGGER.info("============================================================")
 
-            listeners = await client.listener.async_all()
-            _LOGGER.info("LISTENERS: %s", listeners)
+            _LOGGER.info("LISTENERS: %s", snapshot.listeners)
             _LOGGER.info("============================================================")
 
-            listener_definitions = await client.listener.async_definitions()
-            _LOGGER.info("LISTENER DEFINITIONS: %s", listener_definitions)
+            _LOGGER.info("LISTENER DEFINITIONS: %s", snapshot.listener_definitions)
             _LOGGER.info("============================================================")
 
-            systems = await client.system.async_all()
-            _LOGGER.info("SYSTEMS: %s", systems)
+            _LOGGER.info("SYSTEMS: %s", snapshot.systems)
             _LOGGER.info("============================================================")
 
-            user_info = await client.user.async_info()
-            _LOGGER.info("USER_INFO: %s", user_info)
+            _LOGGER.info("USER_INFO: %s", snapshot.user)
             _LOGGER.info("============================================================")
 
-            user_preferences = await client.user.async_preferences()
-            _LOGGER.info("USER_PREFERENCES: %s", user_preferences)
+            _LOGGER.info("USER_PREFERENCES: %s", snapshot.user_preferences)
             _LOGGER.info("============================================================")
         except NotionError:
             _LOGGER.exception("There was an error")
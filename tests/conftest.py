@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Generator
 import json
 from time import time
 from typing import Any, cast
@@ -10,6 +11,7 @@ import aiohttp
 from aresponses import ResponsesMockServer
 import pytest
 
+from aionotion.listener import models as listener_models
 from tests.common import TEST_USER_UUID, generate_jwt, load_fixture
 
 
@@ -47,6 +49,22 @@ def _access_token_issued_at_fixture() -> None:
     return
 
 
+@pytest.fixture(autouse=True)
+def _listener_kinds_fixture() -> Generator[None]:
+    """Reset what's been learned about listener kinds after each test.
+
+    Yields
+    ------
+        Nothing.
+
+    """
+    known_kinds = dict(listener_models._LISTENER_KINDS)
+    yield
+    listener_models._LISTENER_KINDS.clear()
+    listener_models._LISTENER_KINDS.update(known_kinds)
+    listener_models._UNKNOWN_DEFINITION_IDS.clear()
+
+
 @pytest.fixture(name="auth_failure_response", scope="session")
 def auth_failure_response_fixture() -> dict[str, Any]:
     """Return a fixture for a failed auth response payload.
@@ -0,0 +1,99 @@
+"""Define tests for batch request utilities."""
+
+from __future__ import annotations
+
+import asyncio
+
+import aiohttp
+import pytest
+
+from aionotion.errors import RequestError
+from aionotion.util.batch import async_gather_bounded
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_errors() -> None:
+    """Test that API, connection, and timeout errors are returned per argument."""
+    errors: dict[int, Exception] = {
+        1: RequestError("Not found"),
+        2: aiohttp.ClientConnectionError("Connection reset"),
+        3: TimeoutError(),
+    }
+
+    async def get(arg: int) -> int:
+        """Return an argument (or raise the error configured for it).
+
+        Args:
+        ----
+            arg: An argument.
+
+        Returns:
+        -------
+            The argument.
+
+        """
+        if arg in errors:
+            raise errors[arg]
+        return arg
+
+    results = await async_gather_bounded(get, [0, 1, 2, 3, 4], concurrency=2)
+    assert results == [0, errors[1], errors[2], errors[3], 4]
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_invalid_concurrency() -> None:
+    """Test that a non-positive concurrency is rejected."""
+
+    async def get(arg: int) -> int:  # pragma: no cover
+        """Return an argument.
+
+        Args:
+        ----
+            arg: An argument.
+
+        Returns:
+        -------
+            The argument.
+
+        """
+        return arg
+
+    with pytest.raises(ValueError, match="Concurrency must be at least 1"):
+        await async_gather_bounded(get, [1], concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_unexpected_error() -> None:
+    """Test that an unexpected error cancels the calls that are still in flight."""
+    cancelled = asyncio.Event()
+
+    async def get(arg: int) -> int:
+        """Wait forever (or fail right away for a bad argument).
+
+        Args:
+        ----
+            arg: An argument.
+
+        Returns:
+        -------
+            The argument.
+
+        Raises:
+        ------
+            ValueError: Raised upon a bad argument.
+
+        """
+        if arg < 0:
+            msg = "Bad argument"
+            raise ValueError(msg)
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return arg  # pragma: no cover
+
+    with pytest.raises(ValueError, match="Bad argument"):
+        await async_gather_bounded(get, [1, -1])
+
+    assert cancelled.is_set()
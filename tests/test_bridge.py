@@ -10,6 +10,8 @@ from aresponses import ResponsesMockServer
 import pytest
 
 from aionotion import async_get_client_with_credentials
+from aionotion.bridge.models import Bridge
+from aionotion.errors import RequestError
 from tests.common import TEST_EMAIL, TEST_PASSWORD
 
 
@@ -122,3 +124,49 @@ async def test_bridge_get(
             assert bridge.links["system"] == 12345
 
     aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_bridge_get_many(
+    aresponses: ResponsesMockServer,
+    authenticated_notion_api_server: ResponsesMockServer,
+    bad_api_response: dict[str, Any],
+    bridge_get_response: dict[str, Any],
+) -> None:
+    """Test getting multiple bridges by ID.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_notion_api_server: A mock authenticated Notion API server
+        bad_api_response: An API response payload
+        bridge_get_response: An API response payload
+
+    """
+    async with authenticated_notion_api_server:
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/base_stations/12345",
+            "get",
+            response=aiohttp.web_response.json_response(
+                bridge_get_response, status=200
+            ),
+        )
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/base_stations/98765",
+            "get",
+            response=aiohttp.web_response.json_response(bad_api_response, status=404),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client_with_credentials(
+                TEST_EMAIL, TEST_PASSWORD, session=session
+            )
+            bridges = await client.bridge.async_get_many([98765, 12345], concurrency=1)
+            assert len(bridges) == 2
+            assert isinstance(bridges[0], RequestError)
+            assert isinstance(bridges[1], Bridge)
+            assert bridges[1].id == 12345
+
+    aresponses.assert_plan_strictly_followed()
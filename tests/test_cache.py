@@ -0,0 +1,173 @@
+"""Define tests for the response cache."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+import aiohttp
+from aresponses import ResponsesMockServer
+import pytest
+
+from aionotion.cache import CachedEndpoint, ResponseCache
+from aionotion.client import Client
+from aionotion.user.models import UserPreferences
+from tests.common import TEST_EMAIL, TEST_PASSWORD
+
+TEST_PREFERENCES = UserPreferences(
+    user_id=12345,
+    military_time_enabled=False,
+    celsius_enabled=False,
+    disconnect_alerts_enabled=True,
+    home_away_alerts_enabled=False,
+    battery_alerts_enabled=True,
+)
+
+
+@pytest.mark.asyncio
+async def test_cached_endpoint(
+    aresponses: ResponsesMockServer,
+    authenticated_notion_api_server: ResponsesMockServer,
+    listener_definitions_response: dict[str, Any],
+    system_all_response: dict[str, Any],
+) -> None:
+    """Test that responses from cached endpoints are reused until invalidated.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_notion_api_server: A mock authenticated Notion API server
+        listener_definitions_response: An API response payload
+        system_all_response: An API response payload
+
+    """
+    async with authenticated_notion_api_server:
+        for _ in range(2):
+            authenticated_notion_api_server.add(
+                "api.getnotion.com",
+                "/api/listener_definitions",
+                "get",
+                response=aiohttp.web_response.json_response(
+                    listener_definitions_response, status=200
+                ),
+            )
+            # Systems aren't given a TTL, so every call goes to the network:
+            authenticated_notion_api_server.add(
+                "api.getnotion.com",
+                "/api/systems",
+                "get",
+                response=aiohttp.web_response.json_response(
+                    system_all_response, status=200
+                ),
+            )
+
+        async with aiohttp.ClientSession() as session:
+            client = Client(
+                session=session,
+                cache_ttls={CachedEndpoint.LISTENER_DEFINITIONS: 3600},
+            )
+            await client.async_authenticate_from_credentials(TEST_EMAIL, TEST_PASSWORD)
+
+            definitions = await client.listener.async_definitions()
+            assert await client.listener.async_definitions() is definitions
+            assert client.cache.hits == 1
+            assert client.cache.misses == 1
+
+            client.cache.invalidate(CachedEndpoint.LISTENER_DEFINITIONS)
+            assert await client.listener.async_definitions() is not definitions
+            assert client.cache.misses == 2
+
+            _ = await client.system.async_all()
+            _ = await client.system.async_all()
+            assert client.cache.hits == 1
+            assert len(client.cache) == 1
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_cached_endpoint_not_modified(
+    aresponses: ResponsesMockServer,
+    authenticated_notion_api_server: ResponsesMockServer,
+    system_all_response: dict[str, Any],
+) -> None:
+    """Test that a revalidated (304) response from a cached endpoint is re-cached.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_notion_api_server: A mock authenticated Notion API server
+        system_all_response: An API response payload
+
+    """
+    async with authenticated_notion_api_server:
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/systems",
+            "get",
+            response=aiohttp.web_response.json_response(
+                system_all_response, headers={"ETag": '"abc123"'}, status=200
+            ),
+        )
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/systems",
+            "get",
+            response=aiohttp.web.Response(status=304),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = Client(session=session, cache_ttls={CachedEndpoint.SYSTEMS: 3600})
+            await client.async_authenticate_from_credentials(TEST_EMAIL, TEST_PASSWORD)
+
+            systems = await client.system.async_all()
+            client.cache.invalidate(CachedEndpoint.SYSTEMS)
+            assert len(client.cache) == 0
+
+            # The revalidated response is the stored one, and it's cached again:
+            assert await client.system.async_all() is systems
+            assert len(client.cache) == 1
+            assert await client.system.async_all() is systems
+            assert client.cache.hits == 1
+
+    aresponses.assert_plan_strictly_followed()
+
+
+def test_cache_expiration() -> None:
+    """Test that cached responses expire after their TTL."""
+    cache = ResponseCache({CachedEndpoint.USER_PREFERENCES: 60})
+
+    with patch("aionotion.cache.time.monotonic", return_value=1000):
+        cache.set(CachedEndpoint.USER_PREFERENCES, "/prefs", TEST_PREFERENCES)
+        assert cache.get(CachedEndpoint.USER_PREFERENCES, "/prefs") is TEST_PREFERENCES
+
+    with patch("aionotion.cache.time.monotonic", return_value=1060):
+        assert cache.get(CachedEndpoint.USER_PREFERENCES, "/prefs") is None
+
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert len(cache) == 0
+
+
+def test_cache_size_bound() -> None:
+    """Test that the least recently used response is evicted beyond the max size."""
+    cache = ResponseCache(
+        {CachedEndpoint.USER_INFO: 60, CachedEndpoint.USER_PREFERENCES: 60},
+        max_size=2,
+    )
+    cache.set(CachedEndpoint.USER_PREFERENCES, "/a", TEST_PREFERENCES)
+    cache.set(CachedEndpoint.USER_PREFERENCES, "/b", TEST_PREFERENCES)
+    assert cache.get(CachedEndpoint.USER_PREFERENCES, "/a") is TEST_PREFERENCES
+    cache.set(CachedEndpoint.USER_PREFERENCES, "/c", TEST_PREFERENCES)
+
+    assert len(cache) == 2
+    assert cache.get(CachedEndpoint.USER_PREFERENCES, "/b") is None
+    assert cache.get(CachedEndpoint.USER_PREFERENCES, "/a") is TEST_PREFERENCES
+
+    # Endpoints without a TTL are never cached:
+    cache.set(CachedEndpoint.SYSTEMS, "/systems", TEST_PREFERENCES)
+    assert not cache.is_enabled(CachedEndpoint.SYSTEMS)
+    assert len(cache) == 2
+
+    cache.invalidate()
+    assert len(cache) == 0
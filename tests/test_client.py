@@ -4,10 +4,13 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
+import subprocess
+import sys
 from time import time
-from typing import Any
-from unittest.mock import Mock
+from typing import Any, cast
+from unittest.mock import Mock, patch
 
 import aiohttp
 from aresponses import ResponsesMockServer
@@ -17,8 +20,11 @@ from aionotion import (
     async_get_client_with_credentials,
     async_get_client_with_refresh_token,
 )
+from aionotion.bridge.models import BridgeAllResponse
 from aionotion.client import Client
-from aionotion.errors import InvalidCredentialsError, RequestError
+from aionotion.errors import InvalidCredentialsError, RateLimitError, RequestError
+from aionotion.metrics import RequestMetrics
+from aionotion.util.decode import get_default_json_decoder, get_model_decoder
 
 from .common import TEST_EMAIL, TEST_PASSWORD, TEST_REFRESH_TOKEN, TEST_USER_UUID
 
@@ -210,6 +216,80 @@ async def test_auth_refresh_token_success_existing_client(
     aresponses.assert_plan_strictly_followed()
 
 
+@pytest.mark.asyncio
+async def test_conditional_request(
+    aresponses: ResponsesMockServer,
+    authenticated_notion_api_server: ResponsesMockServer,
+    bridge_all_response: dict[str, Any],
+) -> None:
+    """Test that GET responses are revalidated with ETag/Last-Modified validators.
+
+    Args:
+    ----
+        aresponses: An aresponses server
+        authenticated_notion_api_server: A mock authenticated Notion API server
+        bridge_all_response: An API response payload
+
+    """
+    last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+    request_headers: list[dict[str, str]] = []
+
+    def not_modified_response(request: aiohttp.web.Request) -> aiohttp.web.Response:
+        """Return a 304 response (and record the request's headers).
+
+        Args:
+        ----
+            request: The incoming request.
+
+        Returns:
+        -------
+            A 304 response.
+
+        """
+        request_headers.append(dict(request.headers))
+        return aiohttp.web.Response(status=304)
+
+    async with authenticated_notion_api_server, aiohttp.ClientSession() as session:
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/base_stations",
+            "get",
+            response=aiohttp.web_response.json_response(
+                bridge_all_response,
+                headers={"ETag": '"abc123"', "Last-Modified": last_modified},
+                status=200,
+            ),
+        )
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/base_stations",
+            "get",
+            response=not_modified_response,
+        )
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/base_stations",
+            "get",
+            response=aiohttp.web_response.json_response(
+                bridge_all_response, status=200
+            ),
+        )
+
+        client = await async_get_client_with_credentials(
+            TEST_EMAIL, TEST_PASSWORD, session=session
+        )
+        bridges = await client.bridge.async_all()
+        assert await client.bridge.async_all() is bridges
+        assert request_headers[0]["If-None-Match"] == '"abc123"'
+        assert request_headers[0]["If-Modified-Since"] == last_modified
+
+        # A response without validators stops the endpoint from being revalidated:
+        assert await client.bridge.async_all() is not bridges
+        assert "/base_stations" not in client._conditional_responses
+
+    aresponses.assert_plan_strictly_followed()
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("access_token_issued_at", [time() - 30 * 60])
 async def test_expired_access_token(
@@ -309,6 +389,373 @@ async def test_expired_access_token_concurrent_calls(
     aresponses.assert_plan_strictly_followed()
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("access_token_issued_at", [time() - 30 * 60])
+async def test_expired_access_token_single_flight_refresh(
+    aresponses: ResponsesMockServer,
+    authenticated_notion_api_server: ResponsesMockServer,
+    bridge_all_response: dict[str, Any],
+) -> None:
+    """Test that concurrent calls with an expired access token share one refresh.
+
+    Args:
+    ----
+        aresponses: An aresponses server
+        authenticated_notion_api_server: A mock authenticated Notion API server.
+        bridge_all_response: An API response payload.
+
+    """
+    async with authenticated_notion_api_server, aiohttp.ClientSession() as session:
+        for _ in range(5):
+            authenticated_notion_api_server.add(
+                "api.getnotion.com",
+                "/api/base_stations",
+                "get",
+                response=aiohttp.web_response.json_response(
+                    bridge_all_response, status=200
+                ),
+            )
+
+        client = await async_get_client_with_credentials(
+            TEST_EMAIL, TEST_PASSWORD, session=session
+        )
+        refresh_token_callback = Mock()
+        client.add_refresh_token_callback(refresh_token_callback)
+
+        results = await asyncio.gather(*(client.bridge.async_all() for _ in range(5)))
+        assert len(results) == 5
+
+        # Only one refresh request was registered with the mock server, so the plan
+        # check below also verifies that the refresh was performed exactly once:
+        refresh_token_callback.assert_called_once()
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_request_during_explicit_refresh(
+    aresponses: ResponsesMockServer,
+    auth_credentials_success_response: dict[str, Any],
+    auth_refresh_token_success_response: dict[str, Any],
+    bridge_all_response: dict[str, Any],
+) -> None:
+    """Test that a request waits for an explicit refresh that is in progress.
+
+    Args:
+    ----
+        aresponses: An aresponses server
+        auth_credentials_success_response: An API response payload
+        auth_refresh_token_success_response: An API response payload
+        bridge_all_response: An API response payload
+
+    """
+    refresh_started = asyncio.Event()
+    release_refresh = asyncio.Event()
+    request_headers: list[dict[str, str]] = []
+
+    async def refresh_response(_: aiohttp.web.Request) -> aiohttp.web.Response:
+        """Return a refresh response once the test allows it.
+
+        Returns
+        -------
+            A refresh response.
+
+        """
+        refresh_started.set()
+        await release_refresh.wait()
+        return aiohttp.web_response.json_response(
+            auth_refresh_token_success_response, status=200
+        )
+
+    def bridge_response(request: aiohttp.web.Request) -> aiohttp.web.Response:
+        """Return a bridge response (and record the request's headers).
+
+        Args:
+        ----
+            request: The incoming request.
+
+        Returns:
+        -------
+            A bridge response.
+
+        """
+        request_headers.append(dict(request.headers))
+        return aiohttp.web_response.json_response(bridge_all_response, status=200)
+
+    aresponses.add(
+        "api.getnotion.com",
+        "/api/auth/login",
+        "post",
+        response=aiohttp.web_response.json_response(
+            auth_credentials_success_response, status=200
+        ),
+    )
+    aresponses.add(
+        "api.getnotion.com",
+        f"/api/auth/{TEST_USER_UUID}/refresh",
+        "post",
+        response=refresh_response,
+    )
+    aresponses.add(
+        "api.getnotion.com", "/api/base_stations", "get", response=bridge_response
+    )
+
+    async with aiohttp.ClientSession() as session:
+        client = await async_get_client_with_credentials(
+            TEST_EMAIL, TEST_PASSWORD, session=session
+        )
+        refresh = asyncio.create_task(client.async_authenticate_from_refresh_token())
+        await refresh_started.wait()
+
+        request = asyncio.create_task(client.bridge.async_all())
+        await asyncio.sleep(0.01)
+        assert not request.done()
+        assert not request_headers
+
+        release_refresh.set()
+        await refresh
+        await request
+
+        # The request was sent with the refreshed access token:
+        jwt = auth_refresh_token_success_response["auth"]["jwt"]
+        assert request_headers[0]["Authorization"] == f"Bearer {jwt}"
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("access_token_issued_at", [time() - 30 * 60])
+async def test_close_during_refresh(
+    aresponses: ResponsesMockServer, auth_credentials_success_response: dict[str, Any]
+) -> None:
+    """Test that closing the client cancels a refresh that is in progress.
+
+    Args:
+    ----
+        aresponses: An aresponses server
+        auth_credentials_success_response: An API response payload
+
+    """
+    refresh_started = asyncio.Event()
+
+    async def refresh_response(_: aiohttp.web.Request) -> aiohttp.web.Response:
+        """Never return a refresh response.
+
+        Returns
+        -------
+            A refresh response.
+
+        """
+        refresh_started.set()
+        await asyncio.Event().wait()
+        return aiohttp.web.Response(status=500)  # pragma: no cover
+
+    aresponses.add(
+        "api.getnotion.com",
+        "/api/auth/login",
+        "post",
+        response=aiohttp.web_response.json_response(
+            auth_credentials_success_response, status=200
+        ),
+    )
+    aresponses.add(
+        "api.getnotion.com",
+        f"/api/auth/{TEST_USER_UUID}/refresh",
+        "post",
+        response=refresh_response,
+    )
+
+    async with aiohttp.ClientSession() as session:
+        client = await async_get_client_with_credentials(
+            TEST_EMAIL, TEST_PASSWORD, session=session
+        )
+        request = asyncio.create_task(client.bridge.async_all())
+        await refresh_started.wait()
+
+        await client.async_close()
+        with pytest.raises(asyncio.CancelledError):
+            await request
+        assert client._refresh_task is not None
+        assert client._refresh_task.cancelled()
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("access_token_issued_at", [time() - 14.5 * 60])
+async def test_expiring_access_token_proactive_refresh(
+    aresponses: ResponsesMockServer,
+    authenticated_notion_api_server: ResponsesMockServer,
+    bridge_all_response: dict[str, Any],
+    caplog: Mock,
+) -> None:
+    """Test that an access token is refreshed shortly before it expires.
+
+    Args:
+    ----
+        aresponses: An aresponses server
+        authenticated_notion_api_server: A mock authenticated Notion API server
+        bridge_all_response: An API response payload
+        caplog: A mocked logging utility.
+
+    """
+    caplog.set_level(logging.DEBUG)
+
+    async with authenticated_notion_api_server, aiohttp.ClientSession() as session:
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/base_stations",
+            "get",
+            response=aiohttp.web_response.json_response(
+                bridge_all_response, status=200
+            ),
+        )
+
+        client = await async_get_client_with_credentials(
+            TEST_EMAIL, TEST_PASSWORD, session=session
+        )
+        old_access_token = client._access_token
+        _ = await client.bridge.async_all()
+        assert client._access_token != old_access_token
+        assert any(
+            m
+            for m in caplog.messages
+            if "Access token about to expire, refreshing..." in m
+        )
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("access_token_issued_at", [time() - 14.5 * 60])
+async def test_expiring_access_token_proactive_refresh_failure(
+    aresponses: ResponsesMockServer,
+    auth_credentials_success_response: dict[str, Any],
+    bridge_all_response: dict[str, Any],
+    caplog: Mock,
+) -> None:
+    """Test that a failed refresh of a still-valid access token doesn't fail requests.
+
+    Args:
+    ----
+        aresponses: An aresponses server
+        auth_credentials_success_response: An API response payload
+        bridge_all_response: An API response payload
+        caplog: A mocked logging utility.
+
+    """
+    request_headers: list[dict[str, str]] = []
+
+    def bridge_response(request: aiohttp.web.Request) -> aiohttp.web.Response:
+        """Return a bridge response (and record the request's headers).
+
+        Args:
+        ----
+            request: The incoming request.
+
+        Returns:
+        -------
+            A bridge response.
+
+        """
+        request_headers.append(dict(request.headers))
+        return aiohttp.web_response.json_response(bridge_all_response, status=200)
+
+    aresponses.add(
+        "api.getnotion.com",
+        "/api/auth/login",
+        "post",
+        response=aiohttp.web_response.json_response(
+            auth_credentials_success_response, status=200
+        ),
+    )
+    aresponses.add(
+        "api.getnotion.com",
+        f"/api/auth/{TEST_USER_UUID}/refresh",
+        "post",
+        response=aresponses.Response(text="Unavailable", status=503),
+    )
+    aresponses.add(
+        "api.getnotion.com", "/api/base_stations", "get", response=bridge_response
+    )
+
+    async with aiohttp.ClientSession() as session:
+        client = await async_get_client_with_credentials(
+            TEST_EMAIL, TEST_PASSWORD, session=session
+        )
+        access_token = client._access_token
+        bridges = await client.bridge.async_all()
+        assert len(bridges) == 1
+
+        # The request was sent with the current access token:
+        assert request_headers[0]["Authorization"] == f"Bearer {access_token}"
+        assert any(
+            m
+            for m in caplog.messages
+            if "Access token refresh failed, using the current one" in m
+        )
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("payload_log_sample_rate", "expected_log_count"), [(0.0, 0), (1.0, 2)]
+)
+async def test_payload_logging(
+    aresponses: ResponsesMockServer,
+    authenticated_notion_api_server: ResponsesMockServer,
+    auth_credentials_success_response: dict[str, Any],
+    bridge_all_response: dict[str, Any],
+    caplog: Mock,
+    expected_log_count: int,
+    payload_log_sample_rate: float,
+) -> None:
+    """Test that response payloads are logged sampled, truncated, and redacted.
+
+    Args:
+    ----
+        aresponses: An aresponses server
+        authenticated_notion_api_server: A mock authenticated Notion API server
+        auth_credentials_success_response: An API response payload
+        bridge_all_response: An API response payload
+        caplog: A mocked logging utility.
+        expected_log_count: The number of payloads expected to be logged
+        payload_log_sample_rate: The fraction of payloads to log
+
+    """
+    caplog.set_level(logging.DEBUG)
+
+    async with authenticated_notion_api_server, aiohttp.ClientSession() as session:
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/base_stations",
+            "get",
+            response=aiohttp.web_response.json_response(
+                bridge_all_response, status=200
+            ),
+        )
+
+        client = Client(
+            session=session,
+            payload_log_max_length=400,
+            payload_log_sample_rate=payload_log_sample_rate,
+        )
+        await client.async_authenticate_from_credentials(TEST_EMAIL, TEST_PASSWORD)
+        await client.bridge.async_all()
+
+    messages = [m for m in caplog.messages if m.startswith("Received data")]
+    assert len(messages) == expected_log_count
+    for message in messages:
+        assert message.endswith("more bytes)")
+        assert auth_credentials_success_response["auth"]["jwt"][:20] not in message
+    if messages:
+        # The access token is redacted, even though it was cut off:
+        assert '"jwt": "***"' in messages[0]
+
+    aresponses.assert_plan_strictly_followed()
+
+
 @pytest.mark.asyncio
 async def test_premature_refresh_token(
     aresponses: ResponsesMockServer,
@@ -330,6 +777,217 @@ async def test_premature_refresh_token(
     aresponses.assert_plan_strictly_followed()
 
 
+@pytest.mark.asyncio
+async def test_json_decoder(
+    aresponses: ResponsesMockServer,
+    authenticated_notion_api_server: ResponsesMockServer,
+    bridge_all_response: dict[str, Any],
+) -> None:
+    """Test using a custom JSON decoder.
+
+    Args:
+    ----
+        aresponses: An aresponses server
+        authenticated_notion_api_server: A mock authenticated Notion API server
+        bridge_all_response: An API response payload
+
+    """
+    async with authenticated_notion_api_server, aiohttp.ClientSession() as session:
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/base_stations",
+            "get",
+            response=aiohttp.web_response.json_response(
+                bridge_all_response, status=200
+            ),
+        )
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/base_stations",
+            "get",
+            response=aiohttp.web.Response(body=b"not json", status=200),
+        )
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/base_stations",
+            "get",
+            response=aiohttp.web.Response(body=b"", status=200),
+        )
+
+        json_decoder = Mock(wraps=json.loads)
+        client = Client(session=session, json_decoder=json_decoder)
+        await client.async_authenticate_from_credentials(TEST_EMAIL, TEST_PASSWORD)
+        bridges = await client.bridge.async_all()
+        assert len(bridges) == 1
+        assert isinstance(json_decoder.call_args.args[0], bytes)
+
+        with pytest.raises(RequestError):
+            await client.bridge.async_all()
+
+        # An empty body isn't passed to the decoder:
+        json_decoder.reset_mock()
+        assert await client.async_request("get", "/base_stations") == {}
+        json_decoder.assert_not_called()
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("endpoint", "target", "payload_fixture"),
+    [
+        ("/api/base_stations", "bridge", "bridge_all_response"),
+        ("/api/sensor/listeners", "listener", "sensor_listeners_response"),
+        ("/api/sensors", "sensor", "sensor_all_response"),
+    ],
+)
+async def test_direct_decode(
+    aresponses: ResponsesMockServer,
+    authenticated_notion_api_server: ResponsesMockServer,
+    endpoint: str,
+    payload_fixture: str,
+    request: pytest.FixtureRequest,
+    target: str,
+) -> None:
+    """Test decoding response bodies straight into models.
+
+    Args:
+    ----
+        aresponses: An aresponses server
+        authenticated_notion_api_server: A mock authenticated Notion API server
+        endpoint: The API endpoint to request
+        payload_fixture: The name of the fixture with the API response payload
+        request: A pytest request object
+        target: The client endpoint attribute to request with
+
+    """
+    pytest.importorskip("msgspec")
+    payload = request.getfixturevalue(payload_fixture)
+
+    async with authenticated_notion_api_server, aiohttp.ClientSession() as session:
+        for _ in range(2):
+            authenticated_notion_api_server.add(
+                "api.getnotion.com",
+                endpoint,
+                "get",
+                response=aiohttp.web_response.json_response(payload, status=200),
+            )
+
+        json_decoder = Mock(wraps=json.loads)
+        client = Client(session=session, json_decoder=json_decoder, direct_decode=True)
+        await client.async_authenticate_from_credentials(TEST_EMAIL, TEST_PASSWORD)
+        json_decoder.reset_mock()
+        decoded = await getattr(client, target).async_all()
+        json_decoder.assert_not_called()
+
+        client._direct_decode = False
+        client._conditional_responses.clear()
+        assert decoded == await getattr(client, target).async_all()
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_direct_decode_fallback(
+    aresponses: ResponsesMockServer,
+    authenticated_notion_api_server: ResponsesMockServer,
+    bridge_all_response: dict[str, Any],
+) -> None:
+    """Test that payloads msgspec can't decode are still validated the regular way.
+
+    Args:
+    ----
+        aresponses: An aresponses server
+        authenticated_notion_api_server: A mock authenticated Notion API server
+        bridge_all_response: An API response payload
+
+    """
+    pytest.importorskip("msgspec")
+
+    # ciso8601 (but not msgspec) accepts datetimes without a "T" separator:
+    bridge = {**bridge_all_response["base_stations"][0]}
+    bridge["created_at"] = bridge["created_at"].replace("T", " ")
+
+    async with authenticated_notion_api_server, aiohttp.ClientSession() as session:
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/base_stations",
+            "get",
+            response=aiohttp.web_response.json_response(
+                {"base_stations": [bridge]}, status=200
+            ),
+        )
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/base_stations",
+            "get",
+            response=aiohttp.web_response.json_response({}, status=200),
+        )
+
+        client = Client(session=session, direct_decode=True)
+        await client.async_authenticate_from_credentials(TEST_EMAIL, TEST_PASSWORD)
+        bridges = await client.bridge.async_all()
+        assert bridges[0].created_at.isoformat() == "2019-04-30T01:43:50.497000+00:00"
+
+        with pytest.raises(RequestError):
+            await client.bridge.async_all()
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.parametrize(
+    ("blocked_modules", "expected_decoder"),
+    [
+        ([], "orjson.loads"),
+        (["orjson"], "get_default_json_decoder.<locals>.msgspec_loads"),
+        (["orjson", "msgspec"], "json.loads"),
+    ],
+)
+def test_default_json_decoder(
+    blocked_modules: list[str], expected_decoder: str
+) -> None:
+    """Test that the fastest installed JSON decoder is used by default.
+
+    Args:
+    ----
+        blocked_modules: Modules to treat as not installed
+        expected_decoder: The qualified name of the expected decoder
+
+    """
+    pytest.importorskip("orjson")
+    pytest.importorskip("msgspec")
+
+    with patch.dict("sys.modules", dict.fromkeys(blocked_modules)):
+        decoder = get_default_json_decoder()
+
+    assert f"{decoder.__module__}.{decoder.__qualname__}".endswith(expected_decoder)
+    assert decoder(b'{"a": [1, 2]}') == {"a": [1, 2]}
+    with pytest.raises(ValueError):  # noqa: PT011
+        decoder(b"not json")
+
+
+def test_lazy_imports() -> None:
+    """Test that importing the library doesn't import any endpoints or models."""
+    result = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-c",
+            "import sys, aionotion; print(' '.join(sorted(sys.modules)))",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    modules = result.stdout.split()
+    assert "aionotion.client" in modules
+    for endpoint in ("bridge", "listener", "sensor", "system", "user"):
+        assert f"aionotion.{endpoint}" not in modules
+        assert f"aionotion.{endpoint}.models" not in modules
+
+    client = Client()
+    assert client.bridge is client.bridge
+
+
 @pytest.mark.asyncio
 async def test_no_explicit_session(
     aresponses: ResponsesMockServer,
@@ -346,6 +1004,121 @@ async def test_no_explicit_session(
     async with authenticated_notion_api_server:
         client = await async_get_client_with_credentials(TEST_EMAIL, TEST_PASSWORD)
         assert client._access_token is not None
+        await client.async_close()
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_no_explicit_session_pooling(
+    aresponses: ResponsesMockServer,
+    authenticated_notion_api_server: ResponsesMockServer,
+    bridge_all_response: dict[str, Any],
+) -> None:
+    """Test that a client-owned session is reused across requests and then closed.
+
+    Args:
+    ----
+        aresponses: An aresponses server
+        authenticated_notion_api_server: A mock authenticated Notion API server
+        bridge_all_response: An API response payload
+
+    """
+    async with authenticated_notion_api_server:
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/base_stations",
+            "get",
+            response=aiohttp.web_response.json_response(
+                bridge_all_response, status=200
+            ),
+        )
+
+        async with Client(connection_limit_per_host=5) as client:
+            await client.async_authenticate_from_credentials(TEST_EMAIL, TEST_PASSWORD)
+            session = client._owned_session
+            assert session is not None
+            assert session.connector is not None
+            assert session.connector.limit_per_host == 5
+
+            _ = await client.bridge.async_all()
+            assert client._owned_session is session
+
+        assert session.closed
+        # Closing the client resets the session (which mypy would otherwise consider
+        # narrowed by the assertion above):
+        assert cast(aiohttp.ClientSession | None, client._owned_session) is None
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_explicit_session_not_closed(
+    aresponses: ResponsesMockServer,
+    authenticated_notion_api_server: ResponsesMockServer,
+) -> None:
+    """Test that closing the client leaves a caller-provided session open.
+
+    Args:
+    ----
+        aresponses: An aresponses server
+        authenticated_notion_api_server: A mock authenticated Notion API server
+
+    """
+    async with authenticated_notion_api_server, aiohttp.ClientSession() as session:
+        async with Client(session=session) as client:
+            await client.async_authenticate_from_credentials(TEST_EMAIL, TEST_PASSWORD)
+            assert client._owned_session is None
+
+        assert not session.closed
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("retry_after", "expected_retry_after"),
+    [
+        ("30", 30),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 0),
+        ("Wed, 21 Oct 2015 07:28:00 -0000", 0),
+        ("whenever", None),
+        (None, None),
+    ],
+)
+async def test_rate_limited(
+    aresponses: ResponsesMockServer,
+    authenticated_notion_api_server: ResponsesMockServer,
+    retry_after: str | None,
+    expected_retry_after: float | None,
+) -> None:
+    """Test a rate-limited request.
+
+    Args:
+    ----
+        aresponses: An aresponses server
+        authenticated_notion_api_server: A mock authenticated Notion API server
+        retry_after: The Retry-After header returned by the API
+        expected_retry_after: The expected number of seconds to wait
+
+    """
+    async with authenticated_notion_api_server, aiohttp.ClientSession() as session:
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/base_stations",
+            "get",
+            response=aiohttp.web.Response(
+                status=429,
+                headers={"Retry-After": retry_after} if retry_after else None,
+            ),
+        )
+
+        client = await async_get_client_with_credentials(
+            TEST_EMAIL, TEST_PASSWORD, session=session
+        )
+        with pytest.raises(RateLimitError) as err:
+            await client.bridge.async_all()
+        assert err.value.retry_after == expected_retry_after
 
     aresponses.assert_plan_strictly_followed()
 
@@ -390,6 +1163,95 @@ async def test_refresh_token_callback(
         # Ensure that the callback was called only once:
         refresh_token_callback.assert_called_once_with(client._refresh_token)
 
+        await client.async_close()
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("access_token_issued_at", [time() - 30 * 60])
+@pytest.mark.parametrize("direct_decode", [False, True])
+async def test_request_metrics(
+    aresponses: ResponsesMockServer,
+    authenticated_notion_api_server: ResponsesMockServer,
+    bad_api_response: dict[str, Any],
+    bridge_all_response: dict[str, Any],
+    direct_decode: bool,
+) -> None:
+    """Test that the metrics of every request are reported.
+
+    Args:
+    ----
+        aresponses: An aresponses server
+        authenticated_notion_api_server: A mock authenticated Notion API server
+        bad_api_response: An API response payload
+        bridge_all_response: An API response payload
+        direct_decode: Whether to decode responses straight into models
+
+    """
+    async with authenticated_notion_api_server, aiohttp.ClientSession() as session:
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/base_stations",
+            "get",
+            response=aiohttp.web_response.json_response(
+                bridge_all_response, status=200
+            ),
+        )
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/bad_endpoint",
+            "get",
+            response=aiohttp.web_response.json_response(bad_api_response, status=400),
+        )
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/base_stations",
+            "get",
+            response=aiohttp.web_response.json_response(
+                bridge_all_response, status=200
+            ),
+        )
+
+        client = Client(session=session, direct_decode=direct_decode)
+        metrics: list[RequestMetrics] = []
+        remove_callback = client.add_request_metrics_callback(metrics.append)
+
+        await client.async_authenticate_from_credentials(TEST_EMAIL, TEST_PASSWORD)
+        # The (expired) access token is refreshed before the bridges are requested:
+        await client.bridge.async_all()
+
+        # Prevent the access token from being refreshed again:
+        client._access_token_expires_at = None
+        with pytest.raises(RequestError):
+            await client.async_request("get", "/bad_endpoint")
+
+        remove_callback()
+        await client.async_request("get", "/base_stations")
+
+    assert [(m.method, m.endpoint, m.status, m.success) for m in metrics] == [
+        ("post", "/auth/login", 200, True),
+        ("post", f"/auth/{TEST_USER_UUID}/refresh", 200, True),
+        ("get", "/base_stations", 200, True),
+        ("get", "/bad_endpoint", 400, False),
+    ]
+    _, refresh, bridges, bad_endpoint = metrics
+
+    assert bridges.refresh_wait >= refresh.latency > 0
+    assert bridges.latency >= bridges.refresh_wait + bridges.validation_time
+    assert bridges.bytes_received == len(json.dumps(bridge_all_response))
+    assert bridges.validation_time > 0
+    # Responses are only decoded straight into models when msgspec is installed (and
+    # otherwise fall back to being decoded as JSON):
+    decoded_directly = (
+        direct_decode and get_model_decoder(BridgeAllResponse) is not None
+    )
+    assert (bridges.decode_time > 0) is not decoded_directly
+
+    assert isinstance(bad_endpoint.error, RequestError)
+    assert bad_endpoint.bytes_received > 0
+    assert bad_endpoint.validation_time == 0
+
     aresponses.assert_plan_strictly_followed()
 
 
@@ -0,0 +1,176 @@
+"""Define tests for the fake Notion API server."""
+
+# pylint: disable=protected-access
+from __future__ import annotations
+
+from http import HTTPStatus
+from time import time
+
+import jwt
+import pytest
+
+from aionotion.client import Client
+from aionotion.errors import InvalidCredentialsError, RateLimitError, RequestError
+from aionotion.listener.models import ListenerKind
+from aionotion.testing import FakeNotionServer, generate_account
+
+from .common import TEST_REFRESH_TOKEN
+
+
+def test_generate_account() -> None:
+    """Test that a synthetic account is generated at the requested size."""
+    account = generate_account(
+        systems=3, bridges_per_system=2, sensors_per_system=4, listeners_per_sensor=2
+    )
+    assert len(account.systems) == 3
+    assert len(account.bridges) == 6
+    assert len(account.sensors) == 12
+    assert len(account.listeners) == 24
+    assert len({sensor["uuid"] for sensor in account.sensors}) == 12
+    assert generate_account() == generate_account()
+
+
+@pytest.mark.asyncio
+async def test_fake_server_snapshot() -> None:
+    """Test getting a snapshot of an account from the fake server."""
+    account = generate_account(systems=2, sensors_per_system=3, listeners_per_sensor=2)
+
+    async with (
+        FakeNotionServer(account) as server,
+        Client(api_base=server.api_base) as client,
+    ):
+        await client.async_authenticate_from_credentials(
+            account.email, account.password
+        )
+        snapshot = await client.async_snapshot()
+
+        assert len(snapshot.systems) == 2
+        assert len(snapshot.bridges) == 2
+        assert len(snapshot.sensors) == 6
+        assert len(snapshot.listeners) == 12
+        assert {listener.kind for listener in snapshot.listeners} == {
+            ListenerKind.TEMPERATURE,
+            ListenerKind.LEAK,
+        }
+        assert snapshot.user.email == account.email
+        assert len(snapshot.graph.get_listeners_for_system(1)) == 6
+
+        sensors = [sensor async for sensor in client.sensor.async_iter_all()]
+        assert sensors == list(snapshot.sensors)
+        assert (await client.sensor.async_get(2)).name == "Sensor 2"
+        with pytest.raises(RequestError):
+            await client.sensor.async_get(999)
+
+
+@pytest.mark.asyncio
+async def test_fake_server_token_expiry() -> None:
+    """Test that expiring access tokens are refreshed against the fake server."""
+    async with FakeNotionServer(token_lifetime=30) as server:
+        # Every access token expires within the client's refresh margin, so each
+        # request refreshes it first:
+        async with Client(api_base=server.api_base) as client:
+            await client.async_authenticate_from_credentials(
+                server.account.email, server.account.password
+            )
+            refresh_token = client.refresh_token
+            await client.system.async_all()
+            await client.bridge.async_all()
+            assert client.refresh_token != refresh_token
+            assert server.request_count == 5
+
+        # A refresh token can't be reused:
+        async with Client(api_base=server.api_base) as client:
+            client.user_uuid = server.account.user["uuid"]
+            with pytest.raises(InvalidCredentialsError):
+                await client.async_authenticate_from_refresh_token(
+                    refresh_token=refresh_token
+                )
+
+            with pytest.raises(InvalidCredentialsError):
+                await client.async_authenticate_from_credentials(
+                    server.account.email, "wrong password"
+                )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("error_status", "error"),
+    [
+        (HTTPStatus.INTERNAL_SERVER_ERROR, RequestError),
+        (HTTPStatus.TOO_MANY_REQUESTS, RateLimitError),
+    ],
+)
+async def test_fake_server_errors(
+    error: type[Exception], error_status: HTTPStatus
+) -> None:
+    """Test that the fake server fails requests at the configured rate.
+
+    Args:
+    ----
+        error: The error that a failed request raises
+        error_status: The HTTP status with which requests fail
+
+    """
+    async with (
+        FakeNotionServer(
+            error_rate=1, error_status=error_status, latency=0.01
+        ) as server,
+        Client(api_base=server.api_base) as client,
+    ):
+        await client.async_authenticate_from_credentials(
+            server.account.email, server.account.password
+        )
+        with pytest.raises(error):
+            await client.sensor.async_all()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kind", ["missing", "invalid", "expired"])
+async def test_fake_server_unauthorized(kind: str) -> None:
+    """Test that the fake server rejects requests without a valid access token.
+
+    Args:
+    ----
+        kind: The kind of access token to send
+
+    """
+    async with (
+        FakeNotionServer() as server,
+        Client(api_base=server.api_base) as client,
+    ):
+        access_tokens = {
+            "missing": None,
+            "invalid": "not-a-jwt",
+            "expired": jwt.encode(
+                {"exp": time() - 60}, server._secret, algorithm="HS256"
+            ),
+        }
+        client._access_token = access_tokens[kind]
+        client._refresh_token = TEST_REFRESH_TOKEN
+        with pytest.raises(InvalidCredentialsError):
+            await client.async_request("get", "/systems")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "endpoint", ["/users/{user_uuid}", "/users/{user_uuid}/user_preferences"]
+)
+async def test_fake_server_wrong_user(endpoint: str) -> None:
+    """Test that the fake server doesn't return another user's data.
+
+    Args:
+    ----
+        endpoint: The user endpoint to request
+
+    """
+    async with (
+        FakeNotionServer() as server,
+        Client(api_base=server.api_base) as client,
+    ):
+        await client.async_authenticate_from_credentials(
+            server.account.email, server.account.password
+        )
+        with pytest.raises(RequestError, match="Not found"):
+            await client.async_request(
+                "get", endpoint.format(user_uuid="some-other-user")
+            )
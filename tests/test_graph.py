@@ -0,0 +1,75 @@
+"""Define tests for entity graphs."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Any
+
+from aionotion.bridge.models import BridgeAllResponse
+from aionotion.graph import EntityGraph
+from aionotion.listener.models import ListenerAllResponse
+from aionotion.sensor.models import SensorAllResponse
+from aionotion.system.models import SystemAllResponse
+
+
+def test_entity_graph(
+    bridge_all_response: dict[str, Any],
+    sensor_all_response: dict[str, Any],
+    sensor_listeners_response: dict[str, Any],
+    system_all_response: dict[str, Any],
+) -> None:
+    """Test linking an account's entities.
+
+    Args:
+    ----
+        bridge_all_response: An API response payload
+        sensor_all_response: An API response payload
+        sensor_listeners_response: An API response payload
+        system_all_response: An API response payload
+
+    """
+    (system,) = SystemAllResponse.from_dict(system_all_response).systems
+    (bridge,) = BridgeAllResponse.from_dict(bridge_all_response).base_stations
+    (sensor,) = SensorAllResponse.from_dict(sensor_all_response).sensors
+    listeners = ListenerAllResponse.from_dict(sensor_listeners_response).listeners
+
+    # Put the sensor behind the bridge and add a second sensor that isn't behind any
+    # bridge (or in any known system):
+    sensor = replace(sensor, bridge=replace(sensor.bridge, id=bridge.id))
+    orphan = replace(
+        sensor,
+        id=1,
+        uuid="orphan",
+        bridge=replace(sensor.bridge, id=67890),
+        system_id=67890,
+    )
+    orphan_listener = replace(listeners[0], id="orphan-listener", sensor_id="orphan")
+
+    graph = EntityGraph(
+        systems=[system],
+        bridges=[bridge],
+        sensors=[sensor, orphan],
+        listeners=[*listeners, orphan_listener],
+    )
+
+    system_node = graph.systems[system.id]
+    bridge_node = graph.bridges[bridge.id]
+    sensor_node = graph.sensors[sensor.id]
+    assert system_node.bridges == [bridge_node]
+    assert system_node.sensors == [sensor_node]
+    assert bridge_node.system is system_node
+    assert bridge_node.sensors == [sensor_node]
+    assert sensor_node.bridge is bridge_node
+    assert sensor_node.system is system_node
+    assert sensor_node.listeners == listeners
+
+    assert graph.get_listeners_for_bridge(bridge.id) == listeners
+    assert graph.get_listeners_for_bridge(67890) == []
+    assert graph.get_listeners_for_system(system.id) == listeners
+    assert graph.get_listeners_for_system(67890) == []
+    assert graph.get_sensor_for_listener(listeners[0]) is sensor_node
+
+    orphan_node = graph.sensors_by_uuid["orphan"]
+    assert orphan_node.bridge is None
+    assert orphan_node.system is None
+    assert orphan_node.listeners == [orphan_listener]
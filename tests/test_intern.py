@@ -0,0 +1,89 @@
+"""Define tests for sharing repeated values among models."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+
+from aionotion.listener.models import ListenerAllResponse, ListenerLocalizedStatus
+from aionotion.sensor.models import SensorAllResponse
+from aionotion.util.decode import get_model_decoder
+from aionotion.util.intern import FlyweightCache
+
+
+def test_flyweight_cache() -> None:
+    """Test that equal values share a single, size-bounded set of instances."""
+    cache = FlyweightCache(ListenerLocalizedStatus, max_size=2)
+
+    idle = cache.get({"state": "Idle", "description": "Idle"})
+    assert cache.get({"state": "Idle", "description": "Idle"}) is idle
+    assert cache.get({"state": "Wet", "description": "Leak"}) is not idle
+    assert len(cache) == 2
+
+    # Touch the first instance so that the second one is evicted instead:
+    assert cache.get({"state": "Idle", "description": "Idle"}) is idle
+    cache.get({"state": "Dry", "description": "No leak"})
+    assert len(cache) == 2
+    assert cache.get({"state": "Idle", "description": "Idle"}) is idle
+
+
+def test_flyweight_cache_unhashable() -> None:
+    """Test that values that can't be shared are still validated."""
+    cache = FlyweightCache(ListenerLocalizedStatus)
+    status = cache.get({"state": "Idle", "description": "Idle", "extra": ["unused"]})
+    assert status == ListenerLocalizedStatus(state="Idle", description="Idle")
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize("direct_decode", [False, True])
+def test_shared_values(
+    direct_decode: bool,
+    sensor_all_response: dict[str, Any],
+    sensor_listeners_response: dict[str, Any],
+) -> None:
+    """Test that repeated values are shared among separately decoded models.
+
+    Args:
+    ----
+        direct_decode: Whether to decode responses straight into models
+        sensor_all_response: An API response payload
+        sensor_listeners_response: An API response payload
+
+    """
+    if direct_decode:
+        pytest.importorskip("msgspec")
+
+    def decode(model: Any, payload: dict[str, Any]) -> Any:  # noqa: ANN401
+        """Decode an API response payload into a model.
+
+        Args:
+        ----
+            model: The model to decode into
+            payload: An API response payload
+
+        Returns:
+        -------
+            The decoded model.
+
+        """
+        if direct_decode:
+            decoder = get_model_decoder(model)
+            assert decoder
+            return decoder(json.dumps(payload).encode())
+        return model.from_dict(payload)
+
+    listener1, listener2 = (
+        decode(ListenerAllResponse, sensor_listeners_response).listeners[0]
+        for _ in range(2)
+    )
+    assert listener1.status_localized is listener2.status_localized
+    assert listener1.device_type is listener2.device_type
+    assert listener1.model_version is listener2.model_version
+
+    sensor1, sensor2 = (
+        decode(SensorAllResponse, sensor_all_response).sensors[0] for _ in range(2)
+    )
+    assert sensor1.firmware is sensor2.firmware
+    assert sensor1.firmware_version is sensor2.firmware_version
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from copy import deepcopy
+from dataclasses import replace
 from datetime import datetime, timezone
 import logging
 from typing import Any
@@ -12,7 +14,10 @@ from aresponses import ResponsesMockServer
 import pytest
 
 from aionotion import async_get_client_with_credentials
-from aionotion.listener.models import ListenerKind
+from aionotion.client import Client
+from aionotion.listener.index import ListenerIndex
+from aionotion.listener.models import ListenerAllResponse, ListenerKind
+from aionotion.sensor.models import SensorAllResponse
 from tests.common import TEST_EMAIL, TEST_PASSWORD
 
 
@@ -110,6 +115,104 @@ async def test_listener_all(
     aresponses.assert_plan_strictly_followed()
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("direct_decode", [False, True])
+async def test_listener_all_lazy(
+    aresponses: ResponsesMockServer,
+    authenticated_notion_api_server: ResponsesMockServer,
+    direct_decode: bool,
+    sensor_listeners_response: dict[str, Any],
+) -> None:
+    """Test getting listeners whose rarely used fields are parsed lazily.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_notion_api_server: A mock authenticated Notion API server
+        direct_decode: Whether to decode responses straight into models
+        sensor_listeners_response: An API response payload
+
+    """
+    async with authenticated_notion_api_server:
+        for _ in range(2):
+            authenticated_notion_api_server.add(
+                "api.getnotion.com",
+                "/api/sensor/listeners",
+                "get",
+                response=aiohttp.web_response.json_response(
+                    sensor_listeners_response, status=200
+                ),
+            )
+
+        async with aiohttp.ClientSession() as session:
+            client = Client(session=session, direct_decode=direct_decode)
+            await client.async_authenticate_from_credentials(TEST_EMAIL, TEST_PASSWORD)
+            listeners = await client.listener.async_all()
+            lazy_listeners = await client.listener.async_all_lazy()
+            assert len(lazy_listeners) == 3
+            assert lazy_listeners[0].raw_created_at == "2019-06-17T03:29:45.722Z"
+
+            for listener, lazy_listener in zip(listeners, lazy_listeners, strict=True):
+                assert lazy_listener.created_at == listener.created_at
+                assert lazy_listener.created_at is lazy_listener.created_at
+                assert lazy_listener.status_localized == listener.status_localized
+                assert lazy_listener.configuration == listener.configuration
+                for attr in ("id", "model_version", "insights", "kind", "sensor_id"):
+                    assert getattr(lazy_listener, attr) == getattr(listener, attr)
+
+            # Lazily parsed fields serialize to exactly what the API sent:
+            serialized = lazy_listeners[0].to_dict()
+            raw = sensor_listeners_response["listeners"][0]
+            for key in ("configuration", "created_at", "status_localized"):
+                assert serialized[key] == raw[key]
+            assert serialized["device_type"] == raw["type"]
+
+            # ...under the same keys as the fully parsed listener:
+            assert serialized.keys() == listeners[0].to_dict().keys()
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("direct_decode", [False, True])
+async def test_listener_iter_all(
+    aresponses: ResponsesMockServer,
+    authenticated_notion_api_server: ResponsesMockServer,
+    direct_decode: bool,
+    sensor_listeners_response: dict[str, Any],
+) -> None:
+    """Test iterating over all listeners as they're received.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_notion_api_server: A mock authenticated Notion API server
+        direct_decode: Whether to decode responses straight into models
+        sensor_listeners_response: An API response payload
+
+    """
+    async with authenticated_notion_api_server:
+        for _ in range(2):
+            authenticated_notion_api_server.add(
+                "api.getnotion.com",
+                "/api/sensor/listeners",
+                "get",
+                response=aiohttp.web_response.json_response(
+                    sensor_listeners_response, status=200
+                ),
+            )
+
+        async with aiohttp.ClientSession() as session:
+            client = Client(session=session, direct_decode=direct_decode)
+            await client.async_authenticate_from_credentials(TEST_EMAIL, TEST_PASSWORD)
+            listeners = await client.listener.async_all()
+            assert [
+                listener async for listener in client.listener.async_iter_all()
+            ] == listeners
+
+    aresponses.assert_plan_strictly_followed()
+
+
 @pytest.mark.asyncio
 async def test_listener_definitions(
     aresponses: ResponsesMockServer,
@@ -158,3 +261,264 @@ async def test_listener_definitions(
             assert definitions[0].type == "sensor"
 
     aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_listener_kinds(
+    aresponses: ResponsesMockServer,
+    authenticated_notion_api_server: ResponsesMockServer,
+    caplog: Mock,
+    listener_definitions_response: dict[str, Any],
+    sensor_listeners_response: dict[str, Any],
+) -> None:
+    """Test resolving listener kinds (including ones learned from definitions).
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_notion_api_server: A mock authenticated Notion API server
+        caplog: A mocked logging utility.
+        listener_definitions_response: An API response payload
+        sensor_listeners_response: An API response payload
+
+    """
+    caplog.set_level(logging.INFO)
+
+    # Add a new definition that looks like the existing door definition:
+    definitions_response = deepcopy(listener_definitions_response)
+    door_definition = next(
+        definition
+        for definition in definitions_response["listener_definitions"]
+        if definition["id"] == ListenerKind.DOOR.value
+    )
+    definitions_response["listener_definitions"].append(
+        {**door_definition, "id": 99999}
+    )
+
+    async with authenticated_notion_api_server:
+        for _ in range(2):
+            authenticated_notion_api_server.add(
+                "api.getnotion.com",
+                "/api/sensor/listeners",
+                "get",
+                response=aiohttp.web_response.json_response(
+                    sensor_listeners_response, status=200
+                ),
+            )
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/listener_definitions",
+            "get",
+            response=aiohttp.web_response.json_response(
+                definitions_response, status=200
+            ),
+        )
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/sensor/listeners",
+            "get",
+            response=aiohttp.web_response.json_response(
+                sensor_listeners_response, status=200
+            ),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client_with_credentials(
+                TEST_EMAIL, TEST_PASSWORD, session=session
+            )
+
+            # Unknown kinds are only logged the first time they're seen:
+            for _ in range(2):
+                listeners = await client.listener.async_all()
+                client._conditional_responses.clear()
+                assert listeners[2].kind == ListenerKind.UNKNOWN
+            assert (
+                sum("Unknown listener kind: 99999" in m for m in caplog.messages) == 1
+            )
+
+            await client.listener.async_definitions()
+            listeners = await client.listener.async_all()
+            assert listeners[2].kind == ListenerKind.DOOR
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_listener_poller(
+    aresponses: ResponsesMockServer,
+    authenticated_notion_api_server: ResponsesMockServer,
+    sensor_listeners_response: dict[str, Any],
+) -> None:
+    """Test polling listeners for changes.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_notion_api_server: A mock authenticated Notion API server
+        sensor_listeners_response: An API response payload
+
+    """
+    first_response = deepcopy(sensor_listeners_response)
+    for idx, listener in enumerate(first_response["listeners"]):
+        listener["id"] = f"listener-{idx}"
+
+    # The first listener changes, the second stays the same, the third is removed, and
+    # a fourth is added:
+    second_response = deepcopy(first_response)
+    second_response["listeners"][0]["insights"]["primary"]["value"] = "active"
+    second_response["listeners"][2]["id"] = "listener-3"
+
+    async with authenticated_notion_api_server:
+        for response in (first_response, second_response, second_response):
+            authenticated_notion_api_server.add(
+                "api.getnotion.com",
+                "/api/sensor/listeners",
+                "get",
+                response=aiohttp.web_response.json_response(response, status=200),
+            )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client_with_credentials(
+                TEST_EMAIL, TEST_PASSWORD, session=session
+            )
+            poller = client.listener.poller(interval=0)
+
+            changes = await anext(aiter(poller))
+            assert [listener.id for listener in changes.added] == [
+                "listener-0",
+                "listener-1",
+                "listener-2",
+            ]
+            assert not changes.changed
+            assert not changes.removed
+
+            changes = await poller.async_poll()
+            assert [listener.id for listener in changes.added] == ["listener-3"]
+            assert [listener.id for listener in changes.changed] == ["listener-0"]
+            assert [listener.id for listener in changes.removed] == ["listener-2"]
+            assert set(poller.listeners) == {"listener-0", "listener-1", "listener-3"}
+            assert {listener.id for listener in poller.index} == set(poller.listeners)
+            assert poller.index.get("listener-0") is changes.changed[0]
+
+            assert not await poller.async_poll()
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_listener_poller_not_modified(
+    aresponses: ResponsesMockServer,
+    authenticated_notion_api_server: ResponsesMockServer,
+    sensor_listeners_response: dict[str, Any],
+) -> None:
+    """Test that iterating a poller skips polls whose response hasn't been modified.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_notion_api_server: A mock authenticated Notion API server
+        sensor_listeners_response: An API response payload
+
+    """
+    first_response = deepcopy(sensor_listeners_response)
+    for idx, listener in enumerate(first_response["listeners"]):
+        listener["id"] = f"listener-{idx}"
+
+    changed_response = deepcopy(first_response)
+    changed_response["listeners"][0]["insights"]["primary"]["value"] = "active"
+
+    async with authenticated_notion_api_server:
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/sensor/listeners",
+            "get",
+            response=aiohttp.web_response.json_response(
+                first_response, headers={"ETag": '"abc123"'}, status=200
+            ),
+        )
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/sensor/listeners",
+            "get",
+            response=aiohttp.web.Response(status=304),
+        )
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/sensor/listeners",
+            "get",
+            response=aiohttp.web_response.json_response(changed_response, status=200),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client_with_credentials(
+                TEST_EMAIL, TEST_PASSWORD, session=session
+            )
+            poller = client.listener.poller(interval=0)
+            changes_iter = aiter(poller)
+
+            changes = await anext(changes_iter)
+            assert len(changes.added) == 3
+
+            # The unmodified (304) poll is skipped; the next change is yielded:
+            changes = await anext(changes_iter)
+            assert not changes.added
+            assert [listener.id for listener in changes.changed] == ["listener-0"]
+            assert not changes.removed
+
+    aresponses.assert_plan_strictly_followed()
+
+
+def test_listener_index(
+    sensor_all_response: dict[str, Any], sensor_listeners_response: dict[str, Any]
+) -> None:
+    """Test indexing listeners.
+
+    Args:
+    ----
+        sensor_all_response: An API response payload
+        sensor_listeners_response: An API response payload
+
+    """
+    listeners = [
+        replace(listener, id=f"listener-{idx}", sensor_id=f"sensor-{idx % 2}")
+        for idx, listener in enumerate(
+            ListenerAllResponse.from_dict(sensor_listeners_response).listeners
+        )
+    ]
+    sensor = SensorAllResponse.from_dict(sensor_all_response).sensors[0]
+
+    index = ListenerIndex(listeners, sensors=[replace(sensor, uuid="sensor-0")])
+    assert len(index) == 3
+    assert "listener-1" in index
+    assert index.get("listener-1") is listeners[1]
+    assert index.get("listener-9") is None
+    assert index.get_by_kind(ListenerKind.TEMPERATURE) == [listeners[1]]
+    assert index.get_for_sensor("sensor-0") == [listeners[0], listeners[2]]
+    assert index.get_for_system(12345) == [listeners[0], listeners[2]]
+    assert index.get_for_system(67890) == []
+
+    # Listeners (and sensors) can be updated incrementally:
+    moved = replace(listeners[2], sensor_id="sensor-1")
+    index.update([moved])
+    index.update_sensors([replace(sensor, uuid="sensor-1", system_id=67890)])
+    assert index.get_for_sensor("sensor-0") == [listeners[0]]
+    assert index.get_for_sensor("sensor-1") == [listeners[1], moved]
+    assert index.get_for_system(67890) == [listeners[1], moved]
+
+    index.remove(["listener-1", "listener-9"])
+    assert len(index) == 2
+    assert index.get_by_kind(ListenerKind.TEMPERATURE) == []
+    assert index.get_for_sensor("sensor-1") == [moved]
+
+    # A sensor can move to another system:
+    index.update_sensors([replace(sensor, uuid="sensor-1", system_id=12345)])
+    assert index.get_for_system(67890) == []
+    assert {listener.id for listener in index.get_for_system(12345)} == {
+        "listener-0",
+        "listener-2",
+    }
+
+    # Removing a sensor's last listener removes the sensor from the index:
+    index.remove([moved.id])
+    assert index.get_for_sensor("sensor-1") == []
+    assert index.get_for_system(12345) == [listeners[0]]
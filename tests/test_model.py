@@ -0,0 +1,102 @@
+"""Define tests for models."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import pickle
+from typing import Any, cast
+from unittest.mock import patch
+
+from mashumaro import DataClassDictMixin, field_options
+import pytest
+
+from aionotion.bridge.models import BridgeAllResponse
+from aionotion.listener.models import ListenerAllResponse
+from aionotion.model import NotionBaseModel
+from aionotion.sensor.models import SensorAllResponse
+from aionotion.util.decode import get_model_decoder
+
+
+@dataclass(frozen=True, kw_only=True)
+class AliasedModel(NotionBaseModel):
+    """Define a model with an aliased field."""
+
+    value: int = field(metadata=field_options(alias="val"))
+
+
+@dataclass(frozen=True, kw_only=True)
+class ParentModel(NotionBaseModel):
+    """Define a model with an optional nested model and a default factory."""
+
+    child: AliasedModel | None = None
+    tags: list[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True, kw_only=True)
+class UnresolvableModel:
+    """Define a dataclass with an annotation that can't be resolved."""
+
+    value: UndefinedType  # type: ignore[name-defined]  # noqa: F821
+
+
+@pytest.mark.parametrize(
+    ("model", "payload_fixture", "objects_key"),
+    [
+        (BridgeAllResponse, "bridge_all_response", "base_stations"),
+        (ListenerAllResponse, "sensor_listeners_response", "listeners"),
+        (SensorAllResponse, "sensor_all_response", "sensors"),
+    ],
+)
+def test_slotted_models(
+    model: type[NotionBaseModel],
+    objects_key: str,
+    payload_fixture: str,
+    request: pytest.FixtureRequest,
+) -> None:
+    """Test that high-volume models (and the models nested within them) are slotted.
+
+    Args:
+    ----
+        model: The response model to validate the payload with
+        objects_key: The key of the list of objects in the response
+        payload_fixture: The name of the fixture with the API response payload
+        request: A pytest request object
+
+    """
+    payload: dict[str, Any] = request.getfixturevalue(payload_fixture)
+    response = model.from_dict(payload)
+    obj = getattr(response, objects_key)[0]
+
+    assert not hasattr(obj, "__dict__")
+    for name in vars(type(obj))["__slots__"]:
+        nested = getattr(obj, name)
+        if isinstance(nested, NotionBaseModel):
+            assert not hasattr(nested, "__dict__")
+
+    assert pickle.loads(pickle.dumps(obj)) == obj  # noqa: S301
+    assert type(obj).from_dict(payload[objects_key][0]) == obj
+
+
+def test_model_decoder() -> None:
+    """Test decoding JSON straight into a model with optional and defaulted fields."""
+    pytest.importorskip("msgspec")
+
+    decoder = get_model_decoder(ParentModel)
+    assert decoder is not None
+    assert decoder(b'{"child": {"val": 1}}') == ParentModel(child=AliasedModel(value=1))
+    assert decoder(b'{"child": null, "tags": ["a"]}') == ParentModel(tags=["a"])
+    assert decoder(b"{}") == ParentModel()
+
+
+def test_model_decoder_unavailable() -> None:
+    """Test that no model decoder is returned when msgspec can't be used."""
+    pytest.importorskip("msgspec")
+
+    # A model whose annotations can't be resolved isn't decoded directly:
+    model = cast(type[DataClassDictMixin], UnresolvableModel)
+    assert get_model_decoder(model) is None
+    assert get_model_decoder(model) is None
+
+    # Nor is any model when msgspec isn't installed:
+    with patch.dict("sys.modules", {"msgspec": None}):
+        assert get_model_decoder(AliasedModel) is None
@@ -0,0 +1,158 @@
+"""Define tests for client pools."""
+
+# pylint: disable=protected-access
+from __future__ import annotations
+
+from typing import Any
+
+import aiohttp
+from aresponses import ResponsesMockServer
+import pytest
+
+from aionotion.pool import ClientPool
+from aionotion.retry import RetryPolicy
+from aionotion.testing import FakeNotionServer
+from tests.common import TEST_EMAIL, TEST_PASSWORD, TEST_REFRESH_TOKEN, TEST_USER_UUID
+
+TEST_OTHER_USER_UUID = "yyyyyyyy-yyyy-yyyy-yyyy-yyyyyyyyyyyy"
+
+
+@pytest.mark.asyncio
+async def test_pool(
+    aresponses: ResponsesMockServer,
+    authenticated_notion_api_server: ResponsesMockServer,
+    auth_refresh_token_success_response: dict[str, Any],
+    bridge_all_response: dict[str, Any],
+) -> None:
+    """Test that clients in a pool share resources but not credentials.
+
+    Args:
+    ----
+        aresponses: An aresponses server
+        authenticated_notion_api_server: A mock authenticated Notion API server
+        auth_refresh_token_success_response: An API response payload
+        bridge_all_response: An API response payload
+
+    """
+    async with authenticated_notion_api_server:
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            f"/api/auth/{TEST_OTHER_USER_UUID}/refresh",
+            "post",
+            response=aiohttp.web_response.json_response(
+                auth_refresh_token_success_response, status=200
+            ),
+        )
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/base_stations",
+            "get",
+            response=aiohttp.web_response.json_response(
+                bridge_all_response, status=200
+            ),
+        )
+
+        async with ClientPool(max_concurrent_requests=5) as pool:
+            client = await pool.async_add_client_with_credentials(
+                TEST_EMAIL, TEST_PASSWORD
+            )
+            other_client = await pool.async_add_client_with_refresh_token(
+                TEST_OTHER_USER_UUID, TEST_REFRESH_TOKEN
+            )
+
+            assert len(pool) == 2
+            assert TEST_USER_UUID in pool
+            assert pool[TEST_OTHER_USER_UUID] is other_client
+            assert list(pool) == [client, other_client]
+
+            assert client._get_session() is other_client._get_session()
+            assert client._request_limiter is other_client._request_limiter
+            assert client._refresh_scheduler is other_client._refresh_scheduler
+            assert client._access_token != other_client._access_token
+
+            # Both clients are scheduled for a background refresh:
+            scheduler = pool._refresh_scheduler
+            assert scheduler is not None
+            assert set(scheduler._handles) == {client, other_client}
+
+            bridges = await other_client.bridge.async_all()
+            assert len(bridges) == 1
+
+            await pool.async_remove_client(TEST_OTHER_USER_UUID)
+            assert TEST_OTHER_USER_UUID not in pool
+            assert set(scheduler._handles) == {client}
+
+            session = client._get_session()
+
+        assert session.closed
+        assert not scheduler._handles
+        assert len(pool) == 0
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_pool_explicit_session(
+    aresponses: ResponsesMockServer,
+    authenticated_notion_api_server: ResponsesMockServer,
+    auth_credentials_success_response: dict[str, Any],
+) -> None:
+    """Test a pool that uses a caller-provided session (and replaces clients).
+
+    Args:
+    ----
+        aresponses: An aresponses server
+        authenticated_notion_api_server: A mock authenticated Notion API server
+        auth_credentials_success_response: An API response payload
+
+    """
+    async with authenticated_notion_api_server:
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/auth/login",
+            "post",
+            response=aiohttp.web_response.json_response(
+                auth_credentials_success_response, status=200
+            ),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            async with ClientPool(session=session, background_refresh=False) as pool:
+                client = await pool.async_add_client_with_credentials(
+                    TEST_EMAIL, TEST_PASSWORD
+                )
+                assert client._get_session() is session
+                assert client._refresh_scheduler is None
+
+                # Adding the same account again replaces its client:
+                new_client = await pool.async_add_client_with_credentials(
+                    TEST_EMAIL, TEST_PASSWORD
+                )
+                assert len(pool) == 1
+                assert pool[TEST_USER_UUID] is new_client
+
+            assert not session.closed
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_pool_client_kwargs() -> None:
+    """Test that a pool creates every client with the provided client arguments."""
+    retry_policy = RetryPolicy(backoff=0)
+
+    async with (
+        FakeNotionServer() as server,
+        ClientPool(api_base=server.api_base, retry_policy=retry_policy) as pool,
+    ):
+        client = await pool.async_add_client_with_credentials(
+            server.account.email, server.account.password
+        )
+        assert client._retry_policy is retry_policy
+        assert len(await client.system.async_all()) == len(server.account.systems)
+
+
+def test_pool_managed_client_kwargs() -> None:
+    """Test that client arguments that the pool sets itself are rejected."""
+    with pytest.raises(TypeError, match="request_limiter, session_name"):
+        ClientPool(session_name="session", request_limiter=None)
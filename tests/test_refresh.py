@@ -0,0 +1,266 @@
+"""Define tests for background access token refreshing."""
+
+# pylint: disable=protected-access
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from time import time
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+
+import aiohttp
+from aresponses import ResponsesMockServer
+import pytest
+
+from aionotion.client import Client
+from aionotion.errors import InvalidCredentialsError
+from aionotion.refresh import RefreshResult, TokenRefreshScheduler
+from aionotion.util.dt import utcnow
+
+from .common import TEST_EMAIL, TEST_PASSWORD, TEST_USER_UUID, generate_jwt
+
+
+@pytest.mark.asyncio
+async def test_background_refresh(
+    aresponses: ResponsesMockServer,
+    auth_credentials_success_response: dict[str, Any],
+    auth_refresh_token_success_response: dict[str, Any],
+) -> None:
+    """Test that an expiring access token is refreshed in the background.
+
+    Args:
+    ----
+        aresponses: An aresponses server
+        auth_credentials_success_response: An API response payload
+        auth_refresh_token_success_response: An API response payload
+
+    """
+    # Log in with an access token that is already within the refresh margin, then
+    # refresh into one that isn't:
+    auth_credentials_success_response["auth"]["jwt"] = generate_jwt(time() - 15 * 60)
+    auth_refresh_token_success_response["auth"]["jwt"] = generate_jwt(time())
+
+    aresponses.add(
+        "api.getnotion.com",
+        "/api/auth/login",
+        "post",
+        response=aiohttp.web_response.json_response(
+            auth_credentials_success_response, status=200
+        ),
+    )
+    aresponses.add(
+        "api.getnotion.com",
+        f"/api/auth/{TEST_USER_UUID}/refresh",
+        "post",
+        response=aiohttp.web_response.json_response(
+            auth_refresh_token_success_response, status=200
+        ),
+    )
+
+    results: list[RefreshResult] = []
+    refreshed = asyncio.Event()
+
+    def on_refresh(result: RefreshResult) -> None:
+        """Record a refresh result.
+
+        Args:
+        ----
+            result: The result of the refresh.
+
+        """
+        results.append(result)
+        refreshed.set()
+
+    async with Client(background_refresh=True) as client:
+        remove_callback = client.add_refresh_result_callback(on_refresh)
+        await client.async_authenticate_from_credentials(TEST_EMAIL, TEST_PASSWORD)
+        old_access_token = client._access_token
+
+        await asyncio.wait_for(refreshed.wait(), 5)
+        assert client._access_token != old_access_token
+        assert len(results) == 1
+        assert results[0].success
+        assert results[0].latency >= 0
+
+        # The next refresh has been scheduled for well into the future:
+        assert client._refresh_scheduler is not None
+        assert client in client._refresh_scheduler._handles
+
+        remove_callback()
+        assert not client._refresh_result_callbacks
+
+    assert not client._refresh_scheduler._handles
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_failure(
+    aresponses: ResponsesMockServer, auth_credentials_success_response: dict[str, Any]
+) -> None:
+    """Test that a failed background refresh is reported and retried.
+
+    Args:
+    ----
+        aresponses: An aresponses server
+        auth_credentials_success_response: An API response payload
+
+    """
+    auth_credentials_success_response["auth"]["jwt"] = generate_jwt(time() - 15 * 60)
+
+    aresponses.add(
+        "api.getnotion.com",
+        "/api/auth/login",
+        "post",
+        response=aiohttp.web_response.json_response(
+            auth_credentials_success_response, status=200
+        ),
+    )
+    aresponses.add(
+        "api.getnotion.com",
+        f"/api/auth/{TEST_USER_UUID}/refresh",
+        "post",
+        response=aresponses.Response(text="Unavailable", status=503),
+    )
+
+    results: list[RefreshResult] = []
+    refreshed = asyncio.Event()
+
+    def on_refresh(result: RefreshResult) -> None:
+        """Record a refresh result.
+
+        Args:
+        ----
+            result: The result of the refresh.
+
+        """
+        results.append(result)
+        refreshed.set()
+
+    scheduler = TokenRefreshScheduler(jitter=0, retry_interval=60)
+    async with Client(refresh_scheduler=scheduler) as client:
+        client.add_refresh_result_callback(on_refresh)
+        await client.async_authenticate_from_credentials(TEST_EMAIL, TEST_PASSWORD)
+
+        await asyncio.wait_for(refreshed.wait(), 5)
+        # Let the scheduler process the failure:
+        await asyncio.sleep(0)
+        assert len(results) == 1
+        assert not results[0].success
+
+        # A retry is pending:
+        assert client in scheduler._handles
+
+    # Closing the client unschedules it, but leaves the shared scheduler alone:
+    assert client not in scheduler._handles
+    await scheduler.async_close()
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_invalid_credentials(
+    aresponses: ResponsesMockServer,
+    auth_credentials_success_response: dict[str, Any],
+    auth_failure_response: dict[str, Any],
+) -> None:
+    """Test that a background refresh with a rejected refresh token isn't retried.
+
+    Args:
+    ----
+        aresponses: An aresponses server
+        auth_credentials_success_response: An API response payload
+        auth_failure_response: An API response payload
+
+    """
+    auth_credentials_success_response["auth"]["jwt"] = generate_jwt(time() - 15 * 60)
+
+    aresponses.add(
+        "api.getnotion.com",
+        "/api/auth/login",
+        "post",
+        response=aiohttp.web_response.json_response(
+            auth_credentials_success_response, status=200
+        ),
+    )
+    aresponses.add(
+        "api.getnotion.com",
+        f"/api/auth/{TEST_USER_UUID}/refresh",
+        "post",
+        response=aiohttp.web_response.json_response(auth_failure_response, status=401),
+    )
+
+    results: list[RefreshResult] = []
+    refreshed = asyncio.Event()
+
+    def on_refresh(result: RefreshResult) -> None:
+        """Record a refresh result.
+
+        Args:
+        ----
+            result: The result of the refresh.
+
+        """
+        results.append(result)
+        refreshed.set()
+
+    scheduler = TokenRefreshScheduler(jitter=0, retry_interval=60)
+    async with Client(refresh_scheduler=scheduler) as client:
+        client.add_refresh_result_callback(on_refresh)
+        await client.async_authenticate_from_credentials(TEST_EMAIL, TEST_PASSWORD)
+
+        await asyncio.wait_for(refreshed.wait(), 5)
+        # Let the scheduler process the failure:
+        await asyncio.sleep(0)
+        assert len(results) == 1
+        assert isinstance(results[0].error, InvalidCredentialsError)
+
+        # Nothing is retried (or left running):
+        assert client not in scheduler._handles
+        assert client not in scheduler._tasks
+
+    await scheduler.async_close()
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_scheduler() -> None:
+    """Test scheduling, retrying, and closing background refreshes."""
+    scheduler = TokenRefreshScheduler(jitter=0, retry_interval=60)
+
+    # A client without an expiring access token isn't scheduled:
+    client = Mock(_access_token_expires_at=None)
+    scheduler.schedule(client)
+    assert client not in scheduler._handles
+
+    # Rescheduling a client replaces its pending refresh:
+    client._access_token_expires_at = utcnow() + timedelta(hours=1)
+    client._refresh_margin = timedelta(minutes=5)
+    scheduler.schedule(client)
+    handle = scheduler._handles[client]
+    scheduler.schedule(client)
+    assert handle.cancelled()
+    assert scheduler._handles[client] is not handle
+
+    # An unexpected error is retried (rather than ending the refreshes):
+    failing_client = Mock(
+        _async_refresh_access_token=AsyncMock(side_effect=KeyError("jwt"))
+    )
+    scheduler._start_refresh(failing_client)
+    await scheduler._tasks[failing_client]
+    assert failing_client in scheduler._handles
+
+    # Closing the scheduler cancels pending refreshes and in-flight ones:
+    stuck_client = Mock(
+        _async_refresh_access_token=AsyncMock(side_effect=asyncio.Event().wait)
+    )
+    scheduler._start_refresh(stuck_client)
+    stuck_task = scheduler._tasks[stuck_client]
+    await asyncio.sleep(0)
+
+    await scheduler.async_close()
+    assert not scheduler._handles
+    assert not scheduler._tasks
+    assert stuck_task.cancelled()
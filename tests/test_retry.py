@@ -0,0 +1,192 @@
+"""Define tests for retrying failed requests."""
+
+from __future__ import annotations
+
+from time import time
+from typing import Any
+
+import aiohttp
+from aresponses import ResponsesMockServer
+import pytest
+
+from aionotion.client import Client
+from aionotion.errors import RateLimitError, RequestError, ServerError
+from aionotion.metrics import RequestMetrics
+from aionotion.retry import RetryPolicy
+
+from .common import TEST_EMAIL, TEST_PASSWORD, TEST_USER_UUID
+
+
+def test_retry_policy_delay() -> None:
+    """Test the delays between retries."""
+    policy = RetryPolicy(max_attempts=4, backoff=1, max_backoff=3, deadline=10)
+    error = ServerError("Server error")
+
+    for attempt, max_delay in ((1, 1), (2, 2), (3, 3)):
+        delay = policy.get_delay("get", attempt, 0, error)
+        assert delay is not None
+        assert 0 <= delay <= max_delay
+
+    # A rate-limited request waits for at least as long as the API asks:
+    assert policy.get_delay("get", 1, 0, RateLimitError("", retry_after=5)) == 5
+
+    # Requests aren't retried once they run out of attempts or time, or when the error
+    # isn't transient or the method isn't idempotent:
+    assert policy.get_delay("get", 4, 0, error) is None
+    assert policy.get_delay("get", 1, 0, RateLimitError("", retry_after=11)) is None
+    assert policy.get_delay("get", 1, 0, RequestError("Bad request")) is None
+    assert policy.get_delay("post", 1, 0, error) is None
+
+
+@pytest.mark.asyncio
+async def test_retry(
+    aresponses: ResponsesMockServer,
+    authenticated_notion_api_server: ResponsesMockServer,
+    bridge_all_response: dict[str, Any],
+    sensor_all_response: dict[str, Any],
+) -> None:
+    """Test that transient failures of GET requests are retried.
+
+    Args:
+    ----
+        aresponses: An aresponses server
+        authenticated_notion_api_server: A mock authenticated Notion API server
+        bridge_all_response: An API response payload
+        sensor_all_response: An API response payload
+
+    """
+    async with authenticated_notion_api_server, aiohttp.ClientSession() as session:
+        for path, payload in (
+            ("/api/base_stations", bridge_all_response),
+            ("/api/sensors", sensor_all_response),
+        ):
+            authenticated_notion_api_server.add(
+                "api.getnotion.com",
+                path,
+                "get",
+                response=aresponses.Response(text="Unavailable", status=503),
+            )
+            authenticated_notion_api_server.add(
+                "api.getnotion.com",
+                path,
+                "get",
+                response=aresponses.Response(status=429, headers={"Retry-After": "0"}),
+            )
+            authenticated_notion_api_server.add(
+                "api.getnotion.com",
+                path,
+                "get",
+                response=aiohttp.web_response.json_response(payload, status=200),
+            )
+
+        client = Client(session=session, retry_policy=RetryPolicy(backoff=0))
+        metrics: list[RequestMetrics] = []
+        client.add_request_metrics_callback(metrics.append)
+        await client.async_authenticate_from_credentials(TEST_EMAIL, TEST_PASSWORD)
+
+        bridges = await client.bridge.async_all()
+        assert bridges[0].id == 12345
+        sensors = [sensor async for sensor in client.sensor.async_iter_all()]
+        assert sensors[0].id == 123456
+
+    assert [(m.endpoint, m.status, m.attempts) for m in metrics] == [
+        ("/auth/login", 200, 1),
+        ("/base_stations", 200, 3),
+        ("/sensors", 200, 3),
+    ]
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("access_token_issued_at", [time() - 30 * 60])
+async def test_retry_failed_refresh(
+    aresponses: ResponsesMockServer, auth_credentials_success_response: dict[str, Any]
+) -> None:
+    """Test that a failed token refresh isn't re-sent when a request is retried.
+
+    Args:
+    ----
+        aresponses: An aresponses server
+        auth_credentials_success_response: An API response payload
+
+    """
+    async with aiohttp.ClientSession() as session:
+        aresponses.add(
+            "api.getnotion.com",
+            "/api/auth/login",
+            "post",
+            response=aiohttp.web_response.json_response(
+                auth_credentials_success_response, status=200
+            ),
+        )
+        aresponses.add(
+            "api.getnotion.com",
+            f"/api/auth/{TEST_USER_UUID}/refresh",
+            "post",
+            response=aresponses.Response(text="Unavailable", status=503),
+        )
+
+        client = Client(session=session, retry_policy=RetryPolicy(backoff=0))
+        metrics: list[RequestMetrics] = []
+        client.add_request_metrics_callback(metrics.append)
+        await client.async_authenticate_from_credentials(TEST_EMAIL, TEST_PASSWORD)
+
+        with pytest.raises(ServerError):
+            await client.bridge.async_all()
+
+    assert [(m.endpoint, m.attempts) for m in metrics] == [
+        ("/auth/login", 1),
+        (f"/auth/{TEST_USER_UUID}/refresh", 1),
+        # The request itself was never attempted:
+        ("/base_stations", 0),
+    ]
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "retry_policy", [None, RetryPolicy(backoff=0, methods=frozenset({"get", "post"}))]
+)
+async def test_retry_not_attempted(
+    aresponses: ResponsesMockServer, retry_policy: RetryPolicy | None
+) -> None:
+    """Test that requests aren't retried without a policy (or for authentication).
+
+    Args:
+    ----
+        aresponses: An aresponses server
+        retry_policy: A retry policy
+
+    """
+    async with aiohttp.ClientSession() as session:
+        aresponses.add(
+            "api.getnotion.com",
+            "/api/auth/login",
+            "post",
+            response=aresponses.Response(text="Unavailable", status=503),
+        )
+
+        client = Client(session=session, retry_policy=retry_policy)
+        with pytest.raises(ServerError):
+            await client.async_authenticate_from_credentials(TEST_EMAIL, TEST_PASSWORD)
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_retry_connection_error() -> None:
+    """Test that connection errors are retried until the policy gives up."""
+    metrics: list[RequestMetrics] = []
+
+    async with Client(
+        api_base="http://127.0.0.1:1/api",
+        retry_policy=RetryPolicy(max_attempts=2, backoff=0),
+    ) as client:
+        client.add_request_metrics_callback(metrics.append)
+        with pytest.raises(aiohttp.ClientConnectionError):
+            await client.async_request("get", "/systems")
+
+    assert metrics[0].attempts == 2
+    assert isinstance(metrics[0].error, aiohttp.ClientConnectionError)
@@ -0,0 +1,122 @@
+"""Define tests for the poll scheduler."""
+
+# pylint: disable=protected-access
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import aiohttp
+import pytest
+
+from aionotion.errors import RateLimitError, RequestError
+from aionotion.scheduler import PollScheduler, PollTarget
+
+
+@pytest.mark.asyncio
+async def test_adaptive_interval() -> None:
+    """Test that poll intervals adapt to changes, failures, and rate limiting."""
+    client = Mock()
+    client.sensor.async_all = AsyncMock(
+        side_effect=[
+            ["a"],
+            ["a"],
+            ["a"],
+            RequestError("Something went wrong"),
+            RequestError("Something went wrong"),
+            RateLimitError("Slow down", retry_after=42),
+            RateLimitError("Slow down"),
+            ["b"],
+        ]
+    )
+    callback = Mock()
+
+    scheduler = PollScheduler(
+        min_interval=10, max_interval=100, max_backoff=150, jitter=0
+    )
+    scheduler.add(client, PollTarget.SENSORS, callback, interval=40)
+    job = scheduler._jobs[0]
+
+    # New data shortens the interval; unchanged data lengthens it (up to the max):
+    assert await scheduler._async_poll_job(job) == 20
+    callback.assert_called_once_with(["a"])
+    assert await scheduler._async_poll_job(job) == 30
+    assert await scheduler._async_poll_job(job) == 45
+
+    # Failures back off exponentially (up to the max backoff):
+    assert await scheduler._async_poll_job(job) == 45
+    assert await scheduler._async_poll_job(job) == 90
+
+    # Rate limiting honors Retry-After when the API provides it:
+    assert await scheduler._async_poll_job(job) == 42
+    assert await scheduler._async_poll_job(job) == 150
+
+    # A success resets the failure count:
+    assert await scheduler._async_poll_job(job) == 22.5
+    assert job.failures == 0
+    assert callback.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_poll_errors(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that transport and callback errors don't stop a job.
+
+    Args:
+    ----
+        caplog: A logging capture fixture.
+
+    """
+    client = Mock()
+    client.sensor.async_all = AsyncMock(
+        side_effect=[
+            aiohttp.ClientConnectionError("Connection reset"),
+            TimeoutError(),
+            ["a"],
+            ["b"],
+        ]
+    )
+    callback = Mock(side_effect=ValueError("Bad callback"))
+
+    scheduler = PollScheduler(min_interval=10, max_backoff=150, jitter=0)
+    scheduler.add(client, PollTarget.SENSORS, callback, interval=40)
+    job = scheduler._jobs[0]
+
+    # Connection errors and timeouts back off like any other failure:
+    assert await scheduler._async_poll_job(job) == 40
+    assert await scheduler._async_poll_job(job) == 80
+    assert job.failures == 2
+
+    # A callback that raises is logged and the job keeps going:
+    assert await scheduler._async_poll_job(job) == 20
+    assert await scheduler._async_poll_job(job) == 10
+    assert callback.call_count == 2
+    assert "Error in callback for sensor" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_start_and_stop() -> None:
+    """Test running the scheduler in the background."""
+    client = Mock()
+    client.bridge.async_all = AsyncMock(return_value=["a"])
+    polled = asyncio.Event()
+
+    scheduler = PollScheduler(min_interval=0, jitter=0)
+    remove = scheduler.add(
+        client, PollTarget.BRIDGES, lambda _: polled.set(), interval=0
+    )
+    scheduler.start()
+    scheduler.start()
+    await asyncio.wait_for(polled.wait(), 1)
+
+    # Jobs added while the scheduler is running start right away:
+    client.listener.async_all = AsyncMock(return_value=["b"])
+    listener_callback = Mock()
+    scheduler.add(client, PollTarget.LISTENERS, listener_callback, interval=0)
+    await asyncio.sleep(0.01)
+    listener_callback.assert_called_once_with(["b"])
+
+    remove()
+    assert len(scheduler._jobs) == 1
+
+    await scheduler.async_stop()
+    assert all(job.task is None for job in scheduler._jobs)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+import json
 from typing import Any
 
 import aiohttp
@@ -10,6 +11,8 @@ from aresponses import ResponsesMockServer
 import pytest
 
 from aionotion import async_get_client_with_credentials
+from aionotion.errors import RequestError
+from aionotion.sensor.models import Sensor
 from tests.common import TEST_EMAIL, TEST_PASSWORD
 
 
@@ -85,6 +88,69 @@ async def test_sensor_all(
     aresponses.assert_plan_strictly_followed()
 
 
+@pytest.mark.asyncio
+async def test_sensor_iter_all(
+    aresponses: ResponsesMockServer,
+    authenticated_notion_api_server: ResponsesMockServer,
+    bad_api_response: dict[str, Any],
+    sensor_all_response: dict[str, Any],
+) -> None:
+    """Test iterating over all sensors as they're received.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_notion_api_server: A mock authenticated Notion API server
+        bad_api_response: An API response payload
+        sensor_all_response: An API response payload
+
+    """
+    body = json.dumps(sensor_all_response)
+    async with authenticated_notion_api_server:
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/sensors",
+            "get",
+            response=aresponses.Response(
+                text=body, status=200, content_type="application/json"
+            ),
+        )
+        # A response that's cut off partway through the array:
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/sensors",
+            "get",
+            response=aresponses.Response(
+                text=body[: len(body) // 2],
+                status=200,
+                content_type="application/json",
+            ),
+        )
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/sensors",
+            "get",
+            response=aiohttp.web_response.json_response(bad_api_response, status=404),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client_with_credentials(
+                TEST_EMAIL, TEST_PASSWORD, session=session
+            )
+            sensors = [sensor async for sensor in client.sensor.async_iter_all()]
+            assert len(sensors) == 1
+            assert sensors[0].id == 123456
+            assert sensors[0].uuid == "xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx"
+
+            with pytest.raises(RequestError):
+                _ = [sensor async for sensor in client.sensor.async_iter_all()]
+
+            with pytest.raises(RequestError):
+                _ = [sensor async for sensor in client.sensor.async_iter_all()]
+
+    aresponses.assert_plan_strictly_followed()
+
+
 @pytest.mark.asyncio
 async def test_sensor_get(
     aresponses: ResponsesMockServer,
@@ -153,3 +219,49 @@ async def test_sensor_get(
             assert sensor.surface_type is None
 
     aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_sensor_get_many(
+    aresponses: ResponsesMockServer,
+    authenticated_notion_api_server: ResponsesMockServer,
+    bad_api_response: dict[str, Any],
+    sensor_get_response: dict[str, Any],
+) -> None:
+    """Test getting multiple sensors by ID.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_notion_api_server: A mock authenticated Notion API server
+        bad_api_response: An API response payload
+        sensor_get_response: An API response payload
+
+    """
+    async with authenticated_notion_api_server:
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/sensors/123456",
+            "get",
+            response=aiohttp.web_response.json_response(
+                sensor_get_response, status=200
+            ),
+        )
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/sensors/98765",
+            "get",
+            response=aiohttp.web_response.json_response(bad_api_response, status=404),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client_with_credentials(
+                TEST_EMAIL, TEST_PASSWORD, session=session
+            )
+            sensors = await client.sensor.async_get_many([98765, 123456], concurrency=1)
+            assert len(sensors) == 2
+            assert isinstance(sensors[0], RequestError)
+            assert isinstance(sensors[1], Sensor)
+            assert sensors[1].id == 123456
+
+    aresponses.assert_plan_strictly_followed()
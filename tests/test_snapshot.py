@@ -0,0 +1,127 @@
+"""Define tests for account snapshots."""
+
+from __future__ import annotations
+
+from dataclasses import FrozenInstanceError
+from typing import Any
+
+import aiohttp
+from aresponses import ResponsesMockServer
+import pytest
+
+from aionotion import async_get_client_with_credentials
+from aionotion.errors import RequestError
+from tests.common import TEST_EMAIL, TEST_PASSWORD, TEST_USER_UUID
+
+
+@pytest.mark.asyncio
+async def test_snapshot(
+    aresponses: ResponsesMockServer,
+    authenticated_notion_api_server: ResponsesMockServer,
+    bridge_all_response: dict[str, Any],
+    listener_definitions_response: dict[str, Any],
+    sensor_all_response: dict[str, Any],
+    sensor_listeners_response: dict[str, Any],
+    system_all_response: dict[str, Any],
+    user_info_response: dict[str, Any],
+    user_preferences_response: dict[str, Any],
+) -> None:
+    """Test getting a snapshot of the entire account.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_notion_api_server: A mock authenticated Notion API server
+        bridge_all_response: An API response payload
+        listener_definitions_response: An API response payload
+        sensor_all_response: An API response payload
+        sensor_listeners_response: An API response payload
+        system_all_response: An API response payload
+        user_info_response: An API response payload
+        user_preferences_response: An API response payload
+
+    """
+    async with authenticated_notion_api_server:
+        for path, response in (
+            ("/api/base_stations", bridge_all_response),
+            ("/api/listener_definitions", listener_definitions_response),
+            ("/api/sensors", sensor_all_response),
+            ("/api/sensor/listeners", sensor_listeners_response),
+            ("/api/systems", system_all_response),
+            (f"/api/users/{TEST_USER_UUID}", user_info_response),
+            (
+                f"/api/users/{TEST_USER_UUID}/user_preferences",
+                user_preferences_response,
+            ),
+        ):
+            authenticated_notion_api_server.add(
+                "api.getnotion.com",
+                path,
+                "get",
+                response=aiohttp.web_response.json_response(response, status=200),
+            )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client_with_credentials(
+                TEST_EMAIL, TEST_PASSWORD, session=session
+            )
+            snapshot = await client.async_snapshot()
+
+            assert len(snapshot.bridges) == 1
+            assert len(snapshot.sensors) == 1
+            assert len(snapshot.listeners) == 3
+            assert len(snapshot.listener_definitions) == 20
+            assert len(snapshot.systems) == 1
+            assert snapshot.user.uuid == TEST_USER_UUID
+            assert snapshot.user_preferences.celsius_enabled is False
+
+            sensor = snapshot.sensors_by_id[123456]
+            listener = snapshot.listeners[1]
+            assert snapshot.get_sensor_for_listener(listener) is sensor
+            assert snapshot.get_system_for_sensor(sensor) is snapshot.systems[0]
+            assert snapshot.get_bridge_for_sensor(sensor) is None
+            definition = snapshot.get_definition_for_listener(listener)
+            assert definition is not None
+            assert definition.id == listener.definition_id
+
+            assert snapshot.graph is snapshot.graph
+            assert snapshot.graph.get_sensor_for_listener(listener) is not None
+            assert snapshot.graph.get_listeners_for_system(12345) == list(
+                snapshot.listeners
+            )
+
+            with pytest.raises(FrozenInstanceError):
+                snapshot.sensors = ()  # type: ignore[misc]
+            with pytest.raises(TypeError):
+                snapshot.sensors_by_id[0] = sensor  # type: ignore[index]
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_error(
+    authenticated_notion_api_server: ResponsesMockServer,
+    bad_api_response: dict[str, Any],
+) -> None:
+    """Test that a failed request fails the entire snapshot.
+
+    Args:
+    ----
+        authenticated_notion_api_server: A mock authenticated Notion API server
+        bad_api_response: An API response payload
+
+    """
+    async with authenticated_notion_api_server:
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/base_stations",
+            "get",
+            response=aiohttp.web_response.json_response(bad_api_response, status=400),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client_with_credentials(
+                TEST_EMAIL, TEST_PASSWORD, session=session
+            )
+            with pytest.raises(RequestError):
+                await client.async_snapshot()
@@ -0,0 +1,76 @@
+"""Define tests for incrementally parsing streamed JSON."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+
+from aionotion.util.stream import JSONArrayStream
+
+TRICKY_PAYLOAD = {
+    "meta": {"sensors": [1, 2]},
+    "note": '"sensors": [9]',
+    "sensors": [
+        {"name": 'Escaped \\" quote ]}, and "brackets" [{', "nested": [1, {"a": []}]},
+        "Ünïcode",
+        3,
+        [],
+        {},
+        None,
+    ],
+    "after": [5],
+}
+
+
+def _parse(raw: bytes, key: str, chunk_size: int) -> list[Any]:
+    """Parse a streamed array in chunks of a given size.
+
+    Args:
+    ----
+        raw: The raw JSON document.
+        key: The top-level key of the array.
+        chunk_size: The size of each chunk.
+
+    Returns:
+    -------
+        The decoded elements of the array.
+
+    """
+    stream = JSONArrayStream(key)
+    elements = []
+    for i in range(0, len(raw), chunk_size):
+        elements.extend(stream.feed(raw[i : i + chunk_size]))
+    stream.close()
+    return [json.loads(element) for element in elements]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1024])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_json_array_stream(chunk_size: int, indent: int | None) -> None:
+    """Test that an array is parsed identically regardless of how it's chunked.
+
+    Args:
+    ----
+        chunk_size: The size of each chunk.
+        indent: The indentation of the JSON document.
+
+    """
+    raw = json.dumps(TRICKY_PAYLOAD, ensure_ascii=False, indent=indent).encode()
+    assert _parse(raw, "sensors", chunk_size) == TRICKY_PAYLOAD["sensors"]
+    assert _parse(b'{"sensors": []}', "sensors", chunk_size) == []
+
+
+def test_json_array_stream_incomplete() -> None:
+    """Test that a stream that ends before the array does is rejected."""
+    stream = JSONArrayStream("sensors")
+    assert stream.feed(b'{"sensors": [1, 2') == [b"1"]
+    with pytest.raises(ValueError, match="Stream ended"):
+        stream.close()
+
+    stream = JSONArrayStream("sensors")
+    assert stream.feed(b'{"listeners": [1, 2]}') == []
+    assert not stream.done
+    with pytest.raises(ValueError, match="Stream ended"):
+        stream.close()
@@ -9,6 +9,8 @@ from aresponses import ResponsesMockServer
 import pytest
 
 from aionotion import async_get_client_with_credentials
+from aionotion.errors import RequestError
+from aionotion.system.models import System
 
 from .common import TEST_EMAIL, TEST_PASSWORD
 
@@ -136,3 +138,49 @@ async def test_system_get(
             assert system.notion_pro_permit is None
 
     aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_system_get_many(
+    aresponses: ResponsesMockServer,
+    authenticated_notion_api_server: ResponsesMockServer,
+    bad_api_response: dict[str, str],
+    system_get_response: dict[str, str],
+) -> None:
+    """Test getting multiple systems by ID.
+
+    Args:
+    ----
+        aresponses: An aresponses server.
+        authenticated_notion_api_server: A mock authenticated Notion API server
+        bad_api_response: An API response payload
+        system_get_response: An API response payload
+
+    """
+    async with authenticated_notion_api_server:
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/systems/12345",
+            "get",
+            response=aiohttp.web_response.json_response(
+                system_get_response, status=200
+            ),
+        )
+        authenticated_notion_api_server.add(
+            "api.getnotion.com",
+            "/api/systems/98765",
+            "get",
+            response=aiohttp.web_response.json_response(bad_api_response, status=404),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = await async_get_client_with_credentials(
+                TEST_EMAIL, TEST_PASSWORD, session=session
+            )
+            systems = await client.system.async_get_many([98765, 12345], concurrency=1)
+            assert len(systems) == 2
+            assert isinstance(systems[0], RequestError)
+            assert isinstance(systems[1], System)
+            assert systems[1].id == 12345
+
+    aresponses.assert_plan_strictly_followed()